@@ -0,0 +1,80 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Micro-benchmark for attribute access through hebi.runtime.attrs.
+
+Compares plain dict indexing, the original pure-Python proxy design
+(reproduced below), and the current attrs on both a dict and a
+non-dict mapping.
+
+    python benchmarks/bench_attrs.py
+"""
+
+from collections import ChainMap
+from timeit import repeat
+
+from hebi.runtime import attrs
+
+
+class reference_attrs(object):
+    """The original attrs design: three Python-level calls per read."""
+
+    __slots__ = "mapping"
+
+    def __init__(self, mapping):
+        object.__setattr__(self, "mapping", mapping)
+
+    def __call__(self):
+        return object.__getattribute__(self, "mapping")
+
+    def __getattribute__(self, attr):
+        try:
+            return self()[attr]
+        except KeyError as ke:
+            raise AttributeError(*ke.args)
+
+    def __setattr__(self, attr, val):
+        self()[attr] = val
+
+
+def best(stmt, number=1_000_000):
+    return min(repeat(stmt, number=number, repeat=5))
+
+
+def main():
+    config = {"host": "localhost", "port": 8080}
+    ref = reference_attrs(config)
+    fast = attrs(config)
+    chained = attrs(ChainMap(config))
+
+    results = [
+        ("dict['port']", best(lambda: config["port"])),
+        ("reference .port", best(lambda: ref.port)),
+        ("attrs(dict) .port", best(lambda: fast.port)),
+        ("attrs(ChainMap) .port", best(lambda: chained.port)),
+    ]
+
+    def write_ref():
+        ref.port = 1
+
+    def write_fast():
+        fast.port = 1
+
+    results += [
+        ("reference .port = 1", best(write_ref)),
+        ("attrs(dict) .port = 1", best(write_fast)),
+    ]
+
+    baseline = dict(results)
+    for name, seconds in results:
+        print(f"{name:24} {seconds:.3f}s")
+    print(
+        f"\nread speedup: {baseline['reference .port'] / baseline['attrs(dict) .port']:.1f}x"
+        f"\nwrite speedup: {baseline['reference .port = 1'] / baseline['attrs(dict) .port = 1']:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Benchmark for build mode.
+
+Compiles modules as transpile_module does, evaluating every top-level
+form, and in build mode, evaluating only what macros need. The
+application module does some (simulated) work at import time.
+
+    python benchmarks/bench_build.py
+"""
+
+from contextlib import redirect_stdout
+from io import StringIO
+from timeit import repeat
+
+from bench_parser import ROOT, synthetic
+
+from hebi.parser import Compiler, lex, parse, qualify_context
+
+NATIVE = ROOT / "tests/native_hebi_tests/test_native.hebi"
+APPLICATION = """\
+import: types
+def: _macro_ types..SimpleNamespace:
+def: _macro_.setting: name
+  ("settings.get(%r)" % name)
+def: settings dict:
+"""
+
+
+def application(modules=50):
+    return APPLICATION + "\n".join(
+        f"time..sleep: 0.002  # Loading something.\ndef: setting{i} setting: x{i}"
+        for i in range(modules)
+    )
+
+
+def best(code, build, number):
+    forms = [*parse(lex(code))]
+
+    def compile_():
+        with qualify_context("bench"), redirect_stdout(StringIO()):
+            Compiler("bench", build=build).compile(forms)
+
+    return min(repeat(compile_, number=number, repeat=3)) / number
+
+
+def main():
+    corpora = [
+        ("test_native.hebi", NATIVE.read_text(), 5),
+        ("synthetic, 2000 defs", synthetic(), 1),
+        ("application", application(), 1),
+    ]
+    for label, code, number in corpora:
+        full = best(code, False, number)
+        build = best(code, True, number)
+        print(f"{label:22} evaluated {full * 1000:8.2f} ms   build {build * 1000:8.2f} ms"
+              f"   ({full / build:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
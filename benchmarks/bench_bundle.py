@@ -0,0 +1,62 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Benchmark for starting a bundled application.
+
+Generates an application of many small modules, then times starting
+it from its package directory (precompiled by hebi compileall), and
+from a bundle. Both run in a fresh interpreter, so this includes its
+own startup, which is the same for both.
+
+    python benchmarks/bench_bundle.py
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from timeit import repeat
+
+from hebi.bundle import bundle
+from hebi.compileall import compile_dir
+
+
+def application(root, modules=300):
+    package = Path(root, "app")
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    for i in range(modules):
+        (package / f"m{i}.hebi").write_text(f"def: f{i}: x\n  (x + {i})\n")
+    imports = " ".join(f"app.m{i}" for i in range(modules))
+    (package / "main.hebi").write_text(f"import: {imports}\nprint: app.m1.f1: 1\n")
+    return package
+
+
+def best(command, env=None):
+    return min(repeat(lambda: subprocess.run(command, env=env, check=True,
+                                             stdout=subprocess.DEVNULL),
+                      number=1, repeat=10))
+
+
+def main():
+    with tempfile.TemporaryDirectory() as root:
+        package = application(root)
+        with redirect_stdout(StringIO()):
+            [*compile_dir(package)]
+            bundle("app.main", Path(root, "app.pyz"), [root])
+        env = {**os.environ, "PYTHONPATH": root}
+        directory = best([sys.executable, "-m", "app.main"], env)
+        bundled = best([sys.executable, str(Path(root, "app.pyz"))])
+        python = best([sys.executable, "-c", "pass"])
+    print(f"python alone {python * 1000:7.1f} ms")
+    print(f"directory    {directory * 1000:7.1f} ms   bundle {bundled * 1000:7.1f} ms"
+          f"   ({(directory - python) / (bundled - python):.2f}x, less python alone)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Benchmark for compiling expanded forms to code objects.
+
+Compares Compiler (Python text, then compile() parses it again) with
+AstCompiler (ast nodes straight to compile()), from parsed forms to a
+module code object. Neither evaluates, so this is compile time only,
+including macro expansion, which both share.
+
+    python benchmarks/bench_codegen.py
+"""
+
+from timeit import repeat
+
+from bench_parser import ROOT, synthetic
+
+from hebi.codegen import AstCompiler
+from hebi.parser import Compiler, lex, parse, qualify_context
+
+
+NATIVE = ROOT / "tests/native_hebi_tests/test_native.hebi"
+
+
+def via_text(forms):
+    return compile(Compiler("bench", evaluate=False).compile(forms), "<bench>", "exec")
+
+
+def via_ast(forms):
+    return AstCompiler("bench", evaluate=False).code(forms, "<bench>")
+
+
+def best(path, forms, number):
+    with qualify_context("bench"):
+        return min(repeat(lambda: path(forms), number=number, repeat=5)) / number
+
+
+def main():
+    corpora = [
+        ("test_native.hebi", NATIVE.read_text(), 5),
+        ("synthetic, 2000 defs", synthetic(), 1),
+        ("one REPL cell", "print: (1 + 1) 'two' :sep ', '", 500),
+    ]
+    for label, code, number in corpora:
+        forms = [*parse(lex(code))]
+        text = best(via_text, forms, number)
+        tree = best(via_ast, forms, number)
+        print(f"{label:22} text {text * 1000:8.2f} ms   ast {tree * 1000:8.2f} ms"
+              f"   ({text / tree:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
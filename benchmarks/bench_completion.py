@@ -0,0 +1,52 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Benchmark for kernel completion with a large namespace.
+
+Times completing a prefix from the Index, against scanning every name
+in the namespace for each keystroke, and the Index's update() after
+an execution defines a few more names.
+
+    python benchmarks/bench_completion.py
+"""
+
+import builtins
+from timeit import repeat
+
+from hebi.completion import Index
+
+
+def scan(ns, prefix):
+    names = {*ns, *vars(ns["_macro_"]), *dir(builtins)}
+    return sorted(name for name in names if name.startswith(prefix))
+
+
+def best(f, number=100):
+    return min(repeat(f, number=number, repeat=5)) / number
+
+
+def main():
+    for size in 1_000, 100_000, 1_000_000:
+        ns = {f"name_{i}": i for i in range(size)}
+        ns["_macro_"] = type("Macros", (), {})()
+        index = Index(ns)
+        indexed = best(lambda: index.complete("name_12", 7))
+        scanned = best(lambda: scan(ns, "name_12"), number=3)
+
+        def update():
+            for i in range(5):
+                ns[f"new_{i}"] = i
+            index.update()
+            for i in range(5):
+                del ns[f"new_{i}"]
+            index.update()
+
+        updated = best(update, number=3) / 2
+        print(f"{size:9} names   index {indexed * 1000:8.3f} ms   scan {scanned * 1000:8.3f} ms"
+              f"   ({scanned / indexed:.0f}x)   update {updated * 1000:7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
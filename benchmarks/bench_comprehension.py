@@ -0,0 +1,74 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Benchmark for building a list with for: and .append versus !listcomp.
+
+Both are compiled from Hebigo source, so the timings include whatever
+lambdas and runtime helpers the macros expand into.
+
+    python benchmarks/bench_comprehension.py
+"""
+
+from timeit import repeat
+
+from hissp.compiler import Compiler
+
+from hebi import parser
+
+FOR_APPEND = """\
+!let: acc :be []
+  for: x :in xs
+    if: (x % 3) :then: .append: acc (x * x)
+  acc
+"""
+
+FOR_APPEND_DESTRUCTURE = """\
+!let: acc :be []
+  for: :,: k v
+    :in pairs
+    .append: acc (k + v)
+  acc
+"""
+
+LISTCOMP = """\
+!listcomp: (x * x)
+  :for x :in xs
+  :if (x % 3)
+"""
+
+LISTCOMP_DESTRUCTURE = """\
+!listcomp: (k + v)
+  :for :,: k v
+  :in pairs
+"""
+
+
+def compile_hebi(code):
+    python = Compiler(evaluate=False).compile(parser.reads(code))
+    return compile(python, "<bench>", "eval")
+
+
+def best(code, env, number=20):
+    return min(repeat(lambda: eval(code, env), number=number, repeat=5)) / number
+
+
+def main():
+    env = {"xs": range(100_000), "pairs": [(i, i) for i in range(100_000)]}
+    for label, slow, fast in [
+        ("filter and map", FOR_APPEND, LISTCOMP),
+        ("destructuring ", FOR_APPEND_DESTRUCTURE, LISTCOMP_DESTRUCTURE),
+    ]:
+        slow = compile_hebi(slow)
+        fast = compile_hebi(fast)
+        assert eval(slow, env) == eval(fast, env)
+        slow_time = best(slow, env)
+        fast_time = best(fast, env)
+        print(f"{label}  for: + .append {slow_time * 1000:7.2f} ms"
+              f"   !listcomp {fast_time * 1000:6.2f} ms"
+              f"   ({slow_time / fast_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
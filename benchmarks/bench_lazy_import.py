@@ -0,0 +1,59 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Startup-time benchmark for import: with and without :lazy.
+
+Compiles a Hebigo module header that imports several heavy standard
+library modules, then times fresh interpreters running it, with the
+imports eager and with :lazy.
+
+    python benchmarks/bench_lazy_import.py
+"""
+
+import subprocess
+import sys
+import time
+
+from hissp.compiler import Compiler
+
+from hebi import parser
+
+HEADER = """\
+import: asyncio decimal email.mime.multipart http.client
+  unittest xml.dom.minidom {}
+from: json :import decoder encoder {}
+print: 'ready'
+"""
+
+
+def compile_header(lazy):
+    flag = ":lazy" if lazy else ""
+    code = parser.reads(HEADER.format(flag, flag))
+    # Both variants pay for the runtime helpers, so only imports differ.
+    return "import hebi.runtime\n" + Compiler(evaluate=False).compile(code)
+
+
+def best_startup(python, runs=15):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", python], check=True, stdout=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    baseline = best_startup("import hebi.runtime")
+    eager = best_startup(compile_header(lazy=False))
+    lazy = best_startup(compile_header(lazy=True))
+    print(f"interpreter + hebi.runtime   {baseline * 1000:7.1f} ms")
+    print(f"eager import:                {eager * 1000:7.1f} ms")
+    print(f"import: ... :lazy            {lazy * 1000:7.1f} ms")
+    print(f"\nimport cost saved: {(eager - lazy) * 1000:.1f} ms"
+          f" of {(eager - baseline) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Benchmark for the optimization levels.
+
+Runs functions using if:, and:, or:, !loop, and !of:, compiled at each
+level, so this is run time only.
+
+    python benchmarks/bench_levels.py
+"""
+
+from timeit import repeat
+from types import SimpleNamespace
+
+from hebi.codegen import module_code
+
+CODE = """\
+def: classify: n
+  if: (n % 15 == 0) :then: "fizzbuzz"
+    :elif: (n % 3 == 0) "fizz"
+    :elif: (n % 5 == 0) "buzz"
+    :else: n
+
+def: valid: n
+  and: (n > 0) or: (n % 2) (n % 3) (n < 1000)
+
+def: total: n
+  !loop: recur: i n acc 0
+    if: i :then: recur: (i - 1) (acc + i)
+      :else: acc
+
+def: port: config
+  !of: 'port' 0 'servers' .settings config
+"""
+
+CASES = [
+    ("if:", "[classify(n) for n in range(1000)]"),
+    ("and:/or:", "[valid(n) for n in range(1000)]"),
+    ("!loop", "[total(10) for n in range(100)]"),
+    ("!of", "[port(config) for n in range(1000)]"),
+]
+
+
+def main():
+    namespaces = {}
+    for level in 0, 1, 2:
+        namespaces[level] = ns = {"__name__": "bench"}
+        ns["config"] = SimpleNamespace(settings={"servers": [{"port": 80}]})
+        exec(module_code(CODE, "bench", optimize=level, evaluate=False), ns)
+    for label, statement in CASES:
+        times = [
+            min(repeat(statement, globals=namespaces[level], number=100, repeat=5))
+            for level in namespaces
+        ]
+        print(f"{label:10}", *(f"level {level} {t * 10:7.3f} ms" for level, t in
+                               zip(namespaces, times)), f"({times[0] / times[-1]:.2f}x)",
+              sep="   ")
+
+
+if __name__ == "__main__":
+    main()
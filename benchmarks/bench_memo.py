@@ -0,0 +1,65 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Benchmark for memoized expansion of pure macros.
+
+Compiles repetitive generated code, like a code generator's output,
+with and without memoizing. One module repeats basic macro forms, and
+the other repeats a form of a pure user macro that takes a couple of
+milliseconds to expand. Every compilation starts with empty caches.
+
+    python benchmarks/bench_memo.py
+"""
+
+from timeit import repeat
+
+from hebi.parser import Compiler, lex, parse, qualify_context
+
+BASIC = """\
+def: handler{i}: request
+  !let: user :be .user: request
+    if: (request.path == "/")
+      :then: !mask:pass: index :,:user
+      :else: !mask:pass: notfound :,:request.path
+"""
+
+USER = """\
+import: types
+def: _macro_ types..SimpleNamespace:
+def: _macro_.checksum: : :* names
+  :@ hebi.memo..pure
+  ("%d" % sum(hash(name * i) % 7 for i in range(2000) for name in names))
+"""
+
+
+class Unmemoized(Compiler):
+    def _renew_memo(self):
+        pass  # No caches.
+
+
+def best(code, memoize, number=1):
+    forms = [*parse(lex(code))]
+
+    def compile_():
+        with qualify_context("bench"):
+            (Compiler if memoize else Unmemoized)("bench").compile(forms)
+
+    return min(repeat(compile_, number=number, repeat=3)) / number
+
+
+def main():
+    corpora = [
+        ("basic macros, 500 defs", "".join(BASIC.format(i=i % 5) for i in range(500))),
+        ("user macro, 2000 uses", USER + "".join(f"def: f{i} checksum: a b c\n" for i in range(2000))),
+    ]
+    for label, code in corpora:
+        plain = best(code, False)
+        memoized = best(code, True)
+        print(f"{label:24} expanded {plain * 1000:8.2f} ms   memoized {memoized * 1000:8.2f} ms"
+              f"   ({plain / memoized:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
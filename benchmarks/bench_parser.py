@@ -0,0 +1,94 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Benchmark for hebi.parser.parse.
+
+Compares the original recursive, generator-per-level parser
+(reproduced below) with the current one, on the tests/test_parser.py
+examples, on the native test module, and on a large synthetic file.
+Tokens are lexed up front, so only parsing is timed.
+
+    python benchmarks/bench_parser.py
+"""
+
+import ast
+import sys
+from pathlib import Path
+from timeit import repeat
+
+from hebi.parser import RESERVED_WORDS, lex, parse
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))  # For the tests package.
+
+from tests.test_parser import EXPECTED  # noqa: E402
+
+
+def reference_parse(tokens):
+    """The original recursive parser."""
+    tokens = iter(tokens)
+    for case, group in tokens:
+        if group in RESERVED_WORDS:
+            group = f"hebi.basic.._macro_.{group}_"
+        elif group.startswith("!"):
+            group = f"hebi.basic.._macro_.{group[1:]}"
+        if case == "open":
+            yield (*reference_parse(tokens),)
+        elif case == "close":
+            return
+        elif case == "unary":
+            if group == "pass":
+                yield next(reference_parse(tokens)),
+            else:
+                yield group, next(reference_parse(tokens)),
+        elif case == "symbol":
+            if all(s.isidentifier() for s in group.split(".") if s):
+                yield group
+            else:
+                yield ast.literal_eval(group)
+        elif case == "python":
+            yield f"({group})"
+        else:
+            yield group
+
+
+def synthetic(functions=2000):
+    """Generated code: many small functions with nested control flow."""
+    return "\n".join(
+        f"""\
+def: f{i}: x y
+  "Generated."
+  !let: z :be add: x y
+    if: (z > {i})
+      :then: print: z foo.bar:baz:{i} [1, 2]
+      :else:
+        for: k :in range: z
+          print: k :sep ", "
+"""
+        for i in range(functions)
+    )
+
+
+def best(parser, tokens, number):
+    return min(repeat(lambda: [*parser(tokens)], number=number, repeat=5)) / number
+
+
+def main():
+    corpora = [
+        ("test_parser.py examples", [[*lex(code)] for code in EXPECTED], 200),
+        ("test_native.hebi", [[*lex((ROOT / "tests/native_hebi_tests/test_native.hebi").read_text())]], 50),
+        ("synthetic, 2000 defs", [[*lex(synthetic())]], 3),
+    ]
+    for label, token_lists, number in corpora:
+        for tokens in token_lists:
+            assert [*parse(tokens)] == [*reference_parse(tokens)]
+        old = sum(best(reference_parse, tokens, number) for tokens in token_lists)
+        new = sum(best(parse, tokens, number) for tokens in token_lists)
+        print(f"{label:24} recursive {old * 1000:8.2f} ms   stack {new * 1000:8.2f} ms"
+              f"   ({old / new:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Peak memory benchmark for parsing and compiling a large module.
+
+Uses tracemalloc to measure the peak of reading a large synthetic
+module into a list of forms, and of compiling it to Python, with the
+original parser (no interning, reproduced in bench_parser.py) and the
+current one, with and without compact.
+
+    python benchmarks/bench_parser_memory.py
+"""
+
+import tracemalloc
+
+from bench_parser import reference_parse, synthetic
+
+from hebi.parser import Compiler, lex, parse
+
+
+def peak(thunk):
+    tracemalloc.start()
+    try:
+        result = thunk()
+        return tracemalloc.get_traced_memory()[1], result
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    code = synthetic(2000)
+    tokens = [*lex(code)]
+    parsers = [
+        ("original", reference_parse),
+        ("interned", parse),
+        ("compact", lambda tokens: parse(tokens, compact=True)),
+    ]
+    print(f"{len(code) / 1e6:.1f} MB of source, {len(tokens)} tokens\n")
+    print(f"{'':10} {'parse peak':>12} {'compile peak':>14}")
+    for label, parser in parsers:
+        parse_peak, forms = peak(lambda: [*parser(tokens)])
+        del forms
+        compiler = Compiler("bench", evaluate=False)
+        compile_peak, _ = peak(lambda: compiler.compile(parser(tokens)))
+        print(f"{label:10} {parse_peak / 2**20:9.1f} MB {compile_peak / 2**20:11.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
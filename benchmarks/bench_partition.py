@@ -0,0 +1,76 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Benchmark for hebi.runtime.partition on large inputs.
+
+Compares the original islice-per-offset design (reproduced below) on
+sequences, and reports time and peak traced memory for partition on
+large one-shot streams, which the original got wrong.
+
+    python benchmarks/bench_partition.py
+"""
+
+import time
+import tracemalloc
+from collections import deque
+from itertools import islice, zip_longest
+
+from hebi.runtime import _sentinel, partition
+
+N = 2_000_000
+
+
+def reference_partition(iterable, n=2, step=None, fillvalue=_sentinel):
+    """The original design: n islice views, each a full pass."""
+    step = step or n
+    slices = (islice(iterable, start, None, step) for start in range(n))
+    if fillvalue is _sentinel:
+        return zip(*slices)
+    return zip_longest(*slices, fillvalue=fillvalue)
+
+
+def stream():
+    return (i for i in range(N))
+
+
+def measure(make_input, function, *args):
+    """Best time of 3 runs, then peak traced memory of one more."""
+    times = []
+    for _ in range(3):
+        data = make_input()
+        start = time.perf_counter()
+        deque(function(data, *args), maxlen=0)
+        times.append(time.perf_counter() - start)
+    data = make_input()
+    tracemalloc.start()
+    deque(function(data, *args), maxlen=0)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(times), peak
+
+
+def main():
+    sequence = list(range(N))
+    view = memoryview(bytes(N))
+    cases = [
+        ("list, pairs", lambda: sequence, (2,)),
+        ("list, window 3 step 1", lambda: sequence, (3, 1)),
+        ("list, 100 step 150", lambda: sequence, (100, 150)),
+        ("memoryview, window 8 step 4", lambda: view, (8, 4)),
+        ("stream, pairs", stream, (2,)),
+        ("stream, window 3 step 1", stream, (3, 1)),
+        ("stream, 100 step 150", stream, (100, 150)),
+    ]
+    for label, make_input, args in cases:
+        new, new_peak = measure(make_input, partition, *args)
+        line = f"{label:28} partition {new * 1000:7.1f} ms {new_peak / 1024:8.1f} KiB"
+        if not label.startswith("stream"):
+            old, old_peak = measure(make_input, reference_partition, *args)
+            line += f"   original {old * 1000:7.1f} ms {old_peak / 1024:8.1f} KiB"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Memory and construction-time benchmark for !record versus class:.
+
+Both classes are compiled from Hebigo source. Memory is measured with
+tracemalloc over a million instances.
+
+    python benchmarks/bench_record.py
+"""
+
+import tracemalloc
+from timeit import repeat
+
+from hissp.compiler import Compiler
+
+from hebi import parser
+
+CLASS = """\
+class: Point:
+  def: .__init__: self x y : z 0
+    def: self.x x
+    def: self.y y
+    def: self.z z
+"""
+
+RECORD = """\
+!record: Point: x y : z 0
+"""
+
+N = 1_000_000
+
+
+def compile_point(code):
+    compiler = Compiler()
+    compiler.compile(parser.reads(code))
+    return compiler.ns["Point"]
+
+
+def bytes_per_instance(cls):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    points = [cls(i, i) for i in range(N)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del points
+    return (after - before) / N
+
+
+def best_init(cls, number=200_000):
+    return min(repeat(lambda: cls(1, 2), number=number, repeat=5)) / number
+
+
+def main():
+    for label, code in [("class:  ", CLASS), ("!record:", RECORD)]:
+        cls = compile_point(code)
+        print(f"{label}  {bytes_per_instance(cls):6.1f} bytes/instance"
+              f"  {best_init(cls) * 1e9:6.1f} ns/construction")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Multi-threaded stress and throughput benchmark for the runtime helpers.
+
+Runs a compiled Hebigo workload that exercises !loop, for:, try:,
+class:, and def: in 1, 2, 4, and 8 threads at once, checks every
+result, and reports total throughput.
+
+With the GIL, throughput stays flat as threads are added. On a
+free-threaded build (python3.13t), it should scale with cores.
+
+    python benchmarks/bench_threads.py
+"""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from hissp.compiler import Compiler
+
+from hebi import parser
+
+WORKLOAD = """\
+def: triangle: n
+  !loop: recur: n n  acc 0
+    if: n
+      :then: recur: (n - 1) (acc + n)
+      :else: acc
+
+def: work: n
+  class: Box:
+    def: .__init__: self value
+      def: self.value value
+  !let: total :be [0]
+    for: i :in range: n
+      try: .__setitem__: total 0 (total[0] + triangle(i % 50))
+        :except: ZeroDivisionError
+          'unreachable'
+      :else: (Box(total[0]).value)
+"""
+
+JOBS = 32
+SIZE = 2000
+
+
+def compile_work():
+    compiler = Compiler()
+    compiler.compile(parser.reads(WORKLOAD))
+    return compiler.ns["work"]
+
+
+def run(work, threads):
+    expected = sum((i % 50) * (i % 50 + 1) // 2 for i in range(SIZE))
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        results = list(pool.map(work, [SIZE] * JOBS))
+    elapsed = time.perf_counter() - start
+    assert results == [expected] * JOBS, "corrupted result"
+    return JOBS / elapsed
+
+
+def main():
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    work = compile_work()
+    single = run(work, 1)
+    for threads in [1, 2, 4, 8]:
+        rate = run(work, threads)
+        print(f"{threads} threads  {rate:8.1f} jobs/s  ({rate / single:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
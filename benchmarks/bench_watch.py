@@ -0,0 +1,77 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Benchmark for recompiling after an edit.
+
+Generates a package of many small modules, a few of which use a macro
+module, then times recompiling all of it, as hebi compileall would,
+against a watcher's rebuild after touching a plain module, and after
+touching the macros.
+
+    python benchmarks/bench_watch.py
+"""
+
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from time import perf_counter
+
+from hebi.compileall import compile_dir
+from hebi.watch import Watcher
+
+MACROS = """\
+import: types
+def: _macro_ types..SimpleNamespace:
+def: _macro_.twice: x
+  ("(%s) * 2" % x)
+"""
+
+
+def package(root, modules=200, users=10):
+    package = Path(root, "app")
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "macros.hebi").write_text(MACROS)
+    for i in range(modules):
+        body = "app.macros.._macro_.twice: x" if i < users else f"(x + {i})"
+        (package / f"m{i}.hebi").write_text(f"def: f{i}: x\n  {body}\n")
+    return package
+
+
+def touch(path):
+    mtime = path.stat().st_mtime_ns + 10**9
+    os.utime(path, ns=(mtime, mtime))
+
+
+def timed(f):
+    start = perf_counter()
+    with redirect_stdout(StringIO()):
+        result = f()
+    return perf_counter() - start, result
+
+
+def main():
+    with tempfile.TemporaryDirectory() as root:
+        app = package(root)
+        everything, _ = timed(lambda: [*compile_dir(app, levels=())])
+        sys.path.insert(0, root)
+        watcher = Watcher(app)
+        timed(lambda: watcher.rebuild(watcher.scan()))
+        touch(app / "m100.hebi")
+        plain, plain_names = timed(lambda: watcher.rebuild(watcher.scan()))
+        touch(app / "macros.hebi")
+        macro, macro_names = timed(lambda: watcher.rebuild(watcher.scan()))
+        idle, _ = timed(lambda: watcher.rebuild(watcher.scan()))
+    print(f"compile all      {everything * 1000:8.1f} ms")
+    print(f"edit plain       {plain * 1000:8.1f} ms  ({len(plain_names)} module)")
+    print(f"edit macros      {macro * 1000:8.1f} ms  ({len(macro_names)} modules)")
+    print(f"poll, no change  {idle * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,14 +2,15 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
+import argparse
 import subprocess
 import sys
 import time
 
-from jupyter_console import app
 
+def console():
+    from jupyter_console import app
 
-def main():
     print("Attempting to start Hebigo kernel without installing kernelspec.")
     kernel = subprocess.Popen([sys.executable, "-m", "hebi.kernel"])
     print("Waiting for kernel to start.")
@@ -20,5 +21,127 @@ def main():
     kernel.kill()
 
 
+def profile(args):
+    from hebi.profile import report
+
+    report(args.file, args.args, args.limit)
+
+
+def compileall(args):
+    from hebi.compileall import compile_dir
+
+    levels = args.levels or [sys.flags.optimize]
+    if args.sourceless and len(levels) > 1:
+        sys.exit("hebi compileall: --sourceless writes one .pyc per module, so one -o")
+    for path in compile_dir(
+        args.directory,
+        args.optimize,
+        levels,
+        args.sourceless,
+        not args.run_all,
+        args.checked,
+    ):
+        print("wrote", path)
+
+
+def bundle(args):
+    from hebi.bundle import bundle
+
+    out = args.output or f"{args.entry}.pyz"
+    for name in bundle(args.entry, out, args.paths or ["."], args.optimize, args.python):
+        print("bundled", name)
+    print("wrote", out)
+
+
+def watch(args):
+    from hebi.watch import watch
+
+    try:
+        watch(args.directory, args.optimize, not args.run_all, args.interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="hebi", description="With no command, starts the Hebigo console."
+    )
+    commands = parser.add_subparsers(title="commands")
+
+    command = commands.add_parser(
+        "profile", help="run a .hebi file under cProfile, timing its lines and macros"
+    )
+    command.add_argument("file")
+    command.add_argument("args", nargs=argparse.REMAINDER, help="for its sys.argv")
+    command.add_argument("-n", "--limit", type=int, default=20, help="rows per table")
+    command.set_defaults(run=profile)
+
+    command = commands.add_parser(
+        "compileall", help="transpile and byte-compile every .hebi file in a package"
+    )
+    command.add_argument("directory")
+    command.add_argument(
+        "-O", "--optimize", type=int, choices=range(3), default=0,
+        help="Hebigo optimization level (default 0)",
+    )
+    command.add_argument(
+        "-o", dest="levels", type=int, choices=range(3), action="append",
+        help="bytecode optimization level, like python -O (repeatable)",
+    )
+    command.add_argument(
+        "--sourceless", action="store_true",
+        help="write a .pyc next to each .hebi, and no .py",
+    )
+    command.add_argument(
+        "--checked", action="store_true",
+        help="have imports check the .pyc against the source's hash",
+    )
+    command.add_argument(
+        "--run-all", action="store_true",
+        help="run every top-level form while compiling, not just what macros need",
+    )
+    command.set_defaults(run=compileall)
+
+    command = commands.add_parser(
+        "bundle", help="pack the modules an entry module reaches into one zipapp"
+    )
+    command.add_argument("entry", help="module name, like app.main")
+    command.add_argument("-o", "--output", help="the zipapp (default ENTRY.pyz)")
+    command.add_argument(
+        "-p", "--path", dest="paths", action="append",
+        help="where to find the application's modules (repeatable, default .)",
+    )
+    command.add_argument(
+        "-O", "--optimize", type=int, choices=range(3), default=0,
+        help="Hebigo optimization level (default 0)",
+    )
+    command.add_argument(
+        "--python", default="/usr/bin/env python3", help="interpreter for the shebang line"
+    )
+    command.set_defaults(run=bundle)
+
+    command = commands.add_parser(
+        "watch", help="keep a package transpiled, recompiling the modules changes affect"
+    )
+    command.add_argument("directory")
+    command.add_argument(
+        "-O", "--optimize", type=int, choices=range(3), default=0,
+        help="Hebigo optimization level (default 0)",
+    )
+    command.add_argument(
+        "--run-all", action="store_true",
+        help="run every top-level form while compiling, not just what macros need",
+    )
+    command.add_argument(
+        "--interval", type=float, default=0.5, help="seconds between polls (default 0.5)"
+    )
+    command.set_defaults(run=watch)
+
+    args = parser.parse_args(argv)
+    if "run" not in args:
+        return console()
+    args.run(args)
+
+
 if __name__ == "__main__":
     main()
@@ -1,26 +1,98 @@
-from ..bootstrap import (
-    def_,
-    class_,
-    import_,
-    from_,
-    if_,
-    raise_,
-    mask,
-    begin,
-    begin0,
-    and_,
-    or_,
-    not_,
-    with_,
-    assert_,
-    let,
-    loop,
-    try_,
-    for_,
-    break_,
-    continue_,
-    runtime,
-    of,
-    attach,
-    del_,
-)
+"""
+Hebigo's basic macros.
+
+The macros live in hebi.bootstrap, which needs the Hissp compiler.
+They're resolved on first attribute access (PEP 562), so importing
+hebi.basic doesn't pay for the compiler until a macro is expanded.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # Resolved lazily, by __getattr__ below.
+    from ..bootstrap import (
+        def_,
+        class_,
+        import_,
+        from_,
+        if_,
+        raise_,
+        mask,
+        begin,
+        begin0,
+        and_,
+        or_,
+        not_,
+        with_,
+        assert_,
+        let,
+        loop,
+        try_,
+        for_,
+        break_,
+        continue_,
+        runtime,
+        of,
+        attach,
+        del_,
+        async_,
+        await_,
+        yield_,
+        listcomp,
+        setcomp,
+        dictcomp,
+        genexpr,
+        record,
+    )
+
+__all__ = [
+    'def_',
+    'class_',
+    'import_',
+    'from_',
+    'if_',
+    'raise_',
+    'mask',
+    'begin',
+    'begin0',
+    'and_',
+    'or_',
+    'not_',
+    'with_',
+    'assert_',
+    'let',
+    'loop',
+    'try_',
+    'for_',
+    'break_',
+    'continue_',
+    'runtime',
+    'of',
+    'attach',
+    'del_',
+    'async_',
+    'await_',
+    'yield_',
+    'listcomp',
+    'setcomp',
+    'dictcomp',
+    'genexpr',
+    'record',
+]
+
+
+def _load():
+    from .. import bootstrap
+
+    # All at once, so vars() sees every macro from then on.
+    globals().update({name: getattr(bootstrap, name) for name in __all__})
+
+
+def __getattr__(name):
+    if name in __all__:
+        _load()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -4,73 +4,243 @@
 
 import ast
 import builtins
+import io
+import operator
 import re
-from functools import wraps
-from itertools import islice, zip_longest, chain, takewhile
-from types import new_class
+import tokenize
+from itertools import chain, takewhile
+from keyword import iskeyword
 
 from hissp.compiler import NS
 
-from hebi.parser import QUALSYMBOL
+from hebi.memo import impure, ispure, pure
+from hebi.parser import COMPILER, OPTIMIZE, QUALSYMBOL, Compiler
+from hebi.peephole import RUNTIME_GUARD, SCOPED, Peephole
+from hebi.runtime import (  # Compatibility with code compiled before the split.
+    _and_,
+    _or_,
+    _not_,
+    _qualname,
+    akword,
+    _class_,
+    _class_cell,
+    function,
+    _lazy_import,
+    _lazy_from,
+    _if_,
+    _sentinel,
+    _raise_,
+    _raise_ex,
+    _raise_ex_from,
+    partition,
+    _try_,
+    _begin,
+    _begin0,
+    _with_,
+    _assert_,
+    _assert_message,
+    _unpack,
+    _unpack_iterable,
+    _unpack_mapping,
+    entuple,
+    _loop,
+    LabeledBreak,
+    LabeledResultBreak,
+    Break,
+    Continue,
+    _for_,
+    attrs,
+    _attach,
+)
 
 BOOTSTRAP = 'hebi.bootstrap..'
+RUNTIME = 'hebi.runtime..'
+MACRO = 'hebi.basic.._macro_.'
+
+# Makes a lambda a generator, without yielding anything.
+YIELD_NOTHING = '(yield from ())'
 
 
 def _thunk(*args):
     return ('lambda', (), *args)
 
 
-def _and_(expr, *thunks):
-    result = expr
-    for thunk in thunks:
-        if not result:
+def _lambda(parameters, body, generator=False):
+    if generator:
+        return ('lambda', parameters, YIELD_NOTHING, *body)
+    return ('lambda', parameters, *body)
+
+
+def _compiler():
+    """The compiler expanding the macro, or one like it."""
+    compiler = COMPILER.get()
+    if compiler is None:
+        peephole = Peephole() if OPTIMIZE.get() else None
+        compiler = Compiler(
+            QUALSYMBOL.get() or '_repl', NS.get(), evaluate=False, peephole=peephole
+        )
+    return compiler
+
+
+def _compile(form):
+    """Compiles form to Python text, for a macro to inject."""
+    impure()  # Depends on the macros, not just the form.
+    compiler = COMPILER.get()
+    if compiler is None:
+        return _compiler().form(form)
+    return compiler.inject(form)
+
+
+def _expand(form):
+    """
+    Expands the macros in form, all the way down (but not in quotes),
+    so _suspends() can see what user macros expand to. Macros return
+    the expansion in place of the form, so each macro still runs once.
+    Forms without macros are returned as is.
+    """
+    while type(form) is tuple and form and type(form[0]) is str:
+        if form[0] == 'quote':
+            return form
+        if form[0] == 'lambda':
+            return _expand_from(form, 2)
+        macro = _compiler().macro(form[0])
+        if macro is None:
             break
-        result = thunk()
-    return result
+        if not ispure(macro):
+            impure()
+        form = macro(*form[1:])
+    if type(form) is tuple:
+        return _expand_from(form, 0)
+    return form
+
+
+def _expand_from(form, start):
+    expanded = tuple(map(_expand, form[start:]))
+    if all(map(operator.is_, expanded, form[start:])):
+        return form
+    return (*form[:start], *expanded)
+
+
+def _native(*bodies):
+    """
+    Compiles each body (a list of forms) to one Python expression,
+    evaluating them in order like a lambda's, for a specialized
+    expansion to inject in place of thunks.
+
+    Returns None below optimization level 2, or if any body would
+    change meaning outside of its own lambda.
+    """
+    if OPTIMIZE.get() < 2 or _suspends(chain.from_iterable(bodies)):
+        return None
+    code = []
+    for body in bodies:
+        if not body:
+            code.append('()')
+            continue
+        body = [*map(_compile, body)]
+        if any(SCOPED.search(python) for python in body):
+            return None
+        code.append(body[0] if len(body) == 1 else f"({','.join(body)},)[-1]")
+    return code
+
+
+def _yield_from(form):
+    return f'(yield from {_compile(form)})'
 
 
+def _suspends(forms, awaits=True):
+    """
+    Can any form suspend the function it's in?
+
+    Basic macros wrap their bodies in lambdas, so a suspending body
+    has to be a generator, driven with yield from by the enclosing
+    function, and so on up to the def:. Nested functions, classes,
+    and quoted forms suspend on their own, so they don't count.
+    """
+    for form in forms:
+        if type(form) is str:
+            if re.search(r"\b(yield|await)\b", form) and _injection_suspends(form, awaits):
+                return True
+            continue
+        if type(form) is not tuple or not form:
+            continue
+        head = form[0]
+        if head in {'quote', 'lambda', MACRO + 'class_', MACRO + 'mask'}:
+            continue
+        if head == MACRO + 'def_' and len(form) > 1 and type(form[1]) is tuple:
+            continue
+        if head == MACRO + 'yield_' or awaits and head == MACRO + 'await_':
+            return True
+        if head == MACRO + 'async_' and len(form) > 1 and type(form[1]) is tuple:
+            if form[1][:1] == (MACRO + 'def_',):
+                continue
+            if awaits:
+                return True
+        if _suspends(form, awaits):
+            return True
+    return False
+
+
+def _injection_suspends(python, awaits=True):
+    """Does injected Python yield (or await), not just say the word?"""
+    kinds = (ast.Yield, ast.YieldFrom, ast.Await) if awaits else (ast.Yield, ast.YieldFrom)
+    try:
+        nodes = [ast.parse(python.strip())]
+    except SyntaxError:  # Not whole; the words, outside strings, will do.
+        words = {'yield', 'await'} if awaits else {'yield'}
+        try:
+            return any(
+                token.type == tokenize.NAME and token.string in words
+                for token in tokenize.generate_tokens(io.StringIO(python).readline)
+            )
+        except (tokenize.TokenError, SyntaxError):
+            return False
+    while nodes:
+        node = nodes.pop()
+        if isinstance(node, kinds):
+            return True
+        if not isinstance(node, (ast.Lambda, ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            nodes.extend(ast.iter_child_nodes(node))
+    return False
+
+
+@pure
 def and_(*args):
     if args:
         if len(args) == 1:
             return args[0]
-        return (BOOTSTRAP + '_and_', args[0], *(
-            _thunk(arg) for arg in args[1:]
+        args = tuple(map(_expand, args))
+        native = _native(*([arg] for arg in args))
+        if native:
+            return f"({' and '.join(native)})"
+        generator = _suspends(args[1:])
+        form = (RUNTIME + ('_and_gen' if generator else '_and_'), args[0], *(
+            _lambda((), [arg], generator) for arg in args[1:]
         ))
+        return _yield_from(form) if generator else form
     return True
 
 
-def _or_(expr, *thunks):
-    result = expr
-    for thunk in thunks:
-        if result:
-            break
-        result = thunk()
-    return result
-
-
+@pure
 def or_(*args):
     if args:
         if len(args) == 1:
             return args[0]
-        return (BOOTSTRAP + '_or_', args[0], *(
-            _thunk(arg) for arg in args[1:]
+        args = tuple(map(_expand, args))
+        native = _native(*([arg] for arg in args))
+        if native:
+            return f"({' or '.join(native)})"
+        generator = _suspends(args[1:])
+        form = (RUNTIME + ('_or_gen' if generator else '_or_'), args[0], *(
+            _lambda((), [arg], generator) for arg in args[1:]
         ))
+        return _yield_from(form) if generator else form
     return ()
 
 
-def _not_(b):
-    return True if b else ()
-
-
+@pure
 def not_(expr):
-    return BOOTSTRAP + '_not_', expr
-
-
-def _qualname(ns, name):
-    if hasattr(ns, '__qualname__'):
-        name = name.partition('.')[-1]
-        name = f"{ns.__qualname__}.{name}"
-    return name
+    return RUNTIME + '_not_', expr
 
 
 def def_(name, *body):
@@ -78,21 +248,7 @@ def def_(name, *body):
     Assigns a global value or function in the current module.
     """
     if type(name) is tuple:
-        args, decorators, doc, ibody, name = destructure_decorators(name, body)
-        qualname = ('quote', name,)
-        if name.startswith('_ns_.'):
-            qualname = (BOOTSTRAP + '_qualname', '_ns_', ('quote', name),)
-        return (
-            'hebi.basic.._macro_.def_',
-            name,
-            _decorate(
-                decorators,
-                (BOOTSTRAP + 'function',
-                 qualname,
-                 ('lambda', tuple(args), *ibody),
-                 doc,),
-            ),
-        )
+        return _function_(name, body)
     if len(body) == 1:
         name = _expand_ns(name)
         if '.' in name:
@@ -112,31 +268,170 @@ def def_(name, *body):
     raise SyntaxError
 
 
+def _function_(name, body, coroutine=False):
+    args, decorators, doc, ibody, name = destructure_decorators(name, body)
+    qualname = ('quote', name,)
+    if name.startswith('_ns_.'):
+        qualname = (RUNTIME + '_qualname', '_ns_', ('quote', name),)
+    return (
+        'hebi.basic.._macro_.def_',
+        name,
+        _decorate(
+            decorators,
+            (RUNTIME + ('async_function' if coroutine else 'function'),
+             qualname,
+             _lambda(tuple(args), ibody, coroutine),
+             doc,),
+        ),
+    )
+
+
 def class_(name, *body):
     args, decorators, doc, ibody, name = destructure_decorators(name, body)
-    ns = [('lambda', (), '_ns_')] if name.startswith('_ns_.') else ()
+    ns = ['ns', ('lambda', (), '_ns_')] if name.startswith('_ns_.') else ()
+    ibody = tuple(ibody)
+    if _uses_class_cell(ibody):
+        # new_class() isn't setting the __class__ cell for super() for some reason.
+        # So we need to make one here.
+        callback = ('lambda',('__class__',),
+                    ('lambda',('_ns_',),
+                     # Make sure __class__ appears in __closure__, but don't actually use it.
+                     '(None and __class__)',
+                     *ibody),)
+        cell = 'cell', True,
+    else:
+        callback = ('lambda', ('_ns_',), *ibody)
+        cell = ()
     return (
         'hebi.basic.._macro_.def_',
         name,
         _decorate(
             decorators,
-            (BOOTSTRAP + '_class_',
+            (RUNTIME + '_class_',
              ('quote', name),
-             (BOOTSTRAP + 'akword', *args),
+             (RUNTIME + 'akword', *args),
              doc,
              ('globals',),
-             # new_class() isn't setting the __class__ cell for super() for some reason.
-             # So we need to make one here.
-             ('lambda',('__class__',),
-              ('lambda',('_ns_',),
-               # Make sure __class__ appears in __closure__, but don't actually use it.
-               '(None and __class__)',
-               *ibody),),
-             *ns,),
+             callback,
+             ':',
+             *ns,
+             *cell,),
         )
     )
 
 
+def record(name, *body):
+    """
+    A class: with __slots__ for its fields, and generated __init__,
+    __repr__, and __eq__ methods. Fields after a : have defaults.
+
+    !record: Point: x y : z 0
+      "A point in space."
+      :hash
+      :order
+      def: .norm: self
+        math..hypot: self.x self.y self.z
+
+    :hash adds __hash__ and :order adds <, <=, >, and >= (comparing
+    fields in order, as tuples). Instances have no __dict__.
+    """
+    params, decorators, doc, ibody, name = destructure_decorators(name, body)
+    fields, parameters = _record_fields(params)
+    body = [*ibody]
+    options = set()
+    while body and body[0] in {':hash', ':order'}:
+        options.add(body.pop(0))
+    self_fields = ''.join(f'self.{f},' for f in fields)
+    other_fields = ''.join(f'other.{f},' for f in fields)
+    # __init__'s own parameters mustn't shadow a field (or be one).
+    self_ = _unused('self', fields)
+    setters = [_unused(f'xAUTO{i}_', fields) for i in range(len(fields))]
+    init = ''.join(f'{s}({self_},{f}),' for s, f in zip(setters, fields))
+    methods = {
+        '__repr__': 'lambda self:f"{type(self).__qualname__}(%s)"'
+        % ', '.join(f'{f}={{self.{f}!r}}' for f in fields),
+        '__eq__': _record_compare('==', self_fields, other_fields),
+    }
+    if ':hash' in options:
+        methods['__hash__'] = f'lambda self:hash(({self_fields}))'
+    if ':order' in options:
+        for method, op in [('__lt__', '<'), ('__le__', '<='), ('__gt__', '>'), ('__ge__', '>=')]:
+            methods[method] = _record_compare(op, self_fields, other_fields)
+    return (
+        'hebi.basic.._macro_.class_',
+        (name,),
+        *chain.from_iterable((':@', d) for d in decorators),
+        ':@',
+        (RUNTIME + '_slots_init',
+         f"(lambda {','.join(setters)}:lambda {','.join([self_, *parameters])}:({init}None,)[-1])"),
+        *(() if doc is None else (doc,)),
+        ('hebi.basic.._macro_.def_', '.__slots__', ('quote', tuple(fields))),
+        ('hebi.basic.._macro_.def_', '.__match_args__', ('quote', tuple(fields))),
+        *(('hebi.basic.._macro_.def_',
+           '.' + method,
+           (RUNTIME + 'function',
+            (RUNTIME + '_qualname', '_ns_', ('quote', '_ns_.' + method)),
+            f'({code})'))
+          for method, code in methods.items()),
+        *body,
+    )
+
+
+def _record_fields(params):
+    fields = []
+    parameters = []
+    iparams = iter(params)
+    for param in iparams:
+        if param == ':':
+            for field, default in zip(*[iparams] * 2):
+                fields.append(field)
+                parameters.append(f'{field}={_compile(default)}')
+            break
+        fields.append(param)
+        parameters.append(param)
+    for field in fields:
+        if type(field) is not str or not field.isidentifier():
+            raise SyntaxError(f'Bad record field: {field!r}')
+    return fields, parameters
+
+
+def _unused(name, names):
+    while name in names:
+        name += '_'
+    return name
+
+
+def _record_compare(op, self_fields, other_fields):
+    return (
+        f'lambda self,other:({self_fields}){op}({other_fields})'
+        ' if type(other) is type(self) else NotImplemented'
+    )
+
+
+def _uses_class_cell(forms):
+    """
+    Might any form use super or __class__ (even in Python code)?
+
+    The body isn't expanded yet, so a macro other than a basic one
+    might expand to either. Those count as uses.
+    """
+    for form in forms:
+        if type(form) is tuple:
+            if form and _is_user_macro(form[0]) or _uses_class_cell(form):
+                return True
+        elif type(form) is str and re.search(r"\bsuper\b|\b__class__\b", form):
+            return True
+    return False
+
+
+def _is_user_macro(head):
+    if type(head) is not str or head.startswith(MACRO):
+        return False
+    if '_macro_.' in head:
+        return True
+    return head in vars((NS.get() or {}).get('_macro_', lambda: ()))
+
+
 def destructure_decorators(name, body):
     name, *args = name
     doc = None
@@ -155,45 +450,6 @@ def destructure_decorators(name, body):
     return args, decorators, doc, ibody, name
 
 
-def akword(*args, **kwargs):
-    return args, kwargs
-
-
-def _class_(name, args, doc, module, wrapped_callback, ns=None):
-    class_cell, callback = _class_cell(wrapped_callback)
-    __qualname__ = name
-    if ns and hasattr(ns(), '__qualname__'):
-        name = name.partition('.')[-1]
-        __qualname__ = f"{ns().__qualname__}.{name}"
-    name = name.split('.')[-1]
-
-    def exec_callback(ns):
-        ns['__module__'] = module['__name__']
-        ns['__qualname__'] = __qualname__
-        if doc is not None:
-            ns['__doc__'] = doc
-        callback(attrs(ns))
-        return ns
-
-    bases, kwds = args
-    cls = new_class(name, bases, kwds, exec_callback)
-    # super() needs this.
-    class_cell.cell_contents = cls
-    return cls
-
-
-def _class_cell(wrapped_callback):
-    sentinel = object()
-    callback = wrapped_callback(sentinel)
-    # new_class() isn't setting the __class__ cell for super() for some reason.
-    class_cell = dict(zip(callback.__code__.co_freevars, callback.__closure__))['__class__']
-    # Not sure if it's always this easy to find the right cell.
-    assert class_cell.cell_contents is sentinel
-    # Empty the cell so we get the proper error in case it's used too soon.
-    del class_cell.cell_contents
-    return class_cell, callback
-
-
 def _decorate(decorators, callable):
     for decorator in reversed(decorators):
         callable = _expand_ns(decorator), callable
@@ -216,31 +472,30 @@ def _is_str(s):
             pass
 
 
-def function(qualname, fn, doc=None, annotations=None, dict_=()):
-    """Enhances a Hissp lambda with function metadata.
-
-    Replaces __code__ with co_name set to name.
-    Assigns __doc__, __name__, __qualname__, and __annotations__.
-    Then updates __dict__.
+def import_(*specs):
     """
-    name = qualname.split('.')[-1]
-    fn.__code__ = fn.__code__.replace(co_name=name)
-    fn.__doc__ = doc
-    fn.__name__ = name
-    fn.__qualname__ = qualname
-    fn.__annotations__ = annotations or {}
-    fn.__dict__.update(dict_)
-    return fn
+    import: a.b c :as d
 
+    Add a :lazy anywhere to defer loading each module until first
+    attribute access.
 
-def import_(*specs):
+    import: numpy :as np  pandas :as pd  :lazy
+    """
+    lazy = ':lazy' in specs
     pairs = []
-    specs = iter(specs)
+    specs = iter(spec for spec in specs if spec != ':lazy')
     for spec in specs:
         if spec != ":as":
             pairs.append([spec.split('.')[0], spec])
         else:
             pairs[-1][0] = next(specs)
+    if lazy:
+        return (_thunk(
+                 *(('.__setitem__',
+                    ('builtins..globals',),
+                    ('quote',k),
+                    (RUNTIME + '_lazy_import', ('quote',v),),)
+                   for k, v in pairs),),)
     return (_thunk(
              *(('.__setitem__',
                 ('builtins..globals',),
@@ -253,8 +508,18 @@ def import_(*specs):
 
 
 def from_(name, import_, *specs):
+    """
+    from: a.b :import c d :as e
+
+    Add a :lazy anywhere after :import to defer loading submodules
+    until first attribute access. (Other names still need name loaded.)
+
+    from: . :import heavy_submodule :lazy
+    """
     if import_ != ':import':
         raise SyntaxError
+    if ':lazy' in specs:
+        return _lazy_from_(name, specs)
     fromlist = []
     pairs = []
     specs = iter(specs)
@@ -277,17 +542,24 @@ def from_(name, import_, *specs):
              'level',len(name)-len(sname),),)
 
 
-def _if_(b, thunk, *elifs, else_=lambda:()):
-    if b:
-        return thunk()
-    elifs = iter(elifs)
-    for elif_ in elifs:
-        thunk = next(elifs)
-        if elif_():
-            return thunk()
-    return else_()
+def _lazy_from_(name, specs):
+    pairs = []
+    specs = iter(spec for spec in specs if spec != ':lazy')
+    for spec in specs:
+        if spec != ":as":
+            pairs.extend([spec,
+                          (RUNTIME + '_lazy_from',
+                           ('quote',name),
+                           ('quote',spec),
+                           ('builtins..globals',),)])
+        else:
+            pairs[-2] = next(specs)
+    return ('.update',
+            ('builtins..globals',),
+            ('dict',':',*pairs),)
 
 
+@pure
 def if_(condition, then, *pairs):
     """
     if: (a<b)
@@ -301,11 +573,13 @@ def if_(condition, then, *pairs):
         print: "nan"
     """
 
-    else_ = ()
+    condition, then, *pairs = map(_expand, (condition, then, *pairs))
+    generator = _suspends((condition, then, *pairs))
+    else_ = otherwise = ()
     if pairs and pairs[-1][0] == ':else':
-        *pairs, else_ = pairs
+        *pairs, otherwise = pairs
         else_ = [
-            ':','else_',_thunk(*else_[1:])
+            ':','else_',_lambda((), otherwise[1:], generator)
         ]
 
     elifs = []
@@ -313,101 +587,56 @@ def if_(condition, then, *pairs):
         if pair[0] != ':elif':
             raise SyntaxError(pair[0])
         elifs.extend([
-            _thunk(pair[1],),
-            _thunk(*pair[2:],)
+            _lambda((), pair[1:2], generator),
+            _lambda((), pair[2:], generator)
         ])
 
     if then[0] != ':then':
         raise SyntaxError(then)
 
-    return (
-        BOOTSTRAP + '_if_',
+    if condition != RUNTIME_GUARD:  # Left for the peephole to resolve.
+        native = _native_if(condition, then, pairs, otherwise)
+        if native:
+            return native
+
+    form = (
+        RUNTIME + ('_if_gen' if generator else '_if_'),
         condition,
-        _thunk(*then[1:]),
+        _lambda((), then[1:], generator),
         *elifs,
         *else_,
     )
+    return _yield_from(form) if generator else form
 
 
-_sentinel = object()
-
-
-def _raise_():
-    raise
-
-
-def _raise_ex(ex):
-    raise ex
-
-
-def _raise_ex_from(ex, from_):
-    raise ex from from_
+def _native_if(condition, then, pairs, otherwise):
+    native = _native(
+        [condition],
+        then[1:],
+        *chain.from_iterable((pair[1:2], pair[2:]) for pair in pairs),
+        otherwise[1:],
+    )
+    if not native:
+        return None
+    code = native.pop()
+    while native:
+        body, condition = native.pop(), native.pop()
+        code = f"({body} if {condition} else {code})"
+    return code
 
 
 def raise_(ex=None, key=_sentinel, from_=_sentinel):
     if ex:
         if key is not _sentinel:
             if key == ':from':
-                return BOOTSTRAP + '_raise_ex_from', ex, from_,
+                return RUNTIME + '_raise_ex_from', ex, from_,
             else:
                 raise SyntaxError(key)
-        return BOOTSTRAP + '_raise_ex', ex
-    return BOOTSTRAP + '_raise'
-
-
-def partition(iterable, n=2, step=None, fillvalue=_sentinel):
-    """
-    Chunks iterable into tuples of length n. (default pairs)
-    >>> list(partition(range(10)))
-    [(0, 1), (2, 3), (4, 5), (6, 7), (8, 9)]
-
-    The remainder, if any, is not included.
-    >>> list(partition(range(10), 3))
-    [(0, 1, 2), (3, 4, 5), (6, 7, 8)]
-
-    Keep the remainder by using a fillvalue.
-    >>> list(partition(range(10), 3, fillvalue=None))
-    [(0, 1, 2), (3, 4, 5), (6, 7, 8), (9, None, None)]
-    >>> list(partition(range(10), 3, fillvalue='x'))
-    [(0, 1, 2), (3, 4, 5), (6, 7, 8), (9, 'x', 'x')]
-
-    The step defaults to n, but can be more to skip elements.
-    >>> list(partition(range(10), 2, 3))
-    [(0, 1), (3, 4), (6, 7)]
-
-    Or less for a sliding window with overlap.
-    >>> list(partition(range(5), 2, 1))
-    [(0, 1), (1, 2), (2, 3), (3, 4)]
-    """
-    step = step or n
-    slices = (islice(iterable, start, None, step) for start in range(n))
-    if fillvalue is _sentinel:
-        return zip(*slices)
-    else:
-        return zip_longest(*slices, fillvalue=fillvalue)
-
-
-def _try_(thunk, *except_, else_=None, finally_=lambda:()):
-    if not all(isinstance(x, tuple)
-               or issubclass(x, BaseException)
-               for x, c in partition(except_)):
-        raise TypeError
-    try:
-        res = thunk()
-    except BaseException as ex:
-        for ex_type, ex_handler in partition(except_):
-            if isinstance(ex, ex_type):
-                return ex_handler(ex)
-        else:
-            raise
-    else:
-        if else_:
-            res = else_()
-    finally:
-        finally_()
-    return res
+        return RUNTIME + '_raise_ex', ex
+    return RUNTIME + '_raise_',
 
 
+@pure
 def try_(expr, *handlers):
     """
     try:
@@ -425,6 +654,8 @@ def try_(expr, *handlers):
       :finally:
         .close: thing
     """
+    expr, *handlers = map(_expand, (expr, *handlers))
+    generator = _suspends((expr, *handlers))
     else_ = ()
     finally_ = ()
     except_ = []
@@ -436,20 +667,29 @@ def try_(expr, *handlers):
             else:
                 arg = 'xAUTO0_'
                 block_start = 2
-            except_.extend([handler[1], ('lambda',(arg,),*handler[block_start:],)])
+            except_.extend([handler[1], _lambda((arg,), handler[block_start:], generator)])
         elif handler[0] == ':else':
             if else_:
                 raise SyntaxError(handler)
-            else_ = 'else_', _thunk(*handler[1:]),
+            else_ = 'else_', _lambda((), handler[1:], generator),
         elif handler[0] == ':finally':
             if finally_:
                 raise SyntaxError(handler)
-            finally_ = 'finally', _thunk(*handler[1:]),
+            finally_ = 'finally_', _lambda((), handler[1:], generator),
         else:
             raise SyntaxError(handler)
-    return (BOOTSTRAP + '_try_', _thunk(expr), *except_, ':', *else_, *finally_,)
+    form = (
+        RUNTIME + ('_try_gen' if generator else '_try_'),
+        _lambda((), [expr], generator),
+        *except_,
+        ':',
+        *else_,
+        *finally_,
+    )
+    return _yield_from(form) if generator else form
 
 
+@pure
 def mask(form):
     case = type(form)
     if case is tuple and form:
@@ -460,7 +700,7 @@ def mask(form):
         if form[0] == 'hebi.basic.._macro_.mask':
             return mask(mask(form[1]))
         return (
-            BOOTSTRAP + 'entuple', ':', *chain.from_iterable(_mask(form)),
+            RUNTIME + 'entuple', ':', *chain.from_iterable(_mask(form)),
         )
     if case is str and not form.startswith(':'):
         return 'quote', _qualify(form)
@@ -500,56 +740,52 @@ def _qualify(symbol):
     return symbol
 
 
-def _begin(*body):
-    return body[-1]
-
-
+@pure
 def begin(*body):
     case = len(body)
     if case == 0:
         return ()
     if case == 1:
         return body[0]
-    return (BOOTSTRAP + '_begin', *body)
-
-
-def _begin0(zero, *body):
-    return zero
+    return (RUNTIME + '_begin', *body)
 
 
+@pure
 def begin0(*body):
     if len(body) == 1:
         return body[0]
-    return (BOOTSTRAP + '_begin0', *body)
-
-
-def _with_(guard, body):
-    with guard() as g:
-        return body(g)
+    return (RUNTIME + '_begin0', *body)
 
 
+@pure
 def with_(guard, *body):
     """
     with: foo:bar :as baz
       frobnicate: baz
     """
-    if len(body) > 2 and body[1] == ':as':
-        return BOOTSTRAP + '_with_', _thunk(guard), ('lambda',(body[2],),*body[3:]),
-    return BOOTSTRAP + '_with_', _thunk(guard), ('lambda',('xAUTO0_',),*body),
-
-
-def _assert_(b):
-    assert b
+    start = 2 if len(body) > 1 and body[0] == ':as' else 0  # Not the target.
+    guard, *body = _expand(guard), *body[:start], *map(_expand, body[start:])
+    return _with(guard, body, _suspends((guard, *body)))
 
 
-def _assert_message(b, thunk):
-    assert b, thunk()
+def _with(guard, body, generator, helper=None):
+    if len(body) > 1 and body[0] == ':as':
+        target, body = body[1], body[2:]
+    else:
+        target = 'xAUTO0_'
+    form = (
+        RUNTIME + (helper or ('_with_gen' if generator else '_with_')),
+        _lambda((), [guard], generator),
+        _lambda((target,), body, generator),
+    )
+    return _yield_from(form) if generator else form
 
 
+@pure
 def assert_(b, *message):
     if message:
-        return BOOTSTRAP + '_assert_message', b, _thunk(*message)
-    return BOOTSTRAP + '_assert_', b
+        return RUNTIME + '_assert_message', b, _thunk(*message)
+    return RUNTIME + '_assert_', b
 
 
 def _flatten_tuples(expr):
@@ -585,63 +821,6 @@ def _flatten_mapping(expr):
         next(expr)
 
 
-def _unpack(target, value):
-    if type(target) is tuple and target:
-        if target[0] == ':,':
-            yield from _unpack_iterable(target, value)
-        if target[0] == ':=':
-            yield from _unpack_mapping(target, value)
-    elif target == '_':
-        pass
-    else:
-        yield value
-
-
-def _unpack_iterable(target, value):
-    ivalue = iter(value)
-    itarget = iter(target)
-    head = next(itarget)
-    assert head == ':,'
-    for t in itarget:
-        if t == ':list':
-            yield from _unpack(next(itarget), list(ivalue))
-        elif t == ':iter':
-            yield from _unpack(next(itarget), ivalue)
-        elif t == ':as':
-            yield from _unpack(next(itarget), value)
-        else:
-            yield from _unpack(t, next(ivalue))
-
-
-def _unpack_mapping(target, value):
-    itarget = iter(target)
-    head = next(itarget)
-    assert head == ':='
-    for t in target:
-        if type(t) is tuple and t[0] == ':default':
-            default = dict(partition(t[1:]))
-            break
-    else:
-        default = {}
-    for t in itarget:
-        if t == ':as':
-            next(itarget)
-            yield value
-        elif type(t) is tuple and t[0] == ':strs':
-            for s in t[1:]:
-                try:
-                    yield value[s]
-                except LookupError:
-                    yield default[s]
-        elif type(t) is tuple and t[0] == ':default':
-            continue
-        else:
-            try:
-                yield from _unpack(t, value[next(itarget)])
-            except LookupError:
-                yield default[t]
-
-
 def _quote_tuple(target):
     head = next(target)
     yield 'quote', head
@@ -669,118 +848,65 @@ def _quote_tuple(target):
 
 
 def _quote_target(target):
-    return (BOOTSTRAP + 'entuple', *_quote_tuple(iter(target)))
+    return (RUNTIME + 'entuple', *_quote_tuple(iter(target)))
 
 
+@pure
 def let(target, be, value, *body):
     if be != ':be':
         raise SyntaxError('Missing :be in !let.')
+    body = tuple(map(_expand, body))
+    generator = _suspends(body)
     if type(target) is tuple:
         parameters = tuple(_flatten_tuples(target))
-        return (
-            ('lambda', parameters, *body),
-            ':', ':*', (BOOTSTRAP + '_unpack', _quote_target(target), value,),
+        form = (
+            _lambda(parameters, body, generator),
+            ':', ':*', (RUNTIME + '_unpack', _quote_target(target), value,),
         )
-    return ('lambda',(target,),*body,), value,
-
-
-def entuple(*xs):
-    return xs
-
-
-def _loop(f):
-    again = False
-
-    def recur(*args, **kwargs):
-        nonlocal again
-        again = True
-        # The recursion thunk.
-        return lambda: f(recur, *args, **kwargs)
-
-    @wraps(f)
-    def wrapper(*args, **kwargs):
-        nonlocal again
-        res = f(recur, *args, **kwargs)
-        while again:
-            again = False
-            res = res()  # when recur is called it must be returned!
-        return res
-
-    return wrapper
+    else:
+        form = _lambda((target,), body, generator), value,
+    return _yield_from(form) if generator else form
 
 
+@pure
 def loop(start, *body):
     """
     !loop: recur: xs 'abc'  ys ''
       if: xs :then: recur(xs[:-1], ys+xs[-1])
         :else: ys
     """
-    return (
-        BOOTSTRAP + '_loop',
-        ('lambda',(start[0],':',*start[1:],),
-         *body),
-    ),
-
-
-class LabeledBreak(BaseException):
-    def handle(self, label=None):
-        """Re-raise self if label doesn't match."""
-        if self.label is None or self.label == label:
-            return
-        else:
-            raise self
-
-    def __init__(self, label=None):
-        self.label = label
-        raise self
-
-
-class LabeledResultBreak(LabeledBreak):
-    def __init__(self, result=None, *results, label=None):
-        if results:
-            self.result = (result,) + results
-        else:
-            self.result = result
-        LabeledBreak.__init__(self, label)
-
-
-class Break(LabeledResultBreak):
-    pass
+    body = tuple(map(_expand, body))
+    generator = _suspends(body)
+    lambda_ = _lambda((start[0], ':', *start[1:],), body, generator)
+    if OPTIMIZE.get() >= 2:
+        form = RUNTIME + ('_run_loop_gen' if generator else '_run_loop'), lambda_
+    else:
+        form = (RUNTIME + ('_loop_gen' if generator else '_loop'), lambda_),
+    return _yield_from(form) if generator else form
 
 
 def break_(*args):
     if args and args[0] and args[0].startswith(':'):
-        return (BOOTSTRAP + 'Break', *args[1:], ':', 'label', args[0])
-    return (BOOTSTRAP + 'Break', *args)
-
-
-class Continue(LabeledBreak):
-    pass
+        return (RUNTIME + 'Break', *args[1:], ':', 'label', args[0])
+    return (RUNTIME + 'Break', *args)
 
 
 def continue_(label=None):
-    return BOOTSTRAP + 'Continue', label
+    return RUNTIME + 'Continue', label
 
 
-def _for_(iterable, body, else_=lambda:(), label=None):
-    try:
-        for e in iterable:
-            try:
-                body(e)
-            except Continue as c:
-                c.handle(label)
-    except Break as b:
-        b.handle(label)
-        # skip else_() on Break
-        return b.result
-    return else_()
+@pure
+def for_(*exprs):
+    start = exprs.index(':in') + 1 if ':in' in exprs else 0  # Not the targets.
+    exprs = (*exprs[:start], *map(_expand, exprs[start:]))
+    return _for(exprs, _suspends(exprs))
 
 
-def for_(*exprs):
+def _for(exprs, generator, helper=None):
     label = 'label', None,
     else_ = ()
     if type(exprs[-1]) is tuple and exprs[-1] and exprs[-1][0] == ':else':
-        else_ = 'else_', _thunk(*exprs[-1][1:])
+        else_ = 'else_', _lambda((), exprs[-1][1:], generator)
         exprs = exprs[:-1]
     iexprs = iter(exprs)
     if type(exprs[0]) is str and exprs[0].startswith(':'):
@@ -790,98 +916,187 @@ def for_(*exprs):
     iterable = next(iexprs)
     *body, = iexprs
     if body and type(body[-1]) is tuple and body[-1] and body[-1][0] == ':else':
-        else_ = 'else_', body.pop()[1:]
+        else_ = 'else_', _lambda((), body.pop()[1:], generator)
     if type(bindings[0]) is str:
-        body = (tuple(bindings), *body)
+        parameters = tuple(bindings)
     else:
-        body = ('xAUTO0_',), ('hebi.basic.._macro_.let', *bindings, ':be', 'xAUTO0_', *body),
-    return (
-        BOOTSTRAP + '_for_',
+        parameters = 'xAUTO0_',
+        body = ('hebi.basic.._macro_.let', *bindings, ':be', 'xAUTO0_', *body),
+    form = (
+        RUNTIME + (helper or ('_for_gen' if generator else '_for_')),
         iterable,
-        ('lambda', *body),
+        _lambda(parameters, body, generator),
         ':',
         *else_,
         *label,
     )
+    return _yield_from(form) if generator else form
 
 
-def runtime(*forms):
-    return ('hebi.basic.._macro_.if_', "(__name__!='<compiler>')",
-            (':then', *forms))
+def yield_(*args):
+    """
+    Makes the enclosing def: a generator, even from inside the body
+    of another macro, like for:, if:, or try:.
+
+    def: evens: xs
+      for: x :in xs
+        if: (x % 2 == 0) :then: yield: x
+
+    yield: :from xs
+    """
+    if not args:
+        return '(yield)'
+    if args[0] == ':from':
+        _, iterable = args
+        return _yield_from(iterable)
+    value, = args
+    return f'(yield {_compile(value)})'
+
 
+def await_(awaitable):
+    """
+    Suspends the enclosing async: def: until awaitable is done.
 
-class attrs(object):
+    async: def: fetch: url
+      !let: response :be await: session.get: url
+        await: response.text:
     """
-    Attribute view proxy of a mapping.
+    return _yield_from((RUNTIME + '_await_', awaitable))
 
-    Provides Lua-like syntactic sugar when the mapping has string
-    keys that are also valid Python identifiers, which is a common
-    occurrence in Python, for example, calling vars() on an object
-    returns such a dict.
 
-    Unlike a SimpleNamespace, an attrs proxy doesn't show the extra
-    magic attrs from the class, and it can write through to any type of
-    mapping.
+def async_(form, *body):
+    """
+    Asynchronous versions of def:, for:, and with:.
 
-    >>> spam = {}
-    >>> atspam = attrs(spam)
+    async: def: main:
+      async: with: connect: :as conn
+        async: for: row :in conn.rows:
+          print: row
+    """
+    head, *args = *form, *body
+    if head == MACRO + 'def_':
+        name, *body = args
+        if _suspends(body, awaits=False):
+            raise SyntaxError('yield: inside async: def: is not supported')
+        return _function_(name, body, coroutine=True)
+    if head == MACRO + 'for_':
+        return _for(args, generator=True, helper='_async_for_')
+    if head == MACRO + 'with_':
+        guard, *body = args
+        return _with(guard, body, generator=True, helper='_async_with_')
+    raise SyntaxError(head)
+
+
+def listcomp(element, *clauses):
+    """
+    Compiles to a native list comprehension.
 
-    get and set string keys as attrs
-    >>> atspam.one = 1
-    >>> atspam.one
-    1
-    >>> atspam
-    attrs({'one': 1})
+    !listcomp: (x * x)
+      :for x :in range: 10
+      :if (x % 2)
 
-    changes write through to underlying dict
-    >>> spam
-    {'one': 1}
+    Targets destructure like !let, and :for and :if clauses can repeat.
 
-    calling the object returns the underlying dict for direct access
-    to all dict methods and syntax
-    >>> list(
-    ...  atspam().items()
-    ... )
-    [('one', 1)]
-    >>> atspam()['one'] = 42
-    >>> atspam()
-    {'one': 42}
+    !listcomp: (k + v)
+      :for :,: k v
+      :in pairs
+      :if k
+    """
+    return f'[{_compile(element)}{_comprehension(clauses)}]'
 
-    del removes the key
-    >>> del atspam.one
-    >>> atspam
-    attrs({})
+
+def setcomp(element, *clauses):
+    """
+    Compiles to a native set comprehension. Clauses as in !listcomp.
     """
+    return f'{{{_compile(element)}{_comprehension(clauses)}}}'
 
-    __slots__ = "mapping"
 
-    def __init__(self, mapping):
-        object.__setattr__(self, "mapping", mapping)
+def dictcomp(key, value, *clauses):
+    """
+    Compiles to a native dict comprehension. Clauses as in !listcomp.
 
-    def __call__(self):
-        return object.__getattribute__(self, "mapping")
+    !dictcomp: k (v * 2)
+      :for :,: k v
+      :in .items: d
+    """
+    return f'{{{_compile(key)}:{_compile(value)}{_comprehension(clauses)}}}'
 
-    def __getattribute__(self, attr):
-        try:
-            return self()[attr]
-        except KeyError as ke:
-            raise AttributeError(*ke.args)
 
-    def __setattr__(self, attr, val):
-        self()[attr] = val
+def genexpr(element, *clauses):
+    """
+    Compiles to a native generator expression. Clauses as in !listcomp.
+    """
+    return f'({_compile(element)}{_comprehension(clauses)})'
+
+
+def _comprehension(clauses):
+    code = []
+    iclauses = iter(clauses)
+    for clause in iclauses:
+        if clause == ':for':
+            target = next(iclauses)
+            if next(iclauses) != ':in':
+                raise SyntaxError('Missing :in in comprehension.')
+            iterable = _compile(next(iclauses))
+            native = _native_target(target)
+            if native:
+                code.append(f'\nfor {native} in {iterable}')
+            else:
+                parameters = ','.join(_flatten_tuples(target))
+                parameters = f'({parameters},)' if parameters else '()'
+                unpack = _compile((RUNTIME + '_unpack', _quote_target(target), 'xAUTO0_'))
+                code.append(f'\nfor xAUTO0_ in {iterable}\nfor {parameters} in [{unpack}]')
+        elif clause == ':if':
+            code.append(f'\nif {_compile(next(iclauses))}')
+        else:
+            raise SyntaxError(clause)
+    if not code or not code[0].startswith('\nfor'):
+        raise SyntaxError('A comprehension must start with :for.')
+    return ''.join(code)
+
+
+def _native_target(target):
+    """The target as Python, if it only needs Python's own unpacking."""
+    if type(target) is str:
+        return target if target.isidentifier() else None
+    if type(target) is not tuple or target[:1] != (':,',) or len(target) < 2:
+        return None
+    if ':list' in target[1:-2]:  # Like !let, it takes the rest, so only native last.
+        return None
+    items = []
+    itarget = iter(target[1:])
+    for t in itarget:
+        if t == ':list':
+            t = next(itarget)
+            if type(t) is not str or not t.isidentifier():
+                return None
+            items.append('*' + t)
+            continue
+        native = _native_target(t)
+        if not native:
+            return None
+        items.append(native)
+    return f'({",".join(items)},)'
 
-    def __delattr__(self, attr):
-        try:
-            del self()[attr]
-        except KeyError as ke:
-            raise AttributeError(*ke.args)
 
-    def __repr__(self):
-        return "attrs(" + repr(self()) + ")"
+@pure
+def runtime(*forms):
+    return ('hebi.basic.._macro_.if_', "(__name__!='<compiler>')",
+            (':then', *forms))
 
 
+@pure
 def of(*exprs):
+    """
+    !of: 'key' 1 .attr obj
+
+    Keys apply from the right, so that's obj.attr[1]['key'], and at
+    optimization level 2, it's compiled to that native Python.
+    """
     *keys, collection = exprs
+    if OPTIMIZE.get() >= 2:
+        return _native_of(keys, collection)
     for key in reversed(keys):
         if type(key) is str and key.startswith('.'):
             collection = ('builtins..getattr', collection, ('quote', key[1:]),)
@@ -890,17 +1105,26 @@ def of(*exprs):
     return collection
 
 
-def _attach(target, **kwargs):
-    for k, v in kwargs.items():
-        setattr(target, k, v)
-    return target
+def _native_of(keys, collection):
+    code = f'({_compile(collection)})'
+    for key in reversed(keys):
+        if type(key) is str and key.startswith('.'):
+            name = key[1:]
+            if name.isidentifier() and not iskeyword(name):
+                code += key
+            else:
+                code = f"__import__('builtins').getattr({code},{name!r})"
+        else:
+            code += f'[{_compile(key)}]'
+    return code
 
 
+@pure
 def attach(target, *args):
     iargs = iter(args)
     args = takewhile(lambda a: a!=':', iargs)
     return (
-        BOOTSTRAP + '_attach',
+        RUNTIME + '_attach',
         target,
         ':',
         *chain.from_iterable((a, a) for a in args),
@@ -910,7 +1134,7 @@ def attach(target, *args):
 
 def del_(*args):
     return (
-        BOOTSTRAP + 'begin',
+        RUNTIME + '_begin',
         *_del_(args),
         (),
     )
@@ -0,0 +1,132 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Build mode: compiling a module without running all of it.
+
+The Hissp compiler evaluates each top-level form as it goes, so the
+macros a module defines are there for the rest of it. That also runs
+everything else, like connecting to databases. In build mode, the
+compiler only evaluates the forms macro expansion might need: those
+that mention the module's own _macro_ namespace, and what they use.
+"""
+
+import re
+from collections import defaultdict
+
+MACRO = 'hebi.basic.._macro_.'
+DEFINES = {MACRO + 'def_', MACRO + 'class_', MACRO + 'record'}
+MACRO_NAMESPACE = re.compile(r"(?<![.\w])_macro_\b")  # Not qualified.
+NAME = re.compile(r"[A-Za-z_]\w*")
+QUALIFIED = re.compile(r"([A-Za-z_][\w.]*)\.\.")
+
+
+def needed(forms):
+    """
+    The indices of the top-level forms that build mode evaluates.
+
+    These mention _macro_ (like defining a macro, or importing a
+    _macro_ namespace), or are def:, class:, !record, import:, or from:
+    forms binding a name that another needed form mentions. Helpers
+    that macros call at expansion time have to be bound by these at
+    the top level, or they won't be there.
+    """
+    binders = defaultdict(list)
+    for index, form in enumerate(forms):
+        for name in _binds(form):
+            binders[name].append(index)
+    result = {i for i, form in enumerate(forms) if _mentions(form, MACRO_NAMESPACE)}
+    pending = [*result]
+    seen = set()
+    while pending:
+        names = _names(forms[pending.pop()]) - seen
+        seen |= names
+        for name in names:
+            for index in binders.get(name, ()):
+                if index not in result:
+                    result.add(index)
+                    pending.append(index)
+    return result
+
+
+def imports(forms):
+    """
+    The modules forms name, which compiling them may import.
+
+    These are the modules of qualified symbols (like macro heads), and
+    those of import: and from: forms, including the names from: imports,
+    in case they're submodules. Relative names keep their leading dots.
+    Some may not be modules at all.
+    """
+    names = set()
+    pending = [*forms]
+    while pending:
+        form = pending.pop()
+        if type(form) is str:
+            qualified = QUALIFIED.match(form)
+            if qualified:
+                names.add(qualified[1])
+        elif type(form) is tuple and form:
+            head = form[0]
+            if head == MACRO + 'import_':
+                names.update(_imported(form[1:], lambda spec: spec, rename=False))
+            elif head == MACRO + 'from_' and len(form) > 2 and type(form[1]) is str:
+                module = form[1]
+                names.add(module)
+                separator = '' if module.endswith('.') else '.'
+                names.update(
+                    module + separator + name
+                    for name in _imported(form[3:], lambda spec: spec, rename=False)
+                )
+            pending.extend(form)
+    return names
+
+
+def _binds(form):
+    """The global names a top-level form defines, if it's a definition."""
+    if type(form) is not tuple or len(form) < 2:
+        return set()
+    head = form[0]
+    if head == MACRO + 'async_' and type(form[1]) is tuple:
+        return _binds((*form[1], *form[2:]))
+    if head in DEFINES:
+        name = form[1][0] if type(form[1]) is tuple and form[1] else form[1]
+        return {name.split('.')[0]} if type(name) is str else set()
+    if head == MACRO + 'import_':
+        return _imported(form[1:], lambda spec: spec.split('.')[0])
+    if head == MACRO + 'from_':
+        return _imported(form[3:], lambda spec: spec)
+    return set()
+
+
+def _imported(specs, name, rename=True):
+    """The names import: or from: specs bind, or, without rename, import."""
+    names = []
+    specs = iter(spec for spec in specs if spec != ':lazy')
+    for spec in specs:
+        if spec == ':as':
+            alias = next(specs, None)
+            if rename:
+                names[-1] = alias
+        elif type(spec) is str:
+            names.append(name(spec))
+    return set(names)
+
+
+def _names(form):
+    names = set()
+    pending = [form]
+    while pending:
+        form = pending.pop()
+        if type(form) is tuple:
+            pending.extend(form)
+        elif type(form) is str:
+            names.update(NAME.findall(form))
+    return names
+
+
+def _mentions(form, pattern):
+    if type(form) is tuple:
+        return any(_mentions(f, pattern) for f in form)
+    return type(form) is str and bool(pattern.search(form))
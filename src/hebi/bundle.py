@@ -0,0 +1,231 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Bundles a Hebigo application into a single zipapp.
+
+Starting from the entry module, each module it reaches is compiled
+(.hebi in build mode) and scanned for what it imports, including the
+__import__() calls compiled Hebigo makes, and those in the search
+paths (or in hebi, like hebi.runtime) are bundled, too. Anything else
+must be installed wherever the bundle runs.
+
+All the code objects go in one member of the archive, with an index
+of module names, which the bundle's __main__ reads once. Its importer,
+first on sys.meta_path, then finds bundled modules with a dict lookup,
+without any path search, stat, or open.
+"""
+
+import ast
+import marshal
+import sys
+import zipfile
+from importlib.machinery import ModuleSpec
+from importlib.util import resolve_name
+from pathlib import Path
+
+from hebi import build
+from hebi.parser import lex, parse, transpile_code
+from hebi.sourcemap import SourceMap
+
+HEBI = Path(__file__).parent
+IMPORTERS = {"__import__", "import_module", "_lazy_import", "_lazy_from"}
+
+MAIN = '''\
+import marshal
+import sys
+from importlib.machinery import ModuleSpec
+
+
+class BundleImporter:
+    """Imports the bundled modules from their code, by the index."""
+
+    def __init__(self, archive, index, code):
+        self.archive = archive
+        self.index = index
+        self.code = code
+
+    def find_spec(self, name, path=None, target=None):
+        if name in self.index:
+            ispkg, _, _, filename = self.index[name]
+            origin = f"{{self.archive}}/{{filename}}"
+            spec = ModuleSpec(name, self, origin=origin, is_package=ispkg)
+            spec.has_location = True
+            return spec
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module):
+        exec(self.get_code(module.__name__), vars(module))
+
+    def get_code(self, name):
+        _, start, stop, _ = self.index[name]
+        return marshal.loads(self.code[start:stop])
+
+    def get_source(self, name):
+        return None
+
+    def is_package(self, name):
+        return self.index[name][0]
+
+
+index, code = marshal.loads(__loader__.get_data(__loader__.archive + "/modules"))
+sys.meta_path.insert(0, BundleImporter(__loader__.archive, index, code))
+del index, code
+
+import runpy
+
+runpy.run_module({entry!r}, run_name="__main__", alter_sys=True)
+'''
+
+
+def bundle(entry, out, paths=(".",), optimize=0, python="/usr/bin/env python3"):
+    """
+    Writes a zipapp running the module named entry, from paths.
+
+    Returns the names of the modules bundled. The optimize level is
+    Hebigo's (see hebi.parser.optimize_context).
+    """
+    bundler = Bundler(paths, optimize)
+    sys.path[:0] = map(str, bundler.paths)
+    sys.meta_path.insert(0, bundler)
+    try:
+        bundler.add(entry)
+    finally:
+        sys.meta_path.remove(bundler)
+        del sys.path[: len(bundler.paths)]
+    if entry not in bundler.reached:
+        raise ModuleNotFoundError(f"No module named {entry!r} in {paths}", name=entry)
+    index, chunks, start = {}, [], 0
+    for name in sorted(bundler.reached):
+        code, ispkg, filename, _ = bundler.modules[name]
+        chunks.append(marshal.dumps(code))
+        index[name] = ispkg, start, start + len(chunks[-1]), filename
+        start += len(chunks[-1])
+    with open(out, "wb") as f:
+        if python:
+            f.write(f"#!{python}\n".encode())
+        with zipfile.ZipFile(f, "w") as archive:
+            archive.writestr("__main__.py", MAIN.format(entry=entry))
+            archive.writestr("modules", marshal.dumps((index, b"".join(chunks))))
+    Path(out).chmod(0o755)
+    return [*index]
+
+
+class Bundler:
+    """
+    Compiles modules, and finds what they reach at run time.
+
+    Compiling a .hebi module first compiles the modules its source
+    names, since its macros may import them, but those are bundled
+    only if something reaches them at run time. Meanwhile, the Bundler
+    is also a meta path finder for the .hebi modules it has compiled.
+    """
+
+    def __init__(self, paths, optimize=0):
+        self.paths = [Path(path).resolve() for path in paths]
+        self.optimize = optimize
+        self.modules = {}  # name: (code, ispkg, filename, imports)
+        self.reached = set()
+        self._compiling = set()
+        self._hebi = {}  # name: package directory, or None
+
+    def find(self, name):
+        """The source path of a module to bundle, if it's a package, and its root."""
+        parts = name.split(".")
+        for root in [HEBI.parent] if parts[0] == "hebi" else self.paths:
+            base = root.joinpath(*parts)
+            for path, ispkg in [
+                (base / "__init__.hebi", True),
+                (base / "__init__.py", True),
+                (base.parent / f"{parts[-1]}.hebi", False),
+                (base.parent / f"{parts[-1]}.py", False),
+            ]:
+                if path.is_file():
+                    return path, ispkg, root
+
+    def add(self, name, reached=True):
+        """Compiles the module, if it's ours, and marks what it reaches."""
+        if name and name not in self.modules and name not in self._compiling:
+            self._compile(name)
+        if reached and name in self.modules and name not in self.reached:
+            self.reached.add(name)
+            for module in self.modules[name][3]:
+                self.add(module)
+
+    def _compile(self, name):
+        found = self.find(name)
+        if not found:
+            return
+        path, ispkg, root = found
+        self._compiling.add(name)
+        parent = name.rpartition(".")[0]
+        package = name if ispkg else parent
+        source = path.read_text()
+        if path.suffix == ".hebi":
+            for module in build.imports(parse(lex(source))):
+                module = _resolve(module, package)
+                if module.partition(".")[0] != "hebi":  # Installed anyway.
+                    self.add(module, reached=False)
+            smap = SourceMap(path.name)
+            python = transpile_code(source, name, self.optimize, smap, build=True)
+            tree = smap.read(python).remap(ast.parse(python))
+            self._hebi[name] = str(path.parent) if ispkg else None
+        else:
+            tree = ast.parse(source)
+        filename = str(path.relative_to(root))
+        imports = {parent, *_imports(tree, package)}
+        self.modules[name] = compile(tree, filename, "exec"), ispkg, filename, imports
+
+    def find_spec(self, name, path=None, target=None):
+        if name in self._hebi and name in self.modules:
+            spec = ModuleSpec(name, self, is_package=self.modules[name][1])
+            if self._hebi[name]:
+                spec.submodule_search_locations = [self._hebi[name]]
+            return spec
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module):
+        exec(self.modules[module.__name__][0], vars(module))
+
+
+def _imports(tree, package):
+    """Modules a module's ast may import, and some that aren't."""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            yield from (alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            module = _resolve("." * node.level + (node.module or ""), package)
+            yield module
+            yield from (f"{module}.{alias.name}" for alias in node.names)
+        elif (
+            isinstance(node, ast.Call)
+            and getattr(node.func, "id", getattr(node.func, "attr", None)) in IMPORTERS
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+            and type(node.args[0].value) is str
+        ):
+            keywords = {k.arg: k.value for k in node.keywords}
+            level = keywords.get("level")
+            level = level.value if isinstance(level, ast.Constant) else 0
+            module = _resolve("." * level + node.args[0].value, package)
+            yield module
+            names = keywords.get("fromlist", node.args[1] if len(node.args) > 1 else None)
+            try:
+                names = ast.literal_eval(names) if names else ()
+            except ValueError:
+                continue
+            if type(names) is str:
+                names = [names]
+            yield from (f"{module}.{name}" for name in names if type(name) is str)
+
+
+def _resolve(name, package):
+    try:
+        return resolve_name(name, package) if name.startswith(".") else name
+    except ImportError:
+        return ""
@@ -0,0 +1,309 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Compiles Hissp forms straight to Python ast nodes.
+
+The Hissp compiler builds Python source text, which compile() then has
+to tokenize and parse all over again. AstCompiler expands forms the
+same way (macros, peephole, runtime: guards) but builds the ast
+itself, so its output goes straight to compile(). Only Python
+injections are still text, and each is parsed on its own.
+"""
+
+import ast
+import pickle
+import pickletools
+import re
+import sys
+from contextlib import suppress
+from importlib import import_module
+from itertools import takewhile
+from keyword import iskeyword
+
+from hissp import compiler
+from hissp.compiler import PAIR_WORDS, CompileError, pairs, trace
+
+from hebi.parser import _NOT_MACRO, Compiler, lex, optimize_context, parse, qualify_context
+from hebi.peephole import Peephole
+
+# Not complex: Hissp round-trips those through repr, which loses -0j.
+CONSTANT = frozenset({str, bytes, int, float, bool, type(None), type(...)})
+NAMED_CONSTANTS = {"None": None, "True": True, "False": False}
+INJECTION = re.compile(r"^\.\.|[ ()]")  # Same test as Hissp's.
+LOAD = ast.Load()
+_unparse = getattr(ast, "unparse", ast.dump)  # Python 3.9+, or just the tree.
+
+
+def _at(line):
+    # Columns unknown: tracebacks won't show carets.
+    return dict(lineno=line, end_lineno=line, col_offset=-1, end_col_offset=-1)
+
+
+def _index(index):
+    # Python 3.8 wants a subscript's index wrapped.
+    return ast.Index(index) if sys.version_info < (3, 9) else index
+
+
+class AstCompiler(Compiler):
+    """
+    Like Compiler, but compile() returns an ast.Module, and code()
+    a code object. Forms located by a SourceMap get their .hebi line
+    numbers, and the rest get their enclosing form's.
+
+    Nodes are located as they're built, which is much cheaper than
+    ast.fix_missing_locations() afterwards.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._at = _at(1)
+
+    def compile(self, forms) -> ast.Module:
+        return ast.Module([*self._statements(forms)], [])
+
+    def code(self, forms, filename="<Hissp>", mode="exec"):
+        """
+        Compiles forms to a code object, for exec().
+
+        In "single" mode, like the REPL, each expression's value is
+        printed (by sys.displayhook) unless it is None. In "eval" mode,
+        forms must be one form, for eval() to return the value of.
+        """
+        body = [*self._statements(forms)]
+        if mode == "eval":
+            [statement] = body
+            module = ast.Expression(statement.value)
+        elif mode == "single":
+            module = ast.Interactive(body)
+        else:
+            module = ast.Module(body, [])
+        return compile(module, filename, mode)
+
+    def _statements(self, forms):
+        for node in self.compile_each(forms):
+            yield ast.Expr(node, **_at(node.lineno))
+
+    def eval(self, node):
+        if not self.evaluate:
+            return
+        try:
+            eval(compile(ast.Expression(node), "<Hissp>", "eval"), self.ns)
+        except Exception as e:
+            python = _unparse(node)
+            print("Exception when evaluating form:")
+            print(python)
+            raise CompileError(f"\n{python!r}") from e
+
+    def form(self, form) -> ast.expr:
+        if self.source_map is not None:
+            position = self.source_map.position(form)
+            if position:
+                enclosing, self._at = self._at, _at(position[0])
+                try:
+                    return self._form(form)
+                finally:
+                    self._at = enclosing
+        return self._form(form)
+
+    def _form(self, form):
+        if self.peephole:
+            form = self.peephole(form)
+        return compiler.Compiler.form(self, form)
+
+    @trace
+    def invocation(self, form: tuple) -> ast.expr:
+        with self.macro_context():
+            expansion = self.expand(form)
+            if expansion is not _NOT_MACRO:
+                return self.form(expansion)
+        return self.call(form)
+
+    def _qualified_macro(self, head):
+        return _qualified(head)
+
+    def quoted(self, form) -> ast.expr:
+        if type(form) in CONSTANT:
+            return ast.Constant(form, **self._at)
+        literal = f"({form!r})" if type(form) is complex else repr(form)
+        with suppress(ValueError, SyntaxError):
+            if ast.literal_eval(literal) == form:
+                return self._parse(literal)
+        return self.pickle(form)
+
+    @trace
+    def pickle(self, form) -> ast.expr:
+        at = self._at
+        dumps = pickletools.optimize(pickle.dumps(form))
+        loads = ast.Attribute(self._import("pickle"), "loads", LOAD, **at)
+        return ast.Call(loads, [ast.Constant(dumps, **at)], [], **at)
+
+    def function(self, form: tuple) -> ast.expr:
+        _, parameters, *body = form
+        arguments = self.parameters(parameters)
+        if arguments is None:
+            return self.text(form)
+        return ast.Lambda(arguments, self.body(body), **self._at)
+
+    def text(self, form) -> ast.expr:
+        """Compiles form as text and parses it, for anything unusual."""
+        return self._parse(Compiler(self.qualname, self.ns, evaluate=False).form(form))
+
+    @trace
+    def parameters(self, parameters: tuple):
+        """
+        The ast.arguments for a lambda's parameters tuple.
+
+        Returns None if they aren't all plain names, or are out of
+        order, so the caller can fall back to parsing them.
+        """
+        at = self._at
+        positional, defaults, keyword, keyword_defaults = [], [], [], []
+        posonly, vararg, kwarg, star = [], None, None, False
+        parameters = iter(parameters)
+        for name in takewhile(lambda a: a != ":", parameters):
+            if name == "/" and not posonly and not star:
+                posonly, positional = positional, []
+            elif _is_name(name) and not defaults:
+                (keyword if star else positional).append(ast.arg(name, **at))
+                if star:
+                    keyword_defaults.append(None)
+            else:
+                return None
+        for k, v in pairs(parameters):
+            if kwarg or not (_is_name(k) or k in {":*", ":**"}):
+                return None
+            if k == ":*":
+                if star or v != ":?" and not _is_name(v):
+                    return None
+                star = True
+                vararg = None if v == ":?" else ast.arg(v, **at)
+            elif k == ":**":
+                if not _is_name(v):
+                    return None
+                kwarg = ast.arg(v, **at)
+            elif star:
+                keyword.append(ast.arg(k, **at))
+                keyword_defaults.append(None if v == ":?" else self.form(v))
+            elif v == ":?":
+                if defaults:
+                    return None
+                positional.append(ast.arg(k, **at))
+            else:
+                positional.append(ast.arg(k, **at))
+                defaults.append(self.form(v))
+        return ast.arguments(
+            posonly, positional, vararg, keyword, keyword_defaults, kwarg, defaults
+        )
+
+    @trace
+    def body(self, body: list) -> ast.expr:
+        at = self._at
+        if len(body) > 1:
+            items = ast.Tuple([*map(self.form, body)], LOAD, **at)
+            return ast.Subscript(items, _index(ast.Constant(-1, **at)), LOAD, **at)
+        if not body:
+            return ast.Tuple([], LOAD, **at)
+        return self.form(body[0])
+
+    @trace
+    def call(self, form: tuple) -> ast.expr:
+        head = form[0]
+        method = type(head) is str and head.startswith(".")
+        names = form[form.index(":") + 1 :: 2] if ":" in form else ()
+        if method:
+            names = (*names, *head[1:].split("."))
+        if not all(_is_name(k) or k in PAIR_WORDS for k in names):
+            return self.text(form)
+        at = self._at
+        form = iter(form[1:])
+        function = None if method else self.form(head)
+        args = [*map(self.form, takewhile(lambda a: a != ":", form))]
+        keywords = []
+        for k, v in pairs(form):
+            value = self.form(v)
+            if k == ":*":
+                args.append(ast.Starred(value, LOAD, **at))
+            elif k == ":**":
+                keywords.append(ast.keyword(None, value, **at))
+            elif k == ":?":
+                args.append(value)
+            else:
+                keywords.append(ast.keyword(k, value, **at))
+        if method:
+            function = self._attributes(args.pop(0), head[1:].split("."))
+        return ast.Call(function, args, keywords, **at)
+
+    @trace
+    def symbol(self, symbol: str) -> ast.expr:
+        at = self._at
+        if INJECTION.search(symbol):
+            return self._parse(symbol)
+        if ".." in symbol:
+            module, attributes = symbol.split("..", 1)
+            first, *rest = attributes.split(".")
+            if module == self.qualname:  # This module. No import required.
+                globals_ = ast.Call(ast.Name("globals", LOAD, **at), [], [], **at)
+                item = ast.Subscript(globals_, _index(ast.Constant(first, **at)), LOAD, **at)
+                return self._attributes(item, rest)
+            return self._attributes(self._import(module), [first, *rest])
+        if symbol in NAMED_CONSTANTS:
+            return ast.Constant(NAMED_CONSTANTS[symbol], **at)
+        first, *rest = symbol.split(".")
+        if _is_name(first) and all(map(str.isidentifier, rest)):
+            return self._attributes(ast.Name(first, LOAD, **at), rest)
+        return self._parse(symbol)
+
+    def _parse(self, python):
+        """An expression's ast, moved to the current line."""
+        node = ast.parse(python, mode="eval").body
+        if self._at["lineno"] != 1:
+            ast.increment_lineno(node, self._at["lineno"] - 1)
+        return node
+
+    def _import(self, module):
+        at = self._at
+        fromlist = [ast.keyword("fromlist", ast.Constant("?", **at), **at)]
+        return ast.Call(
+            ast.Name("__import__", LOAD, **at),
+            [ast.Constant(module, **at)],
+            fromlist if "." in module else [],
+            **at,
+        )
+
+    def _attributes(self, node, names):
+        for name in names:
+            node = ast.Attribute(node, name, LOAD, **self._at)
+        return node
+
+
+def module_code(hebigo, qualname, filename="<hebi>", optimize=0, **kwargs):
+    """
+    Compiles Hebigo source to a module code object.
+
+    Like transpile_module, but the Python is never text. Other keyword
+    arguments go to the AstCompiler.
+    """
+    with qualify_context(qualname), optimize_context(optimize):
+        peephole = Peephole() if optimize else None
+        compiler = AstCompiler(qualname, peephole=peephole, **kwargs)
+        return compiler.code(parse(lex(hebigo)), filename)
+
+
+def _is_name(name):
+    return type(name) is str and name.isidentifier() and not iskeyword(name)
+
+
+def _qualified(symbol):
+    """
+    The object a qualified symbol names, like Hissp's eval of it.
+
+    (Without fromlist='?', which makes __import__ search for a
+    submodule named "?" every time.)
+    """
+    module, attributes = symbol.split("..", 1)
+    obj = import_module(module)
+    for name in attributes.split("."):
+        obj = getattr(obj, name)
+    return obj
@@ -0,0 +1,131 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Ahead-of-time compilation of Hebigo packages to bytecode.
+
+Like the standard library's compileall, but for .hebi files, which are
+transpiled (in build mode, unless asked to run everything) and then
+byte-compiled, so importing them never compiles anything.
+
+The .pyc files are hash-based (PEP 552) and unchecked by default, so
+the import system never even reads the source to validate them, which
+suits read-only deployments. (Recompile after changing the source.)
+By default, they go in __pycache__ next to the transpiled .py files.
+Sourceless, each is a .pyc next to its .hebi instead, and no .py is
+written at all. Its code then has .hebi line numbers, for tracebacks.
+"""
+
+import ast
+import marshal
+import sys
+from importlib import invalidate_caches
+from importlib.util import MAGIC_NUMBER, cache_from_source, source_hash
+from pathlib import Path
+
+from hebi.parser import transpile_code
+from hebi.sourcemap import SourceMap
+
+
+def compile_dir(
+    root,
+    optimize=0,
+    levels=(sys.flags.optimize,),
+    sourceless=False,
+    build=True,
+    checked=False,
+):
+    """
+    Compiles every .hebi file under root. Yields the paths written.
+
+    If root is a package (it has an __init__.py or __init__.hebi), the
+    module names start with its name. Its parent directory (or root
+    itself, otherwise) is on sys.path while compiling, so that macros
+    can import the modules compiled before them. A module that fails
+    (say, using macros from one not compiled yet) is retried after the
+    rest, until a round makes no progress. The optimize level is
+    Hebigo's (see hebi.parser.optimize_context), and levels are the
+    bytecode optimization levels (like python -O) to write .pyc for.
+    """
+    root = Path(root)
+    base = _base(root)
+    sys.path.insert(0, str(base))
+    try:
+        pending = sorted(root.rglob("*.hebi"))
+        while pending:
+            failed = []
+            for path in pending:
+                try:
+                    written = compile_file(
+                        path,
+                        _qualname(path.relative_to(base)),
+                        optimize,
+                        levels,
+                        sourceless,
+                        build,
+                        checked,
+                    )
+                except Exception as e:
+                    failed.append((path, e))
+                    continue
+                yield from written
+            if len(failed) == len(pending):
+                raise failed[0][1]
+            pending = [path for path, _ in failed]
+            invalidate_caches()  # Finders may have listed the directory already.
+    finally:
+        sys.path.remove(str(base))
+
+
+def compile_file(
+    path,
+    qualname,
+    optimize=0,
+    levels=(sys.flags.optimize,),
+    sourceless=False,
+    build=True,
+    checked=False,
+):
+    """Compiles one .hebi file, as in compile_dir(). Returns the paths written."""
+    path = Path(path)
+    hebigo = path.read_bytes()
+    if sourceless:
+        smap = SourceMap(path.name)
+        python = transpile_code(hebigo.decode(), qualname, optimize, smap, build)
+        tree = smap.read(python).remap(ast.parse(python))
+        out = path.with_suffix(".pyc")
+        code = compile(tree, str(path), "exec", optimize=levels[-1])
+        out.write_bytes(_pyc(code, hebigo, checked))
+        return [out]
+    py = path.with_suffix(".py")
+    source = transpile_code(hebigo.decode(), qualname, optimize, build=build).encode()
+    py.write_bytes(source)
+    written = [py]
+    for level in levels:
+        out = Path(cache_from_source(py, optimization=level or ""))
+        out.parent.mkdir(exist_ok=True)
+        code = compile(source, str(py), "exec", optimize=level)
+        out.write_bytes(_pyc(code, source, checked))
+        written.append(out)
+    return written
+
+
+def _pyc(code, source, checked=False):
+    """A hash-based .pyc. If checked, importing compares the source's hash."""
+    flags = 0b11 if checked else 0b01
+    return MAGIC_NUMBER + flags.to_bytes(4, "little") + source_hash(source) + marshal.dumps(code)
+
+
+def _base(root):
+    """The sys.path entry for root, which may be a package."""
+    if any((root / f"__init__{suffix}").exists() for suffix in [".py", ".hebi"]):
+        return root.parent
+    return root
+
+
+def _qualname(relative):
+    parts = relative.with_suffix("").parts
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    return ".".join(parts)
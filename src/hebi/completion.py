@@ -0,0 +1,207 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Completion and inspection for the kernel, from an index of names.
+
+Frontends ask for completions on every keystroke, so the Index keeps
+the names it completes from in sorted lists, where finding those with
+a prefix is a binary search and a slice. After each execution, update()
+sorts in (or out) only the names that changed in the namespace and its
+_macro_ namespace. Cells' tasks may be changing those on the executor's
+thread, so it works from snapshots. A module's attributes are indexed
+the first time they're completed, and again only if their number
+changes.
+
+Symbols complete like Hebigo reads them: names from the namespace,
+its macros, builtins, and the reserved-word hotwords; !name for the
+basic macros; module..name for modules already imported; and dotted
+attributes of those.
+"""
+
+import builtins
+import inspect
+import re
+import sys
+from bisect import bisect_left, insort
+from types import ModuleType
+
+from hissp.compiler import MACROS
+
+from hebi.basic import _macro_ as basic
+from hebi.parser import _RESERVED_MACROS
+
+BEFORE = re.compile(r"!?[\w.]*$")  # The symbol being typed.
+AFTER = re.compile(r"[\w.]*")  # The rest of the symbol, after the cursor.
+_LAST = "\U0010ffff"  # Sorts after any name character.
+_MISSING = object()
+
+
+class Names:
+    """A sorted list of names, for prefix search."""
+
+    def __init__(self, names=()):
+        self.names = sorted(names)
+
+    def update(self, added, removed):
+        if len(added) + len(removed) > len(self.names) // 8:
+            self.names = sorted({*self.names} - removed | added)
+            return
+        for name in removed:
+            del self.names[bisect_left(self.names, name)]
+        for name in added:
+            insort(self.names, name)
+
+    def starting(self, prefix):
+        """The names starting with prefix, in order."""
+        start = bisect_left(self.names, prefix)
+        return self.names[start : bisect_left(self.names, prefix + _LAST, start)]
+
+
+BUILTINS = Names(name for name in dir(builtins) if not name.startswith("_"))
+HOTWORDS = Names(_RESERVED_MACROS)
+BASIC = Names(basic.__all__)
+
+
+class Index:
+    """Completes and inspects symbols from the names in the namespace."""
+
+    def __init__(self, ns):
+        self.ns = ns
+        self.globals = Names()
+        self.macros = Names()
+        self._globals = set()
+        self._macros = set()
+        self._modules = {}  # Name: (number of attributes, Names).
+        self.update()
+
+    def update(self):
+        """Indexes what the namespace and its macros gained or lost."""
+        self._globals = self._update(self.globals, self._globals, _keys(self.ns))
+        macros = self.ns.get(MACROS)
+        keys = _keys(vars(macros)) if macros else set()
+        self._macros = self._update(self.macros, self._macros, keys)
+
+    @staticmethod
+    def _update(names, known, keys):
+        added = keys - known
+        # By the sizes, when nothing was removed, which is the usual case.
+        removed = known - keys if len(known) + len(added) != len(keys) else set()
+        if added or removed:
+            names.update(added, removed)
+            known |= added
+            known -= removed
+        return known
+
+    def complete(self, code, cursor):
+        """The matches to replace code[start:cursor] with, and start."""
+        token = BEFORE.search(code, 0, cursor)[0]
+        return self._complete(token), cursor - len(token)
+
+    def _complete(self, token):
+        if token.startswith("!"):
+            return ["!" + name for name in BASIC.starting(token[1:])]
+        if ".." in token:
+            module, _, attributes = token.partition("..")
+            if module not in sys.modules:
+                return []  # Don't import for completion.
+            obj = sys.modules[module]
+            *path, prefix = attributes.split(".")
+        else:
+            *path, prefix = token.split(".")
+            if not path:
+                return sorted(
+                    {
+                        *self.globals.starting(prefix),
+                        *self.macros.starting(prefix),
+                        *BUILTINS.starting(prefix),
+                        *HOTWORDS.starting(prefix),
+                    }
+                )
+            obj = self._lookup(path.pop(0))
+            if obj is _MISSING:
+                return []
+        try:
+            for name in path:
+                obj = getattr(obj, name)
+        except Exception:
+            return []
+        qualifier = token[: len(token) - len(prefix)]
+        return [qualifier + name for name in self._attributes(obj).starting(prefix)]
+
+    def _attributes(self, obj):
+        if not isinstance(obj, ModuleType):
+            try:
+                return Names(dir(obj))
+            except Exception:
+                return Names()
+        count, names = self._modules.get(obj.__name__, (None, None))
+        if count != len(vars(obj)):
+            count, names = len(vars(obj)), Names(dir(obj))
+            self._modules[obj.__name__] = count, names
+        return names
+
+    def _lookup(self, name):
+        obj = self.ns.get(name, _MISSING)
+        if obj is _MISSING:
+            return getattr(builtins, name, _MISSING)
+        return obj
+
+    def inspect(self, code, cursor, detail=0):
+        """Describes the object named by the symbol at cursor, or None."""
+        before = BEFORE.search(code, 0, cursor)[0]
+        token = (before + AFTER.match(code, cursor)[0]).rstrip(".")
+        obj = self.resolve(token)
+        return None if obj is _MISSING else _describe(token, obj, detail)
+
+    def resolve(self, symbol):
+        """What the symbol names, as a head of a form, if found."""
+        try:
+            if symbol.startswith("!"):
+                return getattr(basic, symbol[1:])
+            if symbol in _RESERVED_MACROS:
+                return getattr(basic, _RESERVED_MACROS[symbol].rpartition(".")[2])
+            if ".." in symbol:
+                module, _, attributes = symbol.partition("..")
+                obj = sys.modules[module]
+                path = attributes.split(".")
+            else:
+                first, *path = symbol.split(".")
+                macros = self.ns.get(MACROS)
+                if not path and macros is not None and first in vars(macros):
+                    return getattr(macros, first)
+                obj = self._lookup(first)
+            for name in path:
+                obj = getattr(obj, name)
+        except Exception:
+            return _MISSING
+        return obj
+
+
+def _keys(mapping):
+    """A snapshot of the keys, even if another thread is changing them."""
+    while True:
+        try:
+            return set(mapping)  # Atomic in CPython, for str keys.
+        except RuntimeError:  # Changed size during iteration.
+            pass
+
+
+def _describe(symbol, obj, detail=0):
+    lines = [f"{symbol}: {type(obj).__name__}"]
+    try:
+        lines.append(f"Signature: {symbol}{inspect.signature(obj)}")
+    except (TypeError, ValueError):
+        pass
+    doc = inspect.getdoc(obj)
+    if doc and (callable(obj) or isinstance(obj, ModuleType)):
+        lines.append(doc)
+    else:
+        lines.append(repr(obj)[:1000])
+    if detail:
+        try:
+            lines.append(inspect.getsource(obj))
+        except (OSError, TypeError):
+            pass
+    return "\n".join(lines)
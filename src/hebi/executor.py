@@ -0,0 +1,146 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Runs REPL cells on a worker thread, with a persistent event loop.
+
+The worker runs an asyncio event loop for as long as the Executor
+lives, and each cell is compiled and run there as a task, so the
+thread submitting cells (like the kernel's) stays free to handle
+other messages. A cell with a top-level await: runs as a coroutine on
+that loop, and tasks it starts keep running between cells.
+
+Cells are interruptible. While a cell's own code is running, an
+interrupt raises KeyboardInterrupt in the worker, wherever it is. If the
+code stops running before that happens, the interrupt lands (and is
+dropped) right there, not in the loop or a later cell. While the cell
+awaits something, its task is cancelled instead, and the loop goes on.
+Either way, the cell's future gets the exception.
+"""
+
+import asyncio
+import ctypes
+import sys
+import threading
+import types
+
+from hebi import parser
+from hebi.bootstrap import _lambda, _suspends
+from hebi.runtime import _coroutine_function
+
+
+class Executor:
+    """Compiles and runs cells with the compiler, in its namespace."""
+
+    def __init__(self, compiler, filename="<repl>"):
+        self.compiler = compiler
+        self.filename = filename
+        self.loop = asyncio.new_event_loop()
+        self._lock = threading.Lock()
+        self._cell = None  # The running cell's task.
+        self._busy = False  # Running its code, not awaiting.
+        self._interrupting = False  # A KeyboardInterrupt may be pending.
+        self.thread = threading.Thread(target=self._run, name="hebigo-cells", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        while True:
+            try:
+                self.loop.run_forever()
+            except (KeyboardInterrupt, SystemExit):
+                continue  # Raised by a cell, which has it already.
+            break
+        tasks = asyncio.all_tasks(self.loop)
+        self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self.loop.close()
+
+    def submit(self, code):
+        """Runs the code's cell, returning a concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(self._execute(code), self.loop)
+
+    def run(self, code):
+        """Runs the code's cell, and waits for it."""
+        return self.submit(code).result()
+
+    def interrupt(self):
+        """Interrupts the running cell, if any. Safe from a signal handler."""
+        with self._lock:
+            if self._busy:
+                self._interrupting = True
+                self._set_async_exc(KeyboardInterrupt)
+            elif self._cell:
+                self.loop.call_soon_threadsafe(self._cell.cancel)
+
+    def _set_async_exc(self, exc):
+        """Raises exc in the worker when it next runs Python."""
+        ctypes.pythonapi.PyThreadState_SetAsyncExc(
+            ctypes.c_ulong(self.thread.ident), ctypes.py_object(exc)
+        )
+
+    def shutdown(self, timeout=None):
+        """Interrupts any cell, cancels the loop's tasks, and stops it."""
+        self.interrupt()
+        if not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._stop)
+        self.thread.join(timeout)
+
+    def _stop(self):
+        for task in asyncio.all_tasks(self.loop):
+            task.cancel()
+        self.loop.stop()
+
+    async def _execute(self, code):
+        self._cell = asyncio.current_task()
+        try:
+            return await self._stepping(self._compile_and_run(code))
+        finally:
+            with self._lock:
+                self._cell = None
+                self._busy = self._interrupting = False  # Even if interrupted while clearing them.
+
+    async def _compile_and_run(self, code):
+        forms = [*parser.reads(code)]
+        if not _suspends(forms):
+            exec(self.compiler.code(forms, self.filename, "single"), self.compiler.ns)
+            return
+        # Like async: def:, a generator lambda flagged as a coroutine.
+        cell = self.compiler.code([_lambda((), forms, generator=True)], self.filename, "eval")
+        function = _coroutine_function(eval(cell, self.compiler.ns))
+        value = await function()
+        if value is not None:
+            sys.displayhook(value)
+
+    @types.coroutine
+    def _stepping(self, coroutine):
+        """Drives the coroutine, marking the worker busy while it runs."""
+        value = error = None
+        while True:
+            with self._lock:
+                self._busy = True
+            try:
+                awaited = coroutine.throw(error) if error else coroutine.send(value)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                with self._lock:
+                    self._busy = False
+                    interrupting, self._interrupting = self._interrupting, False
+                if interrupting:
+                    # Passing NULL to withdraw it would leave the eval
+                    # breaker set (before 3.13), slowing every thread.
+                    try:
+                        _run_bytecode()
+                    except KeyboardInterrupt:
+                        pass  # Too late for the cell's code.
+            try:
+                value, error = (yield awaited), None
+            except BaseException as e:
+                value, error = None, e
+
+
+def _run_bytecode():
+    """Gives a pending asynchronous exception somewhere to land."""
+    for _ in range(100):
+        pass
@@ -1,13 +1,17 @@
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
+import asyncio
+import signal
 import traceback
 from typing import Optional
 
-from hissp.compiler import Compiler
 from ipykernel.kernelbase import Kernel
 
 from hebi import parser
+from hebi.codegen import AstCompiler
+from hebi.completion import Index
+from hebi.executor import Executor
 
 
 class HebigoKernel(Kernel):
@@ -21,9 +25,21 @@ class HebigoKernel(Kernel):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.compiler = Compiler(evaluate=False)
+        self.compiler = AstCompiler(evaluate=False)
+        self.executor = Executor(self.compiler)
+        self.index = Index(self.compiler.ns)
 
-    def do_execute(
+    def pre_handler_hook(self):
+        # Interrupts go to the running cell (on the executor's thread),
+        # not to wherever the kernel's own event loop happens to be.
+        self.saved_sigint_handler = signal.signal(
+            signal.SIGINT, lambda signum, frame: self.executor.interrupt()
+        )
+
+    def post_handler_hook(self):
+        signal.signal(signal.SIGINT, self.saved_sigint_handler)
+
+    async def do_execute(
         self,
         code: str,
         silent: bool,
@@ -48,28 +64,63 @@ class HebigoKernel(Kernel):
         # To display output, it can send messages using
         # send_response(). See Messaging in IPython for details of the
         # different message types.
+        payload = []
+        future = self.executor.submit(code)
         try:
-            exec(
-                compile(self.compiler.compile(parser.reads(code)), "<repl>", "single"),
-                self.compiler.ns,
-            )
+            await asyncio.wrap_future(future)
         except SystemExit:
-            raise  # TODO: how do we shut down properly?
-        except:
+            # Like IPython's exit: the frontend is asked to shut the
+            # kernel down, and it stops once this reply is sent.
+            payload.append({"source": "ask_exit", "keepkernel": False})
+            self.io_loop.call_later(0.1, self._exit)
+        except BaseException:
+            if not future.done():
+                raise  # This request was cancelled, not the cell.
             if not silent:
                 self.send_response(
                     self.iopub_socket,
                     "stream",
-                    {"name": "stderr", "text": traceback.format_exc()},
+                    {"name": "stderr", "text": _format(future)},
                 )
+        finally:
+            self.index.update()
 
         return {
             "status": "ok",
             "execution_count": self.execution_count,
-            "payload": [],  # Deprecated?
+            "payload": payload,
             "user_expressions": {},  # Unused?
         }
 
+    def do_complete(self, code: str, cursor_pos: int):
+        matches, start = self.index.complete(code, cursor_pos)
+        return {
+            "status": "ok",
+            "matches": matches,
+            "cursor_start": start,
+            "cursor_end": cursor_pos,
+            "metadata": {},
+        }
+
+    def do_inspect(
+        self, code: str, cursor_pos: int, detail_level: int = 0, omit_sections=()
+    ):
+        text = self.index.inspect(code, cursor_pos, detail_level)
+        return {
+            "status": "ok",
+            "found": text is not None,
+            "data": {"text/plain": text} if text is not None else {},
+            "metadata": {},
+        }
+
+    def do_shutdown(self, restart):
+        self.executor.shutdown(timeout=1)
+        return {"status": "ok", "restart": restart}
+
+    def _exit(self):
+        self.executor.shutdown(timeout=1)
+        self.io_loop.stop()
+
     def do_is_complete(self, code: str):
         status = "incomplete"
         if code.endswith("\n"):  # Empty line; user declined more input.
@@ -86,6 +137,13 @@ class HebigoKernel(Kernel):
         return {"status": status}
 
 
+def _format(future):
+    if future.cancelled():
+        return "KeyboardInterrupt\n"
+    e = future.exception()
+    return "".join(traceback.format_exception(type(e), e, e.__traceback__))
+
+
 if __name__ == "__main__":
     from ipykernel.kernelapp import IPKernelApp
 
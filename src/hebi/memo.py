@@ -0,0 +1,119 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Memoized expansion, for pure macros.
+
+The compiler expands every occurrence of a macro form from scratch.
+A macro declared with @pure expands each distinct form once, and
+repeats get the same expansion back from its cache:
+
+    def: _macro_.twice: x
+      :@ hebi.memo..pure
+      ("(%s) * 2" % x)
+
+Pure means the expansion depends only on the form, the qualname and
+optimization level it's compiled with, and which names the module's
+_macro_ namespace has, and that expanding has no other effect. Basic
+macros that compile their arguments (like if: at -O2) depend on the
+macros themselves, so they call impure() and those expansions aren't
+cached.
+
+The caches belong to the compilation (see Compiler.compile_each()),
+which starts over whenever the _macro_ namespace's names change, and
+drops them when it's done, so long-lived processes (the kernel, watch)
+don't keep old forms. Nothing is cached while compiling with a
+SourceMap, which locates forms by identity.
+"""
+
+from collections import OrderedDict, namedtuple
+from functools import wraps
+from weakref import WeakSet
+
+from hebi.parser import MEMO, OPTIMIZE, QUALSYMBOL
+
+CacheInfo = namedtuple("CacheInfo", "hits misses maxsize currsize")
+
+_impure = [0]  # Expansions that can't be cached so far.
+_pure = WeakSet()
+_MISS = object()
+
+
+def pure(macro=None, *, maxsize=4096):
+    """
+    Declares a macro pure, memoizing its expansions.
+
+    Use as @pure, or @pure(maxsize=n) to keep more or fewer. The least
+    recently used expansions go first. Like a functools.lru_cache, the
+    macro gets cache_info() and cache_clear(), which count all its
+    expansions, but size and clear only the current compilation's cache.
+    """
+    if macro is None:
+        return lambda macro: pure(macro, maxsize=maxsize)
+    stats = [0, 0]
+
+    @wraps(macro)
+    def expand(*args, **kwargs):
+        caches = MEMO.get()
+        if kwargs or caches is None:
+            return macro(*args, **kwargs)
+        cache = caches.get(expand)
+        if cache is None:
+            cache = caches[expand] = OrderedDict()
+        key = QUALSYMBOL.get(), OPTIMIZE.get(), args
+        try:
+            cached, expansion = cache.pop(key, (_MISS, None))
+        except TypeError:  # Unhashable.
+            key = cached = _MISS
+        if cached is _MISS or not _identical(args, cached):
+            stats[1] += 1
+            impure = _impure[0]
+            expansion = macro(*args)
+            if key is _MISS or impure != _impure[0]:
+                return expansion
+            if len(cache) >= maxsize:
+                cache.popitem(last=False)
+        else:
+            stats[0] += 1
+        cache[key] = args, expansion  # Now the most recently used.
+        return expansion
+
+    def cache_info():
+        return CacheInfo(*stats, maxsize, len((MEMO.get() or {}).get(expand, ())))
+
+    def cache_clear():
+        (MEMO.get() or {}).pop(expand, None)
+        stats[:] = 0, 0
+
+    expand.cache_info = cache_info
+    expand.cache_clear = cache_clear
+    _pure.add(expand)
+    return expand
+
+
+def ispure(macro):
+    """Was macro declared @pure?"""
+    return macro in _pure
+
+
+def impure():
+    """Keeps the expansion in progress out of the pure macros' caches."""
+    _impure[0] += 1
+
+
+def _identical(form, other):
+    """
+    Are equal forms also the same? Equality alone isn't enough:
+    True == 1 == 1.0, and -0.0 == 0.0.
+    """
+    if form is other:
+        return True
+    case = type(form)
+    if case is not type(other):
+        return False
+    if case is tuple:
+        return all(map(_identical, form, other))
+    if case is float or case is complex:
+        return repr(form) == repr(other)
+    return True
@@ -3,8 +3,10 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 import ast
+import logging
 import os
 import re
+import sys
 from codeop import compile_command
 from contextlib import contextmanager
 from contextvars import ContextVar
@@ -15,6 +17,12 @@ from typing import Union
 
 from hissp import compiler
 
+from hebi import build
+from hebi.peephole import Peephole
+from hebi.sourcemap import SourceMap
+
+log = logging.getLogger(__name__)
+
 TOKEN = re.compile(
     r"""(?x)
  (?P<end>[)\]}])
@@ -70,7 +78,33 @@ class SoftSyntaxError(SyntaxError):
     pass
 
 
-def lex(code):
+def lex(code, positions=None):
+    """
+    Yields (case, group) tokens from Hebigo code.
+
+    If a positions list is given, the (line, column) of each token is
+    appended to it just before the token is yielded, so positions[i]
+    is where the ith token started. Lines count from 1, columns from 0.
+    """
+    if positions is None:
+        return _lex(code)
+    return _locate(code, positions)
+
+
+def _locate(code, positions):
+    here = [0]
+    line, start = 1, 0  # Line number and where it starts.
+    for token in _lex(code, here):
+        offset = here[0]
+        newlines = code.count("\n", start, offset)
+        if newlines:
+            line += newlines
+            start = code.rfind("\n", start, offset) + 1
+        positions.append((line, offset - start))
+        yield token
+
+
+def _lex(code, here=None):
     """
     Because Hebigo is context-sensitive, the lexer has to do extra work.
     It keeps an indentation stack and a count of open hot word forms,
@@ -81,11 +115,15 @@ def lex(code):
     just defers to Python's parser to determine if an expression
     that might have been completed has been.
 
+    If here is given, here[0] is kept at the offset of the token being
+    lexed, for _locate().
     """
     opens = 0
     indents = [0]
     tokens = iter(TOKEN.finditer(code + "\n"))
     for token in tokens:
+        if here is not None:
+            here[0] = token.start()
         case = token.lastgroup
         group = token.group()
         assert case != "error"
@@ -141,6 +179,8 @@ def lex(code):
         else:
             yield case, group
 
+    if here is not None:
+        here[0] = len(code)
     while opens:
         opens -= 1
         yield "close", "EOF"
@@ -182,45 +222,158 @@ RESERVED_WORDS = frozenset(
 )
 
 
-def parse(tokens):
-    tokens = iter(tokens)
-    for case, group in tokens:
-        if group in RESERVED_WORDS:
-            group = f"hebi.basic.._macro_.{group}_"
-        elif group.startswith("!"):
-            group = f"hebi.basic.._macro_.{group[1:]}"
-        if case == "open":
-            yield (*parse(tokens),)
+MACROS = "hebi.basic.._macro_."
+_RESERVED_MACROS = {word: sys.intern(f"{MACROS}{word}_") for word in RESERVED_WORDS}
+
+
+def _cons(conses, form):
+    """
+    The shared copy of form, if it's made only of strings.
+
+    Equal strings always mean the same thing, unlike other literals
+    (1 == 1.0 == True), and a flat form hashes in one pass.
+    """
+    for element in form:
+        if type(element) is not str:
+            return form
+    return conses.setdefault(form, form)
+
+
+def parse(tokens, compact=False, source_map=None):
+    """
+    Builds Hissp forms from lexed tokens, yielding each top-level form.
+
+    Iterative, so nesting depth isn't limited by Python's recursion
+    limit. Each open form has a list collecting its elements, and a
+    list of the unary hotword heads (None for pass) waiting to wrap
+    its next element. The enclosing forms' lists wait on a stack.
+
+    Symbols and macro names are interned. If compact is set, Python
+    injections are too, and equal flat subforms are shared (hash-consed)
+    across all the forms of one parse, which is safe because forms are
+    immutable. Generated modules repeat a lot of small forms.
+
+    If a SourceMap is given, tokens must be lexed with its positions,
+    and each tuple built (and Python injection) is located there by the
+    token it started at. Unary hotwords are located by their argument,
+    which is on the same line.
+    """
+    intern = sys.intern
+    conses = {} if compact else None
+    stack = []
+    frame = None  # Top level.
+    heads = []
+    start = None  # Index of the token that opened frame.
+    for index, (case, group) in enumerate(tokens):
+        if case == "symbol":
+            if group in _RESERVED_MACROS:
+                form = _RESERVED_MACROS[group]
+            elif group.isidentifier():
+                form = intern(group)
+            elif group[0] == "!":
+                form = intern(f"{MACROS}{group[1:]}")
+            elif all(s.isidentifier() for s in group.split(".") if s):
+                form = intern(group)
+            else:
+                form = ast.literal_eval(group)
+        elif case == "open":
+            stack.append((frame, heads, start))
+            frame = []
+            heads = []
+            start = index
+            continue
         elif case == "close":
-            return
+            if heads:
+                raise SyntaxError(f"Missing argument to unary {heads[-1] or 'pass'}:")
+            if not stack:
+                return
+            form = (*frame,)
+            if conses is not None:
+                form = _cons(conses, form)
+            if source_map is not None:
+                source_map.locate(form, start)
+            index = start
+            frame, heads, start = stack.pop()
         elif case == "unary":
             if group == "pass":
-                yield next(parse(tokens)),
+                heads.append(None)
+            elif group[0] == "!":
+                heads.append(intern(f"{MACROS}{group[1:]}"))
             else:
-                yield group, next(parse(tokens)),
-        elif case == "symbol":
-            if all(s.isidentifier() for s in group.split(".") if s):
-                yield group
-            else:
-                yield ast.literal_eval(group)
+                heads.append(_RESERVED_MACROS.get(group) or intern(group))
+            continue
         elif case == "python":
             # Parentheses let the compiler know it's Python expression code.
-            yield f"({group})"
+            form = f"({group})"
+            if conses is not None:
+                form = intern(form)
+            elif source_map is not None:  # Unshared, so it can be located.
+                source_map.locate(form, index)
+        elif group[0] == "!":  # Multiary head or control word.
+            form = intern(f"{MACROS}{group[1:]}")
+        else:
+            form = _RESERVED_MACROS.get(group) or intern(group)
+        if heads:
+            for head in reversed(heads):
+                form = (form,) if head is None else (head, form)
+                if conses is not None:
+                    form = _cons(conses, form)
+                if source_map is not None:
+                    source_map.locate(form, index)
+            heads.clear()
+        if frame is None:
+            yield form
         else:
-            yield group
+            frame.append(form)
+    if heads:
+        raise SyntaxError(f"Missing argument to unary {heads[-1] or 'pass'}:")
+    while stack:  # Out of tokens: close whatever is still open.
+        form = (*frame,)
+        if conses is not None:
+            form = _cons(conses, form)
+        if source_map is not None:
+            source_map.locate(form, start)
+        index = start
+        frame, heads, start = stack.pop()
+        for head in reversed(heads):
+            form = (form,) if head is None else (head, form)
+            if conses is not None:
+                form = _cons(conses, form)
+            if source_map is not None:
+                source_map.locate(form, index)
+        heads.clear()
+        if frame is None:
+            yield form
+        else:
+            frame.append(form)
 
 
-def reads(hebigo):
-    res = parse(lex(hebigo))
+def reads(hebigo, compact=False):
+    res = parse(lex(hebigo), compact)
     return res
 
 
-def transpile(package: resources.Package, *modules: Union[str, PurePath]):
+def transpile(
+    package: resources.Package,
+    *modules: Union[str, PurePath],
+    optimize=False,
+    source_map=False,
+    build=False,
+):
     for module in modules:
-        transpile_module(package, module + ".hebi")
+        transpile_module(
+            package,
+            module + ".hebi",
+            optimize=optimize,
+            source_map=source_map,
+            build=build,
+        )
 
 
 QUALSYMBOL = ContextVar("QUALSYMBOL", default=None)
+OPTIMIZE = ContextVar("OPTIMIZE", default=0)
+MEMO = ContextVar("MEMO", default=None)  # The compilation's pure macro caches (see hebi.memo).
+COMPILER = ContextVar("COMPILER", default=None)  # Expanding the macros.
 
 
 @contextmanager
@@ -232,11 +385,242 @@ def qualify_context(qualname):
         QUALSYMBOL.reset(token)
 
 
+@contextmanager
+def optimize_context(level):
+    """
+    Sets the optimization level for the macros expanded within.
+
+    0 (or False) gives the reference expansions. 1 (or True) adds the
+    peephole pass. 2 also has the basic macros expand to specialized
+    code where they can, like if:, and:, and or: to native conditional
+    expressions, which must behave the same.
+    """
+    token = OPTIMIZE.set(int(level))
+    try:
+        yield OPTIMIZE.get()
+    finally:
+        OPTIMIZE.reset(token)
+
+
+class Compiler(compiler.Compiler):
+    """
+    The Hissp compiler, plus Hebigo's optional peephole optimizer.
+
+    The peephole sees each form after macroexpansion, just before it
+    is compiled. A top-level form containing a runtime: guard is
+    compiled twice when evaluating: once with the guard intact, for
+    the compiler to evaluate, and once with it resolved, for output.
+    The second time replays the first's expansions, so macros still
+    run once. Without evaluate, guards are resolved only if the
+    peephole's resolve_runtime is set.
+
+    With a SourceMap, a comment marks the .hebi line of the located
+    forms wherever it changes, for SourceMap.read(). Other forms belong
+    to the innermost located form they're in.
+
+    With build, compile() only evaluates the top-level forms macro
+    expansion might need (see hebi.build), and compiles the rest for
+    run time.
+
+    Pure macros (see hebi.memo) are memoized for one compile_each(),
+    until the names in the _macro_ namespace change. Not with a
+    SourceMap, since a cached expansion would have the forms of an
+    earlier occurrence.
+    """
+
+    def __init__(
+        self,
+        qualname="_repl",
+        ns=None,
+        evaluate=True,
+        peephole=None,
+        source_map=None,
+        build=False,
+    ):
+        super().__init__(qualname, ns, evaluate)
+        self.peephole = peephole
+        self.source_map = source_map
+        self.build = build
+        self._line = None  # Of the innermost parsed form being compiled.
+        self._marked = None  # Line of the last mark written.
+        self._expansions = None  # id(form): (form, expansion), to replay.
+        self._memo = self._memo_names = None  # Pure macro caches, for _macro_'s names.
+
+    def compile(self, forms) -> str:
+        return "\n\n".join(self.compile_each(forms))
+
+    def compile_each(self, forms):
+        """Compiles (and maybe evaluates) each form, yielding its Python."""
+        try:
+            yield from self._compile_each(forms)
+        finally:
+            self._memo = self._memo_names = None
+
+    def _compile_each(self, forms):
+        needed = None
+        if self.build and self.evaluate:
+            forms = [*forms]
+            needed = build.needed(forms)
+        for index, form in enumerate(forms):
+            self._renew_memo()
+            if needed is not None and index not in needed:
+                if self.peephole:
+                    self.peephole.resolve_runtime = True  # Only for run time.
+                yield self.form(form)
+                continue
+            if not (self.peephole and self.evaluate):
+                python = self.form(form)
+                self.eval(python)
+                yield python
+                continue
+            self.peephole.resolve_runtime = False
+            self.peephole.guarded = False
+            stats = self.peephole.stats.copy()
+            self._expansions = {}
+            try:
+                python = self.form(form)
+                self.eval(python)
+                if self.peephole.guarded:
+                    self.peephole.stats = stats
+                    self.peephole.resolve_runtime = True
+                    python = self.form(form)
+            finally:
+                self._expansions = None
+            yield python
+
+    def _renew_memo(self):
+        """Starts new pure macro caches if the macros' names changed."""
+        if self.source_map is not None:
+            return
+        macros = self.ns.get(compiler.MACROS)
+        names = () if macros is None else tuple(vars(macros))
+        if self._memo is None or names != self._memo_names:
+            self._memo, self._memo_names = {}, names
+
+    @compiler.trace
+    def invocation(self, form: tuple) -> str:
+        """Like Hissp's, but expanding through expand()."""
+        with self.macro_context():
+            expansion = self.expand(form)
+            if expansion is not _NOT_MACRO:
+                return f"# {form[0]}\n" + self.form(expansion)
+        return self.call(form)
+
+    def expand(self, form):
+        """
+        What the invocation form expands to, or _NOT_MACRO.
+
+        While a form is compiled twice, the second time gets the first's
+        result for each form, rather than running the macro again.
+        """
+        if self._expansions is not None and id(form) in self._expansions:
+            return self._expansions[id(form)][1]
+        head, *tail = form
+        macro = self.macro(head)
+        expansion = _NOT_MACRO if macro is None else macro(*tail)
+        if self._expansions is not None:
+            self._expansions[id(form)] = form, expansion  # Keeps the id in use.
+        return expansion
+
+    def macro(self, head):
+        """The macro head names, or None."""
+        parts = head.split(compiler.MACRO, 1)
+        if parts[0] == self.qualname:
+            # Local qualified macro. Recursive macros might need it.
+            return vars(self.ns[compiler.MACROS])[parts[1]]
+        try:  # Is it a local unqualified macro?
+            return vars(self.ns[compiler.MACROS])[head]
+        except LookupError:  # Nope.
+            pass
+        if compiler.MACRO in head:  # Qualified macro, not local.
+            return self._qualified_macro(head)
+        return None
+
+    def _qualified_macro(self, head):
+        return eval(self.symbol(head))
+
+    def form(self, form) -> str:
+        if self.source_map is not None and (
+            type(form) is str or type(form) is tuple and form
+        ):
+            return self._located_form(form)
+        if self.peephole:
+            form = self.peephole(form)
+        return super().form(form)
+
+    @contextmanager
+    def macro_context(self):
+        token = COMPILER.set(self)
+        # Nested compilers (like inject's) use the compilation's caches.
+        memo = None
+        if self._memo is not None or self.source_map is not None:
+            memo = MEMO.set(self._memo)
+        try:
+            with super().macro_context():
+                yield
+        finally:
+            if memo:
+                MEMO.reset(memo)
+            COMPILER.reset(token)
+
+    def inject(self, form) -> str:
+        """
+        Compiles form to Python text, for the macro being expanded to
+        inject. With a SourceMap, the text is marked like the rest of
+        the output, then marked back to the macro form's line.
+        """
+        compiler = Compiler(
+            self.qualname,
+            self.ns,
+            evaluate=False,
+            peephole=Peephole() if OPTIMIZE.get() else None,
+            source_map=self.source_map,
+        )
+        compiler._line = compiler._marked = self._line
+        python = compiler.form(form)
+        if self._line is not None and compiler._marked != self._line:
+            # Own lines, so the macro's text around it keeps the form's.
+            python = f"\n{python}\n{self.source_map.mark(self._line)}"
+        return python
+
+    def _located_form(self, form):
+        enclosing = self._line
+        position = self.source_map.position(form)
+        line = enclosing if position is None else position[0]
+        if enclosing is None:  # New top-level form.
+            self._marked = None
+        mark = line is not None and line != self._marked
+        if mark:
+            self._marked = line
+        self._line = line
+        try:
+            if self.peephole:
+                form = self.peephole(form)
+            python = super().form(form)
+        finally:
+            self._line = enclosing
+        return self.source_map.mark(line) + python if mark else python
+
+
+_NOT_MACRO = object()
+
+
 def transpile_module(
     package: resources.Package,
     resource: Union[str, PurePath],
     out: Union[None, str, bytes, Path] = None,
+    optimize=False,
+    source_map=False,
+    build=False,
 ):
+    """
+    Compiles a .hebi resource to a .py file next to it.
+
+    With source_map, the Python is marked with .hebi lines, and
+    a sidecar .py.map of them is written too (see hebi.sourcemap).
+    The optimize level is as for optimize_context(). With build, only
+    what macro expansion needs is run (see hebi.build).
+    """
     code = resources.read_text(package, resource)
     path: Path
     with resources.path(package, resource) as path:
@@ -245,9 +629,36 @@ def transpile_module(
             package = package.__package__
         if isinstance(package, os.PathLike):
             resource = resource.stem
-        with open(out, "w") as f, qualify_context(
-            f"{package}.{resource.split('.')[0]}"
-        ) as qualsymbol:
+        smap = SourceMap(path.name) if source_map else None
+        with open(out, "w") as f:
             print("writing to", out)
-            hissp = parse(lex(code))
-            f.write(compiler.Compiler(qualsymbol, evaluate=True).compile(hissp))
+            python = transpile_code(
+                code, f"{package}.{resource.split('.')[0]}", optimize, smap, build
+            )
+            f.write(python)
+        if smap:
+            with open(f"{out}.map", "w") as f:
+                smap.read(python).dump(f)
+
+
+def transpile_code(hebigo, qualname, optimize=False, source_map=None, build=False):
+    """
+    Compiles Hebigo source to the Python of the module named qualname.
+
+    Arguments are as for transpile_module(), but source_map is the
+    SourceMap to fill, if any.
+    """
+    with qualify_context(qualname), optimize_context(optimize):
+        positions = source_map and source_map.positions
+        hissp = parse(lex(hebigo, positions), source_map=source_map)
+        peephole = Peephole() if optimize else None
+        python = Compiler(
+            qualname, peephole=peephole, source_map=source_map, build=build
+        ).compile(hissp)
+    if peephole:
+        log.info("peephole: %s (%d chars)", _report(peephole.stats), len(python))
+    return python
+
+
+def _report(stats):
+    return ", ".join(f"{rule} {count}" for rule, count in stats.most_common()) or "no changes"
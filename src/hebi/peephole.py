@@ -0,0 +1,173 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Peephole optimizer for macro-expanded Hissp forms.
+
+The compiler calls a Peephole on every form it is about to compile,
+which is after the enclosing macro has expanded, so the optimizer
+sees the calls to hebi.runtime helpers that the basic macros produce.
+"""
+
+import ast
+import re
+from collections import Counter
+
+RUNTIME = 'hebi.runtime..'  # Same prefix the basic macros emit.
+BEGIN = RUNTIME + '_begin'
+BEGIN0 = RUNTIME + '_begin0'
+NOT = RUNTIME + '_not_'
+IF = RUNTIME + '_if_'
+RUNTIME_GUARD = "(__name__!='<compiler>')"
+
+# Code that would change meaning if moved out of its own lambda.
+SCOPED = re.compile(r":=|\b(?:yield|await|locals|vars|super)\b")
+
+_unset = object()
+
+
+class Peephole:
+    """
+    Rewrites expanded forms into cheaper equivalents.
+
+    Counts each rewrite in stats (by rule name).
+
+    If resolve_runtime is set, runtime: guards are taken as true,
+    which is only correct in compiled output (not while the compiler
+    evaluates the module). Otherwise, guarded is set when one is seen.
+    """
+
+    def __init__(self):
+        self.stats = Counter()
+        self.resolve_runtime = False
+        self.guarded = False
+
+    def __call__(self, form):
+        while True:
+            new = self.rewrite(form)
+            if new is form:
+                return form
+            form = new
+
+    def rewrite(self, form):
+        if type(form) is not tuple or not form:
+            return form
+        head = form[0]
+        if head == BEGIN:
+            return self._begin(form)
+        if head == BEGIN0:
+            return self._begin0(form)
+        if head == NOT:
+            return self._not(form)
+        if head == IF:
+            return self._if(form)
+        if len(form) == 1 and _is_thunk(head):
+            return self._thunk(form)
+        return form
+
+    def _begin(self, form):
+        body = form[1:]
+        if not body or ':' in body:
+            return form
+        *init, last = body
+        kept = [e for e in init if not _is_constant(e)]
+        if len(kept) == len(init):
+            return form
+        self.stats['_begin'] += 1
+        if not kept:
+            return last
+        return (BEGIN, *kept, last)
+
+    def _begin0(self, form):
+        body = form[1:]
+        if not body or ':' in body:
+            return form
+        zero, *rest = body
+        kept = [e for e in rest if not _is_constant(e)]
+        if len(kept) == len(rest):
+            return form
+        self.stats['_begin0'] += 1
+        if not kept:
+            return zero
+        return (BEGIN0, zero, *kept)
+
+    def _not(self, form):
+        if len(form) != 2 or not _is_constant(form[1]):
+            return form
+        self.stats['_not_'] += 1
+        return () if _value(form[1]) else True
+
+    def _thunk(self, form):
+        body = form[0][2:]
+        if ':' in body or _mentions(body, SCOPED):
+            return form
+        self.stats['thunk'] += 1
+        if not body:
+            return ()
+        if len(body) == 1:
+            return body[0]
+        return (BEGIN, *body)
+
+    def _if(self, form):
+        if len(form) < 3:
+            return form
+        _, condition, then, *rest = form
+        if condition == RUNTIME_GUARD:
+            if not self.resolve_runtime:
+                self.guarded = True
+                return form
+            self.stats['runtime'] += 1
+            return (then,)
+        if not _is_constant(condition):
+            return form
+        self.stats['_if_'] += 1
+        if _value(condition):
+            return (then,)
+        elifs = rest[:rest.index(':')] if ':' in rest else rest
+        else_ = dict(zip(*[iter(rest[len(elifs) + 1:])] * 2)).get('else_')
+        if elifs:
+            condition, then, *elifs = elifs
+            return (IF, (condition,), then, *elifs, *(() if else_ is None else (':', 'else_', else_)))
+        if else_ is None:
+            return ()
+        return (else_,)
+
+
+def _is_thunk(form):
+    return type(form) is tuple and len(form) >= 2 and form[0] == 'lambda' and form[1] == ()
+
+
+def _is_constant(form):
+    """Is form a literal, whose evaluation has no effects?"""
+    if type(form) is tuple:
+        return not form or form[0] == 'quote'
+    if type(form) is str:
+        return form.startswith(':') or _value(form) is not _unset
+    return True
+
+
+def _value(form):
+    """The compile-time value of a constant form."""
+    if type(form) is tuple:
+        return form[1] if form else form
+    if type(form) is str:
+        if form.startswith(':'):
+            return form
+        try:
+            return ast.literal_eval(form)
+        except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+            return _unset
+    return form
+
+
+def _mentions(forms, pattern):
+    for form in forms:
+        if type(form) is tuple:
+            if form and form[0] == 'quote':
+                continue
+            if _mentions(form, pattern):
+                return True
+        elif type(form) is str and pattern.search(form):
+            return True
+    return False
@@ -0,0 +1,92 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Profiles a .hebi module, attributing time to .hebi lines and macros.
+
+The module is compiled with a SourceMap, and its Python renumbered
+with .hebi lines before it's compiled to a code object, so cProfile
+(and tracebacks) see .hebi lines directly. Own time (tottime) is then
+summed per line, and per macro that line expanded first.
+"""
+
+import ast
+import cProfile
+import pstats
+import sys
+from collections import Counter
+from pathlib import Path
+
+from hebi.parser import Compiler, lex, parse, qualify_context
+from hebi.sourcemap import SourceMap
+
+
+def load(path):
+    """
+    Compiles a .hebi file to a code object with .hebi line numbers.
+
+    In build mode, so only what macro expansion needs runs now.
+    """
+    path = Path(path)
+    smap = SourceMap(path.name)
+    hissp = parse(lex(path.read_text(), smap.positions), source_map=smap)
+    with qualify_context("__main__") as qualsymbol:
+        python = Compiler(qualsymbol, source_map=smap, build=True).compile(hissp)
+    tree = smap.read(python).remap(ast.parse(python))
+    return compile(tree, str(path), "exec"), smap
+
+
+def profile(path, argv=()):
+    """Runs a .hebi file as __main__ under cProfile. Returns its Stats."""
+    code, smap = load(path)
+    profiler = cProfile.Profile()
+    saved = sys.argv
+    sys.argv = [str(path), *argv]
+    try:
+        globals_ = {"__name__": "__main__", "__file__": str(path)}
+        profiler.runctx(code, globals_, globals_)
+    finally:
+        sys.argv = saved
+    return pstats.Stats(profiler), smap
+
+
+def attribute(stats, path, smap):
+    """
+    Seconds per .hebi line, own and in calls out of the module.
+
+    cProfile times functions, so a line's own time is that of the
+    functions (lambdas) that start there. Time in functions from
+    elsewhere, like runtime helpers and builtins, goes to the lines
+    that called them directly. Also returns the total per macro.
+    """
+    own, calls, macros = Counter(), Counter(), Counter()
+    path = str(path)
+    for (filename, line, _), (_, _, tottime, _, callers) in stats.stats.items():
+        if filename == path:
+            own[line] += tottime
+            continue
+        for (caller_filename, caller_line, _), timing in callers.items():
+            if caller_filename == path:
+                calls[caller_line] += timing[2]
+    for line, seconds in (own + calls).items():
+        macros[smap.macro(line) or "-"] += seconds
+    return own, calls, macros
+
+
+def report(path, argv=(), limit=20, file=None):
+    stats, smap = profile(path, argv)
+    own, calls, macros = attribute(stats, path, smap)
+    lines = own + calls
+    source = Path(path).read_text().split("\n")
+    total = sum(lines.values()) or 1
+    print(f"\n{'own s':>9} {'calls s':>9} {'%':>6}  {smap.source} line", file=file)
+    for line, seconds in lines.most_common(limit):
+        text = source[line - 1].strip() if line <= len(source) else ""
+        print(
+            f"{own[line]:9.4f} {calls[line]:9.4f} {seconds / total:6.1%}  {line:>5}: {text}",
+            file=file,
+        )
+    print(f"\n{'total s':>19} {'%':>6}  macro", file=file)
+    for macro, seconds in macros.most_common(limit):
+        print(f"{seconds:19.4f} {seconds / total:6.1%}  {macro}", file=file)
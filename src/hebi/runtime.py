@@ -0,0 +1,802 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Runtime support for code compiled with Hebigo's basic macros.
+
+Compiled modules refer to these helpers as ``hebi.runtime..<name>``.
+This module must stay cheap to import: it has no compile-time
+dependencies (no Hissp, no parser), so importing a compiled module
+only costs what that module actually uses.
+"""
+
+import sys
+from _thread import RLock
+from collections import deque
+from functools import lru_cache, wraps
+from itertools import chain, islice, zip_longest
+from types import GeneratorType, coroutine, new_class
+
+# Code flags, as in the inspect module (which is slow to import).
+CO_GENERATOR = 0x20
+CO_COROUTINE = 0x80
+CO_ITERABLE_COROUTINE = 0x100
+
+
+def _and_(expr, *thunks):
+    result = expr
+    for thunk in thunks:
+        if not result:
+            break
+        result = thunk()
+    return result
+
+
+def _and_gen(expr, *thunks):
+    result = expr
+    for thunk in thunks:
+        if not result:
+            break
+        result = yield from thunk()
+    return result
+
+
+def _or_(expr, *thunks):
+    result = expr
+    for thunk in thunks:
+        if result:
+            break
+        result = thunk()
+    return result
+
+
+def _or_gen(expr, *thunks):
+    result = expr
+    for thunk in thunks:
+        if result:
+            break
+        result = yield from thunk()
+    return result
+
+
+def _not_(b):
+    return () if b else True
+
+
+def _qualname(ns, name):
+    if hasattr(ns, '__qualname__'):
+        name = name.partition('.')[-1]
+        name = f"{ns.__qualname__}.{name}"
+    return name
+
+
+def akword(*args, **kwargs):
+    return args, kwargs
+
+
+def _class_(name, args, doc, module, callback, ns=None, cell=False):
+    if cell:
+        class_cell, callback = _class_cell(callback)
+    __qualname__ = name
+    if ns and hasattr(ns(), '__qualname__'):
+        name = name.partition('.')[-1]
+        __qualname__ = f"{ns().__qualname__}.{name}"
+    name = name.split('.')[-1]
+
+    def exec_callback(ns):
+        ns['__module__'] = module['__name__']
+        ns['__qualname__'] = __qualname__
+        if doc is not None:
+            ns['__doc__'] = doc
+        callback(attrs(ns))
+        return ns
+
+    bases, kwds = args
+    cls = new_class(name, bases, kwds, exec_callback)
+    if cell:
+        # super() needs this.
+        class_cell.cell_contents = cls
+    return cls
+
+
+def _slots_init(factory):
+    """
+    Class decorator for !record. Sets __init__ to factory's function,
+    which assigns each field with its slot descriptor's __set__.
+    """
+
+    def decorate(cls):
+        setters = [vars(cls)[field].__set__ for field in cls.__slots__]
+        cls.__init__ = function(f"{cls.__qualname__}.__init__", factory(*setters))
+        return cls
+
+    return decorate
+
+
+def _class_cell(wrapped_callback):
+    sentinel = object()
+    callback = wrapped_callback(sentinel)
+    # new_class() isn't setting the __class__ cell for super() for some reason.
+    class_cell = dict(zip(callback.__code__.co_freevars, callback.__closure__))['__class__']
+    # Not sure if it's always this easy to find the right cell.
+    assert class_cell.cell_contents is sentinel
+    # Empty the cell so we get the proper error in case it's used too soon.
+    del class_cell.cell_contents
+    return class_cell, callback
+
+
+@lru_cache(maxsize=4096)
+def _rename_code(code, name, qualname):
+    if hasattr(code, 'co_qualname'):  # Python 3.11+
+        return code.replace(co_name=name, co_qualname=qualname)
+    return code.replace(co_name=name)
+
+
+def function(qualname, fn, doc=None, annotations=None, dict_=()):
+    """Enhances a Hissp lambda with function metadata.
+
+    Replaces __code__ with co_name (and co_qualname) set to name.
+    Assigns __doc__, __name__, __qualname__, and __annotations__.
+    Then updates __dict__.
+
+    A lambda's code object is a constant of the enclosing code,
+    so every evaluation of the same def: shares it. The renamed copy
+    is cached, so redefining a function in a loop or closure only
+    costs the attribute assignments, not a new code object.
+    """
+    name = qualname.split('.')[-1]
+    fn.__code__ = _rename_code(fn.__code__, name, qualname)
+    fn.__doc__ = doc
+    fn.__name__ = name
+    fn.__qualname__ = qualname
+    if annotations:
+        fn.__annotations__ = annotations
+    if dict_:
+        fn.__dict__.update(dict_)
+    return fn
+
+
+# Where flagging a generator's code as a coroutine is known to work.
+# Elsewhere, a coroutine function awaits the generator instead.
+_FLAGGABLE = sys.implementation.name == "cpython" and (3, 8) <= sys.version_info[:2] <= (3, 13)
+
+
+@lru_cache(maxsize=4096)
+def _coroutine_code(code):
+    return code.replace(co_flags=code.co_flags & ~CO_GENERATOR | CO_COROUTINE)
+
+
+def _coroutine_function(fn):
+    """Makes a generator function (of yield froms) a coroutine function."""
+    if _FLAGGABLE:
+        fn.__code__ = _coroutine_code(fn.__code__)
+        return fn
+    generator = coroutine(fn)
+
+    async def coroutine_function(*args, **kwargs):
+        return await generator(*args, **kwargs)
+
+    return coroutine_function
+
+
+def async_function(qualname, fn, doc=None, annotations=None, dict_=()):
+    """Like function, but turns a generator lambda into a coroutine function.
+
+    Lambdas can't await, so async: def: compiles await: to yield from
+    on the awaitable's iterator. On the CPython versions it's tested on,
+    flagging the code as a coroutine makes calls return real coroutines,
+    which asyncio drives the same way. Elsewhere, the generator is
+    wrapped in a coroutine function, at the cost of an extra frame.
+    """
+    return function(qualname, _coroutine_function(fn), doc, annotations, dict_)
+
+
+def _await_(awaitable):
+    """The iterator that await would drive (for yield from)."""
+    if type(awaitable) is GeneratorType:
+        if awaitable.gi_code.co_flags & CO_ITERABLE_COROUTINE:
+            return awaitable
+    try:
+        await_ = type(awaitable).__await__
+    except AttributeError:
+        raise TypeError(
+            f"object {type(awaitable).__name__} can't be used in 'await' expression"
+        ) from None
+    return await_(awaitable)
+
+
+_lazy_import_lock = RLock()
+
+
+def _lazy_import(name):
+    """
+    Like import_module, but a module that isn't loaded yet is bound to
+    a importlib.util.LazyLoader module, which only executes on first
+    attribute access. Parent packages are imported normally.
+    """
+    try:
+        return sys.modules[name]
+    except KeyError:
+        with _lazy_import_lock:
+            return _lazy_module(name)
+
+
+def _lazy_module(name):
+    import importlib.util
+
+    try:
+        # Another thread may have bound it while we waited for the lock.
+        module = sys.modules[name]
+    except KeyError:
+        spec = importlib.util.find_spec(name)
+        if spec is None:
+            raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+        spec.loader = importlib.util.LazyLoader(spec.loader)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        parent, _, child = name.rpartition('.')
+        if parent:
+            setattr(sys.modules[parent], child, module)
+    return module
+
+
+def _lazy_from(name, attr, globals):
+    """
+    Lazily imports attr from module name if it's a submodule.
+    Otherwise, it's an ordinary attribute, which requires loading name.
+    """
+    import importlib.util
+
+    name = importlib.util.resolve_name(name, globals.get('__package__'))
+    submodule = f"{name}.{attr}"
+    try:
+        is_submodule = importlib.util.find_spec(submodule) is not None
+    except ModuleNotFoundError:  # name is not a package.
+        is_submodule = False
+    if is_submodule:
+        return _lazy_import(submodule)
+    return getattr(importlib.import_module(name), attr)
+
+
+def _if_(b, thunk, *elifs, else_=lambda:()):
+    if b:
+        return thunk()
+    elifs = iter(elifs)
+    for elif_ in elifs:
+        thunk = next(elifs)
+        if elif_():
+            return thunk()
+    return else_()
+
+
+def _if_gen(b, thunk, *elifs, else_=None):
+    if b:
+        return (yield from thunk())
+    elifs = iter(elifs)
+    for elif_ in elifs:
+        thunk = next(elifs)
+        if (yield from elif_()):
+            return (yield from thunk())
+    if else_:
+        return (yield from else_())
+    return ()
+
+
+_sentinel = object()
+
+
+def _raise_():
+    raise
+
+
+def _raise_ex(ex):
+    raise ex
+
+
+def _raise_ex_from(ex, from_):
+    raise ex from from_
+
+
+def partition(iterable, n=2, step=None, fillvalue=_sentinel):
+    """
+    Chunks iterable into tuples of length n. (default pairs)
+    >>> list(partition(range(10)))
+    [(0, 1), (2, 3), (4, 5), (6, 7), (8, 9)]
+
+    The remainder, if any, is not included.
+    >>> list(partition(range(10), 3))
+    [(0, 1, 2), (3, 4, 5), (6, 7, 8)]
+
+    Keep the remainder by using a fillvalue.
+    >>> list(partition(range(10), 3, fillvalue=None))
+    [(0, 1, 2), (3, 4, 5), (6, 7, 8), (9, None, None)]
+    >>> list(partition(range(10), 3, fillvalue='x'))
+    [(0, 1, 2), (3, 4, 5), (6, 7, 8), (9, 'x', 'x')]
+
+    The step defaults to n, but can be more to skip elements.
+    >>> list(partition(range(10), 2, 3))
+    [(0, 1), (3, 4), (6, 7)]
+
+    Or less for a sliding window with overlap.
+    >>> list(partition(range(5), 2, 1))
+    [(0, 1), (1, 2), (2, 3), (3, 4)]
+
+    Iterators are only traversed once, holding at most one window.
+    >>> list(partition(iter('abcde'), 3, 1))
+    [('a', 'b', 'c'), ('b', 'c', 'd'), ('c', 'd', 'e')]
+    """
+    step = step or n
+    if step == n:
+        chunks = [iter(iterable)] * n
+        if fillvalue is _sentinel:
+            return zip(*chunks)
+        return zip_longest(*chunks, fillvalue=fillvalue)
+    if not isinstance(iterable, _SLICEABLE):
+        return _windows(iter(iterable), n, step, fillvalue)
+    if n * step > 64:
+        return _slices(iterable, n, step, fillvalue)
+    # Small windows: n views of the sequence, zipped, beat a slice each.
+    views = [islice(iterable, start, None, step) for start in range(n)]
+    if fillvalue is _sentinel:
+        return zip(*views)
+    return zip_longest(*views, fillvalue=fillvalue)
+
+
+_SLICEABLE = (list, tuple, range, str, bytes, bytearray, memoryview)
+
+
+def _slices(sequence, n, step, fillvalue):
+    # All in C: no Python frame per window, no copy beyond the window.
+    size = len(sequence)
+    starts = range(0, size - n + 1, step)
+    windows = map(tuple, map(sequence.__getitem__, map(slice, starts, range(n, size + 1, step))))
+    if fillvalue is _sentinel:
+        return windows
+    return chain(windows, (
+        (*sequence[start:], *[fillvalue] * (n - size + start))
+        for start in range(len(starts) * step, size, step)
+    ))
+
+
+def _windows(iterator, n, step, fillvalue):
+    if step == 1 and fillvalue is _sentinel:
+        window = deque(islice(iterator, n - 1), maxlen=n)
+        for x in iterator:
+            window.append(x)
+            yield tuple(window)
+        return
+    window = deque(islice(iterator, n))
+    while window:
+        if len(window) == n:
+            yield tuple(window)
+        elif fillvalue is _sentinel:
+            return
+        else:
+            yield (*window, *[fillvalue] * (n - len(window)))
+        dropped = min(step, len(window))
+        for _ in range(dropped):
+            window.popleft()
+        if step > dropped:
+            next(islice(iterator, step - dropped, step - dropped), None)
+        window.extend(islice(iterator, n - len(window)))
+
+
+def _try_(thunk, *except_, else_=None, finally_=lambda:()):
+    if not all(isinstance(x, tuple)
+               or issubclass(x, BaseException)
+               for x, c in partition(except_)):
+        raise TypeError
+    try:
+        res = thunk()
+    except BaseException as ex:
+        for ex_type, ex_handler in partition(except_):
+            if isinstance(ex, ex_type):
+                return ex_handler(ex)
+        else:
+            raise
+    else:
+        if else_:
+            res = else_()
+    finally:
+        finally_()
+    return res
+
+
+def _try_gen(thunk, *except_, else_=None, finally_=None):
+    if not all(isinstance(x, tuple)
+               or issubclass(x, BaseException)
+               for x, c in partition(except_)):
+        raise TypeError
+    try:
+        res = yield from thunk()
+    except BaseException as ex:
+        for ex_type, ex_handler in partition(except_):
+            if isinstance(ex, ex_type):
+                return (yield from ex_handler(ex))
+        else:
+            raise
+    else:
+        if else_:
+            res = yield from else_()
+    finally:
+        if finally_:
+            yield from finally_()
+    return res
+
+
+def _begin(*body):
+    return body[-1]
+
+
+def _begin0(zero, *body):
+    return zero
+
+
+def _with_(guard, body):
+    with guard() as g:
+        return body(g)
+
+
+def _with_gen(guard, body):
+    with (yield from guard()) as g:
+        return (yield from body(g))
+
+
+def _async_with_(guard, body):
+    manager = yield from guard()
+    exit = type(manager).__aexit__
+    value = yield from _await_(type(manager).__aenter__(manager))
+    try:
+        result = yield from body(value)
+    except BaseException:
+        if not (yield from _await_(exit(manager, *sys.exc_info()))):
+            raise
+    else:
+        yield from _await_(exit(manager, None, None, None))
+        return result
+
+
+def _assert_(b):
+    assert b
+
+
+def _assert_message(b, thunk):
+    assert b, thunk()
+
+
+def _unpack(target, value):
+    if type(target) is tuple and target:
+        if target[0] == ':,':
+            yield from _unpack_iterable(target, value)
+        if target[0] == ':=':
+            yield from _unpack_mapping(target, value)
+    elif target == '_':
+        pass
+    else:
+        yield value
+
+
+def _unpack_iterable(target, value):
+    ivalue = iter(value)
+    itarget = iter(target)
+    head = next(itarget)
+    assert head == ':,'
+    for t in itarget:
+        if t == ':list':
+            yield from _unpack(next(itarget), list(ivalue))
+        elif t == ':iter':
+            yield from _unpack(next(itarget), ivalue)
+        elif t == ':as':
+            yield from _unpack(next(itarget), value)
+        else:
+            yield from _unpack(t, next(ivalue))
+
+
+def _unpack_mapping(target, value):
+    itarget = iter(target)
+    head = next(itarget)
+    assert head == ':='
+    for t in target:
+        if type(t) is tuple and t[0] == ':default':
+            default = dict(partition(t[1:]))
+            break
+    else:
+        default = {}
+    for t in itarget:
+        if t == ':as':
+            next(itarget)
+            yield value
+        elif type(t) is tuple and t[0] == ':strs':
+            for s in t[1:]:
+                try:
+                    yield value[s]
+                except LookupError:
+                    yield default[s]
+        elif type(t) is tuple and t[0] == ':default':
+            continue
+        else:
+            try:
+                yield from _unpack(t, value[next(itarget)])
+            except LookupError:
+                yield default[t]
+
+
+def entuple(*xs):
+    return xs
+
+
+class _Recur(tuple):
+    """(recur, args, kwargs): a request for the next iteration of a !loop."""
+
+    __slots__ = ()
+
+
+def _loop(f):
+    """
+    Trampoline for !loop. The body returns recur(...) to go around again.
+
+    Each iteration's arguments travel in the _Recur the body returns,
+    not in shared state, so the same loop function can run in several
+    threads at once, or re-enter itself, and an inner !loop can return
+    an outer loop's recur(...) through to its own loop.
+    """
+
+    def recur(*args, **kwargs):
+        return _Recur((recur, args, kwargs))
+
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        res = f(recur, *args, **kwargs)
+        while type(res) is _Recur and res[0] is recur:
+            res = f(recur, *res[1], **res[2])
+        return res
+
+    return wrapper
+
+
+def _loop_gen(f):
+    def recur(*args, **kwargs):
+        return _Recur((recur, args, kwargs))
+
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        res = yield from f(recur, *args, **kwargs)
+        while type(res) is _Recur and res[0] is recur:
+            res = yield from f(recur, *res[1], **res[2])
+        return res
+
+    return wrapper
+
+
+def _run_loop(f):
+    """
+    Like _loop(f)(), which is what !loop expands to, but without
+    building (and wrapping) a function only to call it once.
+    """
+
+    def recur(*args, **kwargs):
+        return _Recur((recur, args, kwargs))
+
+    res = f(recur)
+    while type(res) is _Recur and res[0] is recur:
+        res = f(recur, *res[1], **res[2])
+    return res
+
+
+def _run_loop_gen(f):
+    def recur(*args, **kwargs):
+        return _Recur((recur, args, kwargs))
+
+    res = yield from f(recur)
+    while type(res) is _Recur and res[0] is recur:
+        res = yield from f(recur, *res[1], **res[2])
+    return res
+
+
+class LabeledBreak(BaseException):
+    def handle(self, label=None):
+        """Re-raise self if label doesn't match."""
+        if self.label is None or self.label == label:
+            return
+        else:
+            raise self
+
+    def __init__(self, label=None):
+        self.label = label
+        raise self
+
+
+class LabeledResultBreak(LabeledBreak):
+    def __init__(self, result=None, *results, label=None):
+        if results:
+            self.result = (result,) + results
+        else:
+            self.result = result
+        LabeledBreak.__init__(self, label)
+
+
+class Break(LabeledResultBreak):
+    pass
+
+
+class Continue(LabeledBreak):
+    pass
+
+
+def _for_(iterable, body, else_=lambda:(), label=None):
+    try:
+        for e in iterable:
+            try:
+                body(e)
+            except Continue as c:
+                c.handle(label)
+    except Break as b:
+        b.handle(label)
+        # skip else_() on Break
+        return b.result
+    return else_()
+
+
+def _for_gen(iterable, body, else_=None, label=None):
+    try:
+        for e in iterable:
+            try:
+                yield from body(e)
+            except Continue as c:
+                c.handle(label)
+    except Break as b:
+        b.handle(label)
+        return b.result
+    if else_:
+        return (yield from else_())
+    return ()
+
+
+def _async_for_(iterable, body, else_=None, label=None):
+    iterator = type(iterable).__aiter__(iterable)
+    anext = type(iterator).__anext__
+    try:
+        while True:
+            try:
+                e = yield from _await_(anext(iterator))
+            except StopAsyncIteration:
+                break
+            try:
+                yield from body(e)
+            except Continue as c:
+                c.handle(label)
+    except Break as b:
+        b.handle(label)
+        return b.result
+    if else_:
+        return (yield from else_())
+    return ()
+
+
+class attrs(object):
+    """
+    Attribute view proxy of a mapping.
+
+    Provides Lua-like syntactic sugar when the mapping has string
+    keys that are also valid Python identifiers, which is a common
+    occurrence in Python, for example, calling vars() on an object
+    returns such a dict.
+
+    Unlike a SimpleNamespace, an attrs proxy doesn't show the extra
+    magic attrs from the class, and it can write through to any type of
+    mapping.
+
+    >>> spam = {}
+    >>> atspam = attrs(spam)
+
+    get and set string keys as attrs
+    >>> atspam.one = 1
+    >>> atspam.one
+    1
+    >>> atspam
+    attrs({'one': 1})
+
+    changes write through to underlying dict
+    >>> spam
+    {'one': 1}
+
+    calling the object returns the underlying dict for direct access
+    to all dict methods and syntax
+    >>> list(
+    ...  atspam().items()
+    ... )
+    [('one', 1)]
+    >>> atspam()['one'] = 42
+    >>> atspam()
+    {'one': 42}
+
+    del removes the key
+    >>> del atspam.one
+    >>> atspam
+    attrs({})
+
+    Plain dicts (the usual case, e.g. from vars() or class bodies)
+    become the proxy's own instance __dict__, so writes and deletes
+    of keys run at C speed. Other mappings go through __setattr__
+    and friends.
+    >>> type(atspam) is attrs
+    False
+    >>> isinstance(atspam, attrs)
+    True
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, mapping):
+        if cls is attrs:
+            cls = _dict_attrs if type(mapping) is dict else _mapping_attrs
+        return object.__new__(cls)
+
+    def __repr__(self):
+        return "attrs(" + repr(self()) + ")"
+
+
+class _dict_slot(attrs):
+    __slots__ = "__dict__"
+
+
+_get_dict = _dict_slot.__dict__["__dict__"].__get__
+_set_dict = _dict_slot.__dict__["__dict__"].__set__
+
+
+class _dict_attrs(_dict_slot):
+    __slots__ = ()
+
+    # Shadows the data descriptors, so the generic __setattr__ and
+    # __delattr__ write these through to the dict, like any other key.
+    __class__ = __dict__ = None
+
+    def __init__(self, mapping):
+        _set_dict(self, mapping)
+
+    def __call__(self):
+        return _get_dict(self)
+
+    def __getattribute__(self, attr):
+        # Only the dict, never the class, so dunder keys read like any other.
+        try:
+            return _get_dict(self)[attr]
+        except KeyError as ke:
+            raise AttributeError(*ke.args)
+
+
+class _mapping_attrs(attrs):
+    __slots__ = "mapping"
+
+    def __init__(self, mapping):
+        _set_mapping(self, mapping)
+
+    def __call__(self):
+        return _get_mapping(self)
+
+    def __getattribute__(self, attr):
+        try:
+            return _get_mapping(self)[attr]
+        except KeyError as ke:
+            raise AttributeError(*ke.args)
+
+    def __setattr__(self, attr, val):
+        _get_mapping(self)[attr] = val
+
+    def __delattr__(self, attr):
+        try:
+            del _get_mapping(self)[attr]
+        except KeyError as ke:
+            raise AttributeError(*ke.args)
+
+
+_get_mapping = _mapping_attrs.mapping.__get__
+_set_mapping = _mapping_attrs.mapping.__set__
+
+
+def _attach(target, **kwargs):
+    for k, v in kwargs.items():
+        setattr(target, k, v)
+    return target
@@ -0,0 +1,95 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Source maps from compiled Python back to .hebi lines.
+
+The lexer records token positions, the parser locates the forms it
+builds, and the compiler marks its output with a comment wherever the
+.hebi line changes, like Hissp's own comments naming each macro::
+
+    # example.hebi:12
+    # hebi.basic.._macro_.def_
+    __import__('builtins').globals().__setitem__(
+
+Reading the comments back gives the .hebi line and innermost macro for
+each line of Python, which is saved as a sidecar .py.map (JSON) next
+to transpiled modules, and used to give code objects .hebi line
+numbers (co_lines) for tracebacks and profiling.
+"""
+
+import ast
+import json
+import re
+
+MARK = re.compile(r"# (\S+\.hebi):(\d+)$")
+MACRO = re.compile(r"^ *# ([^\s()'\"]+)$")  # Hissp's, on its own line.
+
+
+class SourceMap:
+    """
+    Where forms came from, and where their Python ended up.
+
+    positions is filled by lex(), one (line, column) per token.
+    parse() then locates each tuple it builds by its first token.
+    After compiling, read() fills lines, the (.hebi line, macro)
+    for each line of the Python, counting from 1 like co_lines.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.positions = []
+        self.lines = [None]  # Line 0 isn't a line.
+        self._located = {}
+
+    def locate(self, form, index):
+        self._located[id(form)] = form, index
+
+    def position(self, form):
+        """(line, column) of a parsed form, or None."""
+        located = self._located.get(id(form))
+        # Macros make new tuples, which may reuse a dead form's id.
+        if located and located[0] is form:
+            return self.positions[located[1]]
+
+    def mark(self, line):
+        return f"# {self.source}:{line}\n"
+
+    def read(self, python):
+        """Maps each line of python by the marks above it."""
+        line, macro = 1, None
+        self.lines = [None]
+        for text in python.split("\n"):
+            mark = MARK.search(text)
+            if mark and mark[1] == self.source:
+                line, macro = int(mark[2]), None
+            elif MACRO.match(text):
+                macro = MACRO.match(text)[1]
+            self.lines.append((line, macro))
+        return self
+
+    def macro(self, line):
+        """The first macro expanded for a .hebi line."""
+        for hebi_line, macro in self.lines[1:]:
+            if hebi_line == line and macro:
+                return macro
+
+    def remap(self, tree):
+        """Renumbers an ast of the read Python with .hebi lines."""
+        for node in ast.walk(tree):
+            if "lineno" in node._attributes:
+                node.lineno = self.lines[node.lineno][0]
+                node.end_lineno = node.lineno
+                node.col_offset = node.end_col_offset = -1  # Unknown: no carets.
+        return tree
+
+    def dump(self, file):
+        json.dump({"version": 1, "source": self.source, "lines": self.lines[1:]}, file)
+
+    @classmethod
+    def load(cls, file):
+        data = json.load(file)
+        self = cls(data["source"])
+        self.lines = [None, *map(tuple, data["lines"])]
+        return self
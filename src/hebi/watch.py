@@ -0,0 +1,160 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Watch mode: recompiling only the modules a change affects.
+
+Compiling a module imports what its macros need: the modules they're
+from, and whatever those import in turn. While each module compiles,
+the Watcher records which modules from the watched tree turn up in
+sys.modules, as its compile-time dependencies. When a module's source
+changes, it's recompiled, along with every module depending on it at
+compile time (transitively), dependencies first. So changing a macro
+rebuilds the modules using it, but changing a plain module rebuilds
+just that one.
+
+The tree is polled, which only stats each source file.
+"""
+
+import os
+import sys
+import time
+from collections import defaultdict
+from importlib import invalidate_caches
+from pathlib import Path
+
+from hebi.compileall import _base, _qualname, compile_file
+
+
+class Watcher:
+    """
+    Keeps the .hebi modules under root compiled to .py next to them.
+
+    Call rebuild(scan()) to bring them up to date. Sources are the
+    .hebi files, and .py files that weren't transpiled from one.
+    """
+
+    def __init__(self, root, optimize=0, build=True):
+        self.root = Path(root)
+        self.base = _base(self.root)
+        self.optimize = optimize
+        self.build = build
+        self.depends = {}  # Module name: tree modules it imported to compile.
+        self.failed = {}  # Module name: the exception it last raised.
+        self.hebi = {}  # Module name: .hebi path.
+        self.names = set()  # Of all the tree's modules.
+        self._mtimes = {}
+
+    def scan(self):
+        """The names of the modules changed, added, or removed since the last scan."""
+        mtimes = {}
+        for directory, dirs, files in os.walk(self.root):
+            dirs[:] = [d for d in dirs if d != "__pycache__"]
+            for file in files:
+                if file.endswith(".hebi") or (
+                    file.endswith(".py") and f"{file[:-3]}.hebi" not in files
+                ):
+                    path = os.path.join(directory, file)
+                    mtimes[path] = os.stat(path).st_mtime_ns
+        changed = {
+            path
+            for path in mtimes.keys() | self._mtimes.keys()
+            if mtimes.get(path) != self._mtimes.get(path)
+        }
+        self._mtimes = mtimes
+        names = {path: _qualname(Path(path).relative_to(self.base)) for path in mtimes}
+        self.names = {*names.values()}
+        self.hebi = {name: Path(path) for path, name in names.items() if path.endswith(".hebi")}
+        return {_qualname(Path(path).relative_to(self.base)) for path in changed}
+
+    def affected(self, changed):
+        """The changed modules, and all that depend on them to compile."""
+        dependents = defaultdict(set)
+        for name, depends in self.depends.items():
+            for dependency in depends:
+                dependents[dependency].add(name)
+        affected = set(changed)
+        pending = [*changed]
+        while pending:
+            for name in dependents[pending.pop()] - affected:
+                affected.add(name)
+                pending.append(name)
+        return affected
+
+    def order(self, names):
+        """The names, each after its (known) dependencies."""
+        ordered, seen = [], set()
+
+        def visit(name):
+            if name not in seen:
+                seen.add(name)
+                for dependency in sorted(self.depends.get(name, set()) & names):
+                    visit(dependency)
+                ordered.append(name)
+
+        for name in sorted(names):
+            visit(name)
+        return ordered
+
+    def rebuild(self, changed):
+        """
+        Recompiles the changed modules, those affected, and any that
+        failed last time. Returns the names of those compiled.
+
+        A module whose dependency failed isn't compiled against the old
+        one; it fails, too. Those that fail otherwise are retried after
+        the rest (their dependencies may be new), until a round makes
+        no progress. The failures are left in the failed dict.
+        """
+        affected = self.affected({*changed, *self.failed})
+        for name in affected - self.hebi.keys():
+            self.depends.pop(name, None)  # Removed, or plain Python.
+        compiled = []
+        pending = [name for name in self.order(affected) if name in self.hebi]
+        while pending:
+            failed = {}
+            for name in pending:
+                for dependency in sorted(self.depends.get(name, set()) & failed.keys()):
+                    failed[name] = failed[dependency]
+                    break
+                else:
+                    try:
+                        self.compile(name)
+                    except Exception as e:
+                        failed[name] = e
+                        continue
+                    compiled.append(name)
+            if len(failed) == len(pending):
+                break
+            pending = [*failed]
+            invalidate_caches()
+        self.failed = failed if pending else {}
+        return compiled
+
+    def compile(self, name):
+        path = self.hebi[name]
+        for module in self.names:  # So they're imported (again) if needed.
+            sys.modules.pop(module, None)
+        before = {*sys.modules}
+        compile_file(path, name, self.optimize, levels=(), build=self.build)
+        for stale in path.parent.glob(f"__pycache__/{path.stem}.*.pyc"):
+            stale.unlink()  # Older bytecode could shadow the new .py.
+        self.depends[name] = ({*sys.modules} - before) & self.names - {name}
+
+
+def watch(root, optimize=0, build=True, interval=0.5, log=print):
+    """Compiles the .hebi modules under root, then keeps them compiled."""
+    watcher = Watcher(root, optimize, build)
+    sys.path.insert(0, str(watcher.base))
+    try:
+        while True:
+            changed = watcher.scan()
+            if changed:
+                for name in watcher.rebuild(changed):
+                    log("compiled", name)
+                for name, error in watcher.failed.items():
+                    log("failed", name, f"({type(error).__name__}: {error})".strip())
+            time.sleep(interval)
+    finally:
+        sys.path.remove(str(watcher.base))
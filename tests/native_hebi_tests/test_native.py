@@ -0,0 +1,3666 @@
+("""
+Native tests in the Hebi-go.
+""")
+
+# hebi.basic.._macro_.from_
+(lambda module:
+  __import__('builtins').globals().update(
+    dict(
+      TestCase=module.TestCase)))(
+  __import__(
+    'unittest',
+    globals=__import__('builtins').globals(),
+    fromlist=['TestCase'],
+    level=(0)))
+
+# hebi.basic.._macro_.from_
+(lambda module:
+  __import__('builtins').globals().update(
+    dict(
+      given=module.given)))(
+  __import__(
+    'hypothesis',
+    globals=__import__('builtins').globals(),
+    fromlist=['given'],
+    level=(0)))
+
+# hebi.basic.._macro_.import_
+(lambda :
+  __import__('builtins').globals().__setitem__(
+    'st',
+    __import__(
+      'hypothesis.strategies',
+      __import__('builtins').globals(),
+      fromlist=':')))()
+
+# hebi.basic.._macro_.from_
+(lambda module:
+  __import__('builtins').globals().update(
+    dict(
+      function=module.function)))(
+  __import__(
+    'hebi.runtime',
+    globals=__import__('builtins').globals(),
+    fromlist=['function'],
+    level=(0)))
+
+print(
+  st)
+
+print(
+  TestCase)
+
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  '_macro_',
+  __import__('types').SimpleNamespace())
+
+# hebi.basic.._macro_.def_
+# hebi.basic.._macro_.def_
+__import__('builtins').setattr(
+  _macro_,
+  'zuper',
+  __import__('hebi.runtime',fromlist='?').function(
+    '_macro_.zuper',
+    (lambda :(('super',))),
+    None))
+
+# hebi.basic.._macro_.def_
+# hebi.basic.._macro_.def_
+__import__('builtins').setattr(
+  _macro_,
+  'pause',
+  __import__('hebi.runtime',fromlist='?').function(
+    '_macro_.pause',
+    (lambda x:(('hebi.basic.._macro_.await_', ('asyncio..sleep', 0, x)))),
+    None))
+
+# hebi.basic.._macro_.def_
+# hebi.basic.._macro_.def_
+__import__('builtins').setattr(
+  _macro_,
+  'emit',
+  __import__('hebi.runtime',fromlist='?').function(
+    '_macro_.emit',
+    (lambda x:(('hebi.basic.._macro_.yield_', x))),
+    None))
+
+# hebi.basic.._macro_.def_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'greet',
+  __import__('hebi.runtime',fromlist='?').function(
+    'greet',
+    (lambda name:
+      print(
+        ("Hello,"),
+        name)),
+    None))
+
+# hebi.basic.._macro_.class_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'TestAnd',
+  __import__('hebi.runtime',fromlist='?')._class_(
+    'TestAnd',
+    __import__('hebi.runtime',fromlist='?').akword(
+      TestCase),
+    None,
+    globals(),
+    (lambda _ns_:(
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_null',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_null'),
+          (lambda self:
+            self.assertIs(
+              True,
+              # hebi.basic.._macro_.and_
+              True)),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_one',
+        given(
+          st.from_type(
+            type))(
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_one'),
+            (lambda self,x:
+              self.assertIs(
+                x,
+                # hebi.basic.._macro_.and_
+                x)),
+            None))),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_two',
+        given(
+          st.from_type(
+            type),
+          st.from_type(
+            type))(
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_two'),
+            (lambda self,x,y:
+              self.assertIs(
+                ((x and y)),
+                # hebi.basic.._macro_.and_
+                __import__('hebi.runtime',fromlist='?')._and_(
+                  x,
+                  (lambda :y)))),
+            None))),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_shortcut',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_shortcut'),
+          (lambda self:(
+            # hebi.basic.._macro_.and_
+            __import__('hebi.runtime',fromlist='?')._and_(
+              (0),
+              (lambda :((0/0)))),
+            # hebi.basic.._macro_.and_
+            __import__('hebi.runtime',fromlist='?')._and_(
+              (1),
+              (lambda :(0)),
+              (lambda :((0/0)))),
+            # hebi.basic.._macro_.and_
+            __import__('hebi.runtime',fromlist='?')._and_(
+              (0),
+              (lambda :((0/0))),
+              (lambda :((0/0)))))[-1]),
+          None)),
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'my_given',
+        given),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_three',
+        _ns_.my_given(
+          st.from_type(
+            type),
+          st.from_type(
+            type),
+          st.from_type(
+            type))(
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_three'),
+            (lambda self,x,y,z:
+              self.assertIs(
+                ((x and y and z)),
+                # hebi.basic.._macro_.and_
+                __import__('hebi.runtime',fromlist='?')._and_(
+                  x,
+                  (lambda :y),
+                  (lambda :z)))),
+            None))))[-1])))
+
+# hebi.basic.._macro_.class_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'TestOr',
+  __import__('hebi.runtime',fromlist='?')._class_(
+    'TestOr',
+    __import__('hebi.runtime',fromlist='?').akword(
+      TestCase),
+    None,
+    globals(),
+    (lambda _ns_:(
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_null',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_null'),
+          (lambda self:
+            self.assertEqual(
+              (),
+              # hebi.basic.._macro_.or_
+              ())),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_one',
+        given(
+          st.from_type(
+            type))(
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_one'),
+            (lambda self,x:
+              self.assertIs(
+                x,
+                # hebi.basic.._macro_.or_
+                x)),
+            None))),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_two',
+        given(
+          st.from_type(
+            type),
+          st.from_type(
+            type))(
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_two'),
+            (lambda self,x,y:
+              self.assertIs(
+                ((x or y)),
+                # hebi.basic.._macro_.or_
+                __import__('hebi.runtime',fromlist='?')._or_(
+                  x,
+                  (lambda :y)))),
+            None))),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_shortcut',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_shortcut'),
+          (lambda self:(
+            # hebi.basic.._macro_.or_
+            __import__('hebi.runtime',fromlist='?')._or_(
+              (1),
+              (lambda :((0/0)))),
+            # hebi.basic.._macro_.or_
+            __import__('hebi.runtime',fromlist='?')._or_(
+              (0),
+              (lambda :(1)),
+              (lambda :((0/0)))),
+            # hebi.basic.._macro_.or_
+            __import__('hebi.runtime',fromlist='?')._or_(
+              (1),
+              (lambda :((0/0))),
+              (lambda :((0/0)))))[-1]),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_three',
+        given(
+          st.from_type(
+            type),
+          st.from_type(
+            type),
+          st.from_type(
+            type))(
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_three'),
+            (lambda self,x,y,z:
+              self.assertIs(
+                ((x or y or z)),
+                # hebi.basic.._macro_.or_
+                __import__('hebi.runtime',fromlist='?')._or_(
+                  x,
+                  (lambda :y),
+                  (lambda :z)))),
+            None))))[-1])))
+
+# hebi.basic.._macro_.class_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'TestNot',
+  __import__('hebi.runtime',fromlist='?')._class_(
+    'TestNot',
+    __import__('hebi.runtime',fromlist='?').akword(
+      TestCase),
+    None,
+    globals(),
+    (lambda _ns_:
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_not',
+        given(
+          st.from_type(
+            type))(
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_not'),
+            (lambda self,x:
+              self.assertEqual(
+                ((not x)),
+                bool(
+                  # hebi.basic.._macro_.not_
+                  __import__('hebi.runtime',fromlist='?')._not_(
+                    x)))),
+            None))))))
+
+# hebi.basic.._macro_.class_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'TestLet',
+  __import__('hebi.runtime',fromlist='?')._class_(
+    'TestLet',
+    __import__('hebi.runtime',fromlist='?').akword(
+      TestCase),
+    None,
+    globals(),
+    (lambda _ns_:(
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_single',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_single'),
+          (lambda self:
+            self.assertEqual(
+              (42),
+              # hebi.basic.._macro_.let
+              (lambda a:a)(
+                ((40 + 2))))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_2',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_2'),
+          (lambda self:
+            self.assertEqual(
+              (24),
+              # hebi.basic.._macro_.let
+              (lambda a,b:((a + b)))(
+                *__import__('hebi.runtime',fromlist='?')._unpack(
+                  __import__('hebi.runtime',fromlist='?').entuple(
+                    ':,',
+                    'a',
+                    'b'),
+                  ([20, 4]))))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_nested',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_nested'),
+          (lambda self:
+            self.assertEqual(
+              ([1,2,3,4,5,6,7,8]),
+              # hebi.basic.._macro_.let
+              (lambda a,b,c,d,e,f,g,h:([a,b,c,d,e,f,g,h]))(
+                *__import__('hebi.runtime',fromlist='?')._unpack(
+                  __import__('hebi.runtime',fromlist='?').entuple(
+                    ':,',
+                    __import__('hebi.runtime',fromlist='?').entuple(
+                      ':,',
+                      __import__('hebi.runtime',fromlist='?').entuple(
+                        ':,',
+                        'a',
+                        'b'),
+                      __import__('hebi.runtime',fromlist='?').entuple(
+                        ':,',
+                        'c',
+                        'd')),
+                    __import__('hebi.runtime',fromlist='?').entuple(
+                      ':,',
+                      __import__('hebi.runtime',fromlist='?').entuple(
+                        ':,',
+                        'e',
+                        'f'),
+                      __import__('hebi.runtime',fromlist='?').entuple(
+                        ':,',
+                        'g',
+                        'h'))),
+                  ([[[1, 2],
+                                [3, 4]],
+                               [[5, 6],
+                                [7, 8]]]))))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_ignored',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_ignored'),
+          (lambda self:
+            self.assertEqual(
+              ([1, 4, 5, 42]),
+              # hebi.basic.._macro_.let
+              (lambda _:
+                (lambda a,d,e:([a, d, e, _]))(
+                  *__import__('hebi.runtime',fromlist='?')._unpack(
+                    __import__('hebi.runtime',fromlist='?').entuple(
+                      ':,',
+                      'a',
+                      '_',
+                      '_',
+                      'd',
+                      'e'),
+                    ([1, 2, 3, 4, 5]))))(
+                (42)))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_list',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_list'),
+          (lambda self:
+            self.assertEqual(
+              ([1, 2, [3, 4, 5]]),
+              # hebi.basic.._macro_.let
+              (lambda a,b,c:([a, b, c]))(
+                *__import__('hebi.runtime',fromlist='?')._unpack(
+                  __import__('hebi.runtime',fromlist='?').entuple(
+                    ':,',
+                    'a',
+                    'b',
+                    ':list',
+                    'c'),
+                  ([1, 2, 3, 4, 5]))))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_iter',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_iter'),
+          (lambda self:
+            self.assertEqual(
+              (['a', 'c', 'b', 'd', 'e']),
+              # hebi.basic.._macro_.let
+              (lambda a,b,c:([a, next(c), b, *c]))(
+                *__import__('hebi.runtime',fromlist='?')._unpack(
+                  __import__('hebi.runtime',fromlist='?').entuple(
+                    ':,',
+                    'a',
+                    'b',
+                    ':iter',
+                    'c'),
+                  ('abcde'))))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_mapping',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_mapping'),
+          (lambda self:
+            self.assertEqual(
+              (['one', 'bar']),
+              # hebi.basic.._macro_.let
+              (lambda a,b:([a, b]))(
+                *__import__('hebi.runtime',fromlist='?')._unpack(
+                  __import__('hebi.runtime',fromlist='?').entuple(
+                    ':=',
+                    'a',
+                    (1),
+                    'b',
+                    ('foo')),
+                  ({1: 'one', 'foo': 'bar'}))))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_nested_mapping',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_nested_mapping'),
+          (lambda self:
+            self.assertEqual(
+              (['one', 'spam', 'eggs']),
+              # hebi.basic.._macro_.let
+              (lambda a,b,c:([a, b, c]))(
+                *__import__('hebi.runtime',fromlist='?')._unpack(
+                  __import__('hebi.runtime',fromlist='?').entuple(
+                    ':=',
+                    'a',
+                    (1),
+                    __import__('hebi.runtime',fromlist='?').entuple(
+                      ':=',
+                      'b',
+                      ('foo')),
+                    (2),
+                    __import__('hebi.runtime',fromlist='?').entuple(
+                      ':=',
+                      'c',
+                      ('bar')),
+                    (3)),
+                  ({1: 'one',
+                               2: {'foo': 'spam'},
+                               3: {'bar': 'eggs'}}))))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_too_many',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_too_many'),
+          (lambda self:
+            self.assertEqual(
+              ([1, 2, 3]),
+              # hebi.basic.._macro_.let
+              (lambda a,b,c:([a, b, c]))(
+                *__import__('hebi.runtime',fromlist='?')._unpack(
+                  __import__('hebi.runtime',fromlist='?').entuple(
+                    ':,',
+                    'a',
+                    'b',
+                    'c'),
+                  ([1, 2, 3, 4, 5]))))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_as',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_as'),
+          (lambda self:
+            self.assertEqual(
+              ([[3,7], 3, 7, 'xy', 'x', 'y']),
+              # hebi.basic.._macro_.let
+              (lambda x1,y1,point1,x2,y2,point2:([point1, x1, y1, point2, x2, y2]))(
+                *__import__('hebi.runtime',fromlist='?')._unpack(
+                  __import__('hebi.runtime',fromlist='?').entuple(
+                    ':,',
+                    __import__('hebi.runtime',fromlist='?').entuple(
+                      ':,',
+                      'x1',
+                      'y1',
+                      ':as',
+                      'point1'),
+                    __import__('hebi.runtime',fromlist='?').entuple(
+                      ':,',
+                      'x2',
+                      'y2',
+                      ':as',
+                      'point2')),
+                  ([[3, 7], 'xy']))))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_mapping_as',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_mapping_as'),
+          (lambda self:
+            self.assertEqual(
+              (['spam', {1:'spam'}]),
+              # hebi.basic.._macro_.let
+              (lambda s,d:([s, d]))(
+                *__import__('hebi.runtime',fromlist='?')._unpack(
+                  __import__('hebi.runtime',fromlist='?').entuple(
+                    ':=',
+                    's',
+                    (1),
+                    ':as',
+                    'd'),
+                  ({1:'spam'}))))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_nested_mixed',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_nested_mixed'),
+          (lambda self:(
+            self.assertEqual(
+              (['a', 'b', 'ab']),
+              # hebi.basic.._macro_.let
+              (lambda a,b,s:([a, b, s]))(
+                *__import__('hebi.runtime',fromlist='?')._unpack(
+                  __import__('hebi.runtime',fromlist='?').entuple(
+                    ':=',
+                    __import__('hebi.runtime',fromlist='?').entuple(
+                      ':,',
+                      'a',
+                      'b',
+                      ':as',
+                      's'),
+                    (1)),
+                  ({1:'ab'})))),
+            self.assertEqual(
+              ([[{1:'ab'}], 'ab']),
+              # hebi.basic.._macro_.let
+              (lambda s,d:([d, s]))(
+                *__import__('hebi.runtime',fromlist='?')._unpack(
+                  __import__('hebi.runtime',fromlist='?').entuple(
+                    ':,',
+                    __import__('hebi.runtime',fromlist='?').entuple(
+                      ':=',
+                      's',
+                      (1)),
+                    ':as',
+                    'd'),
+                  ([{1:'ab'}])))),
+            self.assertEqual(
+              (['a', 'b', [{1:'ab'}], 'ab']),
+              # hebi.basic.._macro_.let
+              (lambda a,b,s,d:([a, b, d, s]))(
+                *__import__('hebi.runtime',fromlist='?')._unpack(
+                  __import__('hebi.runtime',fromlist='?').entuple(
+                    ':,',
+                    __import__('hebi.runtime',fromlist='?').entuple(
+                      ':=',
+                      __import__('hebi.runtime',fromlist='?').entuple(
+                        ':,',
+                        'a',
+                        'b',
+                        ':as',
+                        's'),
+                      (1)),
+                    ':as',
+                    'd'),
+                  ([{1:'ab'}])))),
+            self.assertEqual(
+              ('spam'),
+              # hebi.basic.._macro_.let
+              (lambda s:s)(
+                *__import__('hebi.runtime',fromlist='?')._unpack(
+                  __import__('hebi.runtime',fromlist='?').entuple(
+                    ':=',
+                    __import__('hebi.runtime',fromlist='?').entuple(
+                      ':,',
+                      __import__('hebi.runtime',fromlist='?').entuple(
+                        ':=',
+                        's',
+                        (2))),
+                    (1)),
+                  ({1:[{2:'spam'}]})))))[-1]),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_strs',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_strs'),
+          (lambda self:
+            self.assertEqual(
+              ([1, 2, 3]),
+              # hebi.basic.._macro_.let
+              (lambda a,b,c:([a, b, c]))(
+                *__import__('hebi.runtime',fromlist='?')._unpack(
+                  __import__('hebi.runtime',fromlist='?').entuple(
+                    ':=',
+                    (':strs', 'a', 'b', 'c')),
+                  ({'a':1, 'b':2, 'c':3}))))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_default',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_default'),
+          (lambda self:
+            self.assertEqual(
+              (['A','b','C','d']),
+              # hebi.basic.._macro_.let
+              (lambda a,b,c,d:([a,b,c,d]))(
+                *__import__('hebi.runtime',fromlist='?')._unpack(
+                  __import__('hebi.runtime',fromlist='?').entuple(
+                    ':=',
+                    'a',
+                    (1),
+                    'b',
+                    (2),
+                    'c',
+                    (3),
+                    'd',
+                    (4),
+                    __import__('hebi.runtime',fromlist='?').entuple(
+                      ':default',
+                      'a',
+                      ('A'),
+                      'b',
+                      ('X'),
+                      'c',
+                      ('C'))),
+                  ({2:'b', 4:'d'}))))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_default_strs',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_default_strs'),
+          (lambda self:
+            self.assertEqual(
+              (['ab', 22, 33]),
+              # hebi.basic.._macro_.let
+              (lambda a,b,c:([a, b, c]))(
+                *__import__('hebi.runtime',fromlist='?')._unpack(
+                  __import__('hebi.runtime',fromlist='?').entuple(
+                    ':=',
+                    (':strs', 'a', 'b', 'c'),
+                    __import__('hebi.runtime',fromlist='?').entuple(
+                      ':default',
+                      'a',
+                      (('a'+'b')))),
+                  ({'b':22,'c':33}))))),
+          None)))[-1])))
+
+# hebi.basic.._macro_.class_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'TestLoop',
+  __import__('hebi.runtime',fromlist='?')._class_(
+    'TestLoop',
+    __import__('hebi.runtime',fromlist='?').akword(
+      TestCase),
+    None,
+    globals(),
+    (lambda _ns_:(
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_loop',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_loop'),
+          (lambda self:
+            self.assertEqual(
+              ('cba'),
+              # hebi.basic.._macro_.loop
+              __import__('hebi.runtime',fromlist='?')._loop(
+                (lambda recur,xs=('abc'),ys=(''):
+                  __import__('hebi.runtime',fromlist='?')._if_(
+                    xs,
+                    (lambda :
+                      recur(
+                        ((xs[:-1])),
+                        ((ys + xs[-1])))),
+                    else_=(lambda :ys))))())),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_try_iter',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_try_iter'),
+          (lambda self:
+            # hebi.basic.._macro_.let
+            (lambda xs:(
+              __import__('hebi.runtime',fromlist='?')._loop(
+                (lambda recur,it=iter(
+                  ('abc')):
+                  __import__('hebi.runtime',fromlist='?')._try_(
+                    (lambda :
+                      xs.append(
+                        next(
+                          it).upper())),
+                    StopIteration,
+                    (lambda xAUTO0_:()),
+                    else_=(lambda :
+                      recur(
+                        it)))))(),
+              self.assertEqual(
+                (['A', 'B', 'C']),
+                xs))[-1])(
+              ([]))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_for',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_for'),
+          (lambda self:
+            # hebi.basic.._macro_.let
+            (lambda xs:(
+              __import__('hebi.runtime',fromlist='?')._for_(
+                ('abc'),
+                (lambda c:
+                  xs.append(
+                    c.upper())),
+                label=None),
+              self.assertEqual(
+                (['A', 'B', 'C']),
+                xs))[-1])(
+              ([]))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_for_bind',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_for_bind'),
+          (lambda self:
+            # hebi.basic.._macro_.let
+            (lambda xs:(
+              __import__('hebi.runtime',fromlist='?')._for_(
+                zip(
+                  ('abc'),
+                  ([1,2,3])),
+                (lambda xAUTO0_:
+                  (lambda c,i:
+                    xs.append(
+                      ((c*i))))(
+                    *__import__('hebi.runtime',fromlist='?')._unpack(
+                      __import__('hebi.runtime',fromlist='?').entuple(
+                        ':,',
+                        'c',
+                        'i'),
+                      xAUTO0_))),
+                label=None),
+              self.assertEqual(
+                (['a','bb','ccc']),
+                xs))[-1])(
+              ([]))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_break',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_break'),
+          (lambda self:(
+            # hebi.basic.._macro_.let
+            (lambda cs:(
+              self.assertEqual(
+                ('c'),
+                __import__('hebi.runtime',fromlist='?')._for_(
+                  cs,
+                  (lambda c:
+                    __import__('hebi.runtime',fromlist='?')._if_(
+                      ((c=='c')),
+                      (lambda :
+                        __import__('hebi.runtime',fromlist='?').Break(
+                          c)))),
+                  label=None)),
+              self.assertEqual(
+                (['d', 'e', 'f', 'g']),
+                list(
+                  cs)))[-1])(
+              iter(
+                ('abcdefg'))),
+            self.assertEqual(
+              None,
+              # hebi.basic.._macro_.for_
+              __import__('hebi.runtime',fromlist='?')._for_(
+                ('abc'),
+                (lambda c:
+                  __import__('hebi.runtime',fromlist='?')._if_(
+                    ((c=='c')),
+                    (lambda :__import__('hebi.runtime',fromlist='?').Break()))),
+                label=None)))[-1]),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_labeled_break',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_labeled_break'),
+          (lambda self:
+            # hebi.basic.._macro_.let
+            (lambda ijs:(
+              self.assertEqual(
+                (1),
+                __import__('hebi.runtime',fromlist='?')._for_(
+                  ([0,1,2,3]),
+                  (lambda i:
+                    __import__('hebi.runtime',fromlist='?')._for_(
+                      ([2,1]),
+                      (lambda j:(
+                        ijs.append(
+                          ([i, j])),
+                        __import__('hebi.runtime',fromlist='?')._if_(
+                          ((i==j)),
+                          (lambda :
+                            __import__('hebi.runtime',fromlist='?').Break(
+                              i,
+                              label=':top'))))[-1]),
+                      label=None)),
+                  label=':top')),
+              self.assertEqual(
+                ([[0, 2],
+                         [0, 1],
+                         [1, 2],
+                         [1, 1]]),
+                ijs))[-1])(
+              ([]))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_continue',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_continue'),
+          (lambda self:
+            # hebi.basic.._macro_.let
+            (lambda ijs:(
+              self.assertEqual(
+                (),
+                __import__('hebi.runtime',fromlist='?')._for_(
+                  ([1,2,3]),
+                  (lambda i:
+                    __import__('hebi.runtime',fromlist='?')._for_(
+                      ([1,2,3]),
+                      (lambda j:(
+                        __import__('hebi.runtime',fromlist='?')._if_(
+                          ((i==j)),
+                          (lambda :
+                            __import__('hebi.runtime',fromlist='?').Continue(
+                              None))),
+                        ijs.append(
+                          ([i, j])))[-1]),
+                      label=None)),
+                  label=None)),
+              self.assertEqual(
+                ([[1, 2],
+                         [1, 3],
+                         [2, 1],
+                         [2, 3],
+                         [3, 1],
+                         [3, 2]]),
+                ijs))[-1])(
+              ([]))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_labeled_continue',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_labeled_continue'),
+          (lambda self:
+            # hebi.basic.._macro_.let
+            (lambda ijs:(
+              self.assertEqual(
+                (),
+                __import__('hebi.runtime',fromlist='?')._for_(
+                  ([1,2,3]),
+                  (lambda i:
+                    __import__('hebi.runtime',fromlist='?')._for_(
+                      ([1,2,3]),
+                      (lambda j:(
+                        __import__('hebi.runtime',fromlist='?')._if_(
+                          ((i==j)),
+                          (lambda :
+                            __import__('hebi.runtime',fromlist='?').Continue(
+                              ':top'))),
+                        ijs.append(
+                          ([i, j])))[-1]),
+                      label=None)),
+                  label=':top')),
+              self.assertEqual(
+                ([[2, 1],
+                         [3, 1],
+                         [3, 2]]),
+                ijs))[-1])(
+              ([]))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_for_else',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_for_else'),
+          (lambda self:(
+            self.assertEqual(
+              ('c'),
+              # hebi.basic.._macro_.for_
+              __import__('hebi.runtime',fromlist='?')._for_(
+                ('abcdefg'),
+                (lambda c:
+                  __import__('hebi.runtime',fromlist='?')._if_(
+                    ((c=='c')),
+                    (lambda :
+                      __import__('hebi.runtime',fromlist='?').Break(
+                        c)))),
+                else_=(lambda :('z')),
+                label=None)),
+            self.assertEqual(
+              ('z'),
+              # hebi.basic.._macro_.for_
+              __import__('hebi.runtime',fromlist='?')._for_(
+                ('abcdefg'),
+                (lambda c:
+                  __import__('hebi.runtime',fromlist='?')._if_(
+                    ((c=='C')),
+                    (lambda :
+                      __import__('hebi.runtime',fromlist='?').Break(
+                        c)))),
+                else_=(lambda :('z')),
+                label=None)))[-1]),
+          None)))[-1])))
+
+# hebi.basic.._macro_.class_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'TestDef',
+  __import__('hebi.runtime',fromlist='?')._class_(
+    'TestDef',
+    __import__('hebi.runtime',fromlist='?').akword(
+      TestCase),
+    None,
+    globals(),
+    (lambda _ns_:(
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_def_ns',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_def_ns'),
+          (lambda self:
+            # hebi.basic.._macro_.let
+            (lambda o:(
+              __import__('builtins').setattr(
+                o,
+                'foo',
+                (2)),
+              __import__('builtins').setattr(
+                o,
+                'foo',
+                ((o.foo * 3))),
+              self.assertEqual(
+                (6),
+                o.foo))[-1])(
+              __import__('types').SimpleNamespace())),
+          ("""How to emulate local reassignment."""))),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_def_anaphoric_ns',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_def_anaphoric_ns'),
+          (lambda self:
+            # hebi.basic.._macro_.let
+            (lambda _ns_:(
+              __import__('builtins').setattr(
+                _ns_,
+                'foo',
+                (2)),
+              __import__('builtins').setattr(
+                _ns_,
+                'foo',
+                ((_ns_.foo * 3))),
+              self.assertEqual(
+                (6),
+                _ns_.foo))[-1])(
+              __import__('types').SimpleNamespace())),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_def_in_loop',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_def_in_loop'),
+          (lambda self:
+            # hebi.basic.._macro_.let
+            (lambda fs:(
+              __import__('hebi.runtime',fromlist='?')._for_(
+                range(
+                  (3)),
+                (lambda i:
+                  (lambda o:(
+                    __import__('builtins').setattr(
+                      o,
+                      'adder',
+                      __import__('hebi.runtime',fromlist='?').function(
+                        'o.adder',
+                        (lambda x:((x + i))),
+                        ("Adds i."))),
+                    fs.append(
+                      o.adder))[-1])(
+                    __import__('types').SimpleNamespace())),
+                label=None),
+              self.assertEqual(
+                ([10, 11, 12]),
+                (([f(10) for f in fs]))),
+              self.assertEqual(
+                ({'adder'}),
+                (({f.__code__.co_name for f in fs}))),
+              self.assertIs(
+                ((fs[0].__code__)),
+                ((fs[2].__code__))),
+              self.assertEqual(
+                ('Adds i.'),
+                ((fs[1].__doc__))))[-1])(
+              ([]))),
+          None)))[-1])))
+
+# hebi.basic.._macro_.class_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'TestBegin',
+  __import__('hebi.runtime',fromlist='?')._class_(
+    'TestBegin',
+    __import__('hebi.runtime',fromlist='?').akword(
+      TestCase),
+    ("Test Begin Docstring."),
+    globals(),
+    (lambda _ns_:(
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_begin',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_begin'),
+          (lambda self:
+            # hebi.basic.._macro_.let
+            (lambda xs:(
+              self.assertEqual(
+                (3),
+                __import__('hebi.runtime',fromlist='?')._begin(
+                  xs.append(
+                    (1)),
+                  xs.append(
+                    (2)),
+                  (3))),
+              self.assertEqual(
+                xs,
+                ([1, 2])))[-1])(
+              ([]))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_begin_empty',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_begin_empty'),
+          (lambda self:
+            self.assertEqual(
+              (),
+              # hebi.basic.._macro_.begin
+              ())),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_begin0',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_begin0'),
+          (lambda self:
+            # hebi.basic.._macro_.let
+            (lambda xs:(
+              self.assertEqual(
+                (0),
+                __import__('hebi.runtime',fromlist='?')._begin0(
+                  (0),
+                  xs.append(
+                    (1)),
+                  xs.append(
+                    (2)))),
+              self.assertEqual(
+                xs,
+                ([1, 2])))[-1])(
+              ([]))),
+          None)))[-1])))
+
+# hebi.basic.._macro_.class_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'TestClass',
+  __import__('hebi.runtime',fromlist='?')._class_(
+    'TestClass',
+    __import__('hebi.runtime',fromlist='?').akword(
+      TestCase),
+    ("""Test doc"""),
+    globals(),
+    (lambda __class__:
+      (lambda _ns_:(
+        (None and __class__),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_module',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_module'),
+            (lambda self:
+              self.assertEqual(
+                ('tests.native_hebi_tests.test_native'),
+                self.__module__)),
+            None)),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_qualname',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_qualname'),
+            (lambda self:
+              self.assertEqual(
+                ('TestClass'),
+                self.__class__.__qualname__)),
+            None)),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_method_qualname',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_method_qualname'),
+            (lambda self:
+              self.assertEqual(
+                ('TestClass.test_method_qualname'),
+                self.test_method_qualname.__qualname__)),
+            None)),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          '_y_watch',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_._y_watch'),
+            (lambda cls:(
+              # hebi.basic.._macro_.def_
+              __import__('builtins').setattr(
+                cls,
+                'watch',
+                ((cls.watch + "y"))),
+              cls)[-1]),
+            None)),
+        # hebi.basic.._macro_.class_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'Spam',
+          _ns_._y_watch(
+            (lambda cls:(
+              # hebi.basic.._macro_.def_
+              __import__('builtins').setattr(
+                cls,
+                'watch',
+                ("x")),
+              cls)[-1])(
+              __import__('hebi.runtime',fromlist='?')._class_(
+                '_ns_.Spam',
+                __import__('hebi.runtime',fromlist='?').akword(),
+                None,
+                globals(),
+                (lambda _ns_:
+                  # hebi.basic.._macro_.def_
+                  # hebi.basic.._macro_.def_
+                  __import__('builtins').setattr(
+                    _ns_,
+                    'eggs',
+                    __import__('hebi.runtime',fromlist='?').function(
+                      __import__('hebi.runtime',fromlist='?')._qualname(
+                        _ns_,
+                        '_ns_.eggs'),
+                      (lambda self:
+                        # hebi.basic.._macro_.let
+                        (lambda o:(
+                          __import__('builtins').setattr(
+                            o,
+                            'Bacon',
+                            __import__('hebi.runtime',fromlist='?')._class_(
+                              'o.Bacon',
+                              __import__('hebi.runtime',fromlist='?').akword(),
+                              None,
+                              globals(),
+                              (lambda _ns_:()))),
+                          o.Bacon)[-1])(
+                          __import__('types').SimpleNamespace())),
+                      None))),
+                ns=(lambda :_ns_))))),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_nested_qualname',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_nested_qualname'),
+            (lambda self:
+              self.assertEqual(
+                ('TestClass.Spam'),
+                self.Spam.__qualname__)),
+            None)),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_nested_method_qualname',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_nested_method_qualname'),
+            (lambda self:
+              self.assertEqual(
+                ('TestClass.Spam.eggs'),
+                self.Spam.eggs.__qualname__)),
+            None)),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_class_in_method_qualname',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_class_in_method_qualname'),
+            (lambda self:
+              self.assertEqual(
+                ('o.Bacon'),
+                # hebi.basic.._macro_.of
+                __import__('builtins').getattr(
+                  self.Spam().eggs(),
+                  '__qualname__'))),
+            None)),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_doc',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_doc'),
+            (lambda self:
+              self.assertEqual(
+                ("""Test doc"""),
+                self.__doc__)),
+            None)),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_decorator_order',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_decorator_order'),
+            (lambda self:
+              self.assertEqual(
+                ("xy"),
+                self.Spam.watch)),
+            None)),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_super',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_super'),
+            (lambda self:
+              # hebi.basic.._macro_.let
+              (lambda o:(
+                __import__('builtins').setattr(
+                  o,
+                  'Spam',
+                  __import__('hebi.runtime',fromlist='?')._class_(
+                    'o.Spam',
+                    __import__('hebi.runtime',fromlist='?').akword(),
+                    None,
+                    globals(),
+                    (lambda __class__:
+                      (lambda _ns_:(
+                        (None and __class__),
+                        __import__('builtins').setattr(
+                          _ns_,
+                          '__init__',
+                          __import__('hebi.runtime',fromlist='?').function(
+                            __import__('hebi.runtime',fromlist='?')._qualname(
+                              _ns_,
+                              '_ns_.__init__'),
+                            (lambda self:(
+                              super(),
+                              None)[-1]),
+                            None)))[-1])),
+                    cell=True)),
+                o.Spam())[-1])(
+                __import__('types').SimpleNamespace())),
+            None)),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_super_bracketed',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_super_bracketed'),
+            (lambda self:
+              # hebi.basic.._macro_.let
+              (lambda o:(
+                __import__('builtins').setattr(
+                  o,
+                  'Base',
+                  __import__('hebi.runtime',fromlist='?')._class_(
+                    'o.Base',
+                    __import__('hebi.runtime',fromlist='?').akword(),
+                    None,
+                    globals(),
+                    (lambda _ns_:
+                      __import__('builtins').setattr(
+                        _ns_,
+                        'greet',
+                        __import__('hebi.runtime',fromlist='?').function(
+                          __import__('hebi.runtime',fromlist='?')._qualname(
+                            _ns_,
+                            '_ns_.greet'),
+                          (lambda self:
+                            str(
+                              ("base"))),
+                          None))))),
+                __import__('builtins').setattr(
+                  o,
+                  'Derived',
+                  __import__('hebi.runtime',fromlist='?')._class_(
+                    'o.Derived',
+                    __import__('hebi.runtime',fromlist='?').akword(
+                      o.Base),
+                    None,
+                    globals(),
+                    (lambda __class__:
+                      (lambda _ns_:(
+                        (None and __class__),
+                        __import__('builtins').setattr(
+                          _ns_,
+                          'greet',
+                          __import__('hebi.runtime',fromlist='?').function(
+                            __import__('hebi.runtime',fromlist='?')._qualname(
+                              _ns_,
+                              '_ns_.greet'),
+                            (lambda self:(('derived ' + super().greet()))),
+                            None)))[-1])),
+                    cell=True)),
+                self.assertEqual(
+                  ('derived base'),
+                  o.Derived().greet()))[-1])(
+                __import__('types').SimpleNamespace())),
+            None)),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_super_from_macro',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_super_from_macro'),
+            (lambda self:
+              # hebi.basic.._macro_.let
+              (lambda o:(
+                __import__('builtins').setattr(
+                  o,
+                  'Base',
+                  __import__('hebi.runtime',fromlist='?')._class_(
+                    'o.Base',
+                    __import__('hebi.runtime',fromlist='?').akword(),
+                    None,
+                    globals(),
+                    (lambda _ns_:
+                      __import__('builtins').setattr(
+                        _ns_,
+                        'greet',
+                        __import__('hebi.runtime',fromlist='?').function(
+                          __import__('hebi.runtime',fromlist='?')._qualname(
+                            _ns_,
+                            '_ns_.greet'),
+                          (lambda self:
+                            str(
+                              ("base"))),
+                          None))))),
+                __import__('builtins').setattr(
+                  o,
+                  'Derived',
+                  __import__('hebi.runtime',fromlist='?')._class_(
+                    'o.Derived',
+                    __import__('hebi.runtime',fromlist='?').akword(
+                      o.Base),
+                    None,
+                    globals(),
+                    (lambda __class__:
+                      (lambda _ns_:(
+                        (None and __class__),
+                        __import__('builtins').setattr(
+                          _ns_,
+                          'greet',
+                          __import__('hebi.runtime',fromlist='?').function(
+                            __import__('hebi.runtime',fromlist='?')._qualname(
+                              _ns_,
+                              '_ns_.greet'),
+                            (lambda self:super().greet()),
+                            None)))[-1])),
+                    cell=True)),
+                self.assertEqual(
+                  ('base'),
+                  o.Derived().greet()))[-1])(
+                __import__('types').SimpleNamespace())),
+            None)))[-1])),
+    cell=True))
+
+# hebi.basic.._macro_.class_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'TestOf',
+  __import__('hebi.runtime',fromlist='?')._class_(
+    'TestOf',
+    __import__('hebi.runtime',fromlist='?').akword(
+      TestCase),
+    None,
+    globals(),
+    (lambda _ns_:(
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_symbol',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_symbol'),
+          (lambda self:
+            # hebi.basic.._macro_.let
+            (lambda o:(
+              self.assertEqual(
+                (1),
+                __import__('builtins').getattr(
+                  o,
+                  'a')),
+              self.assertEqual(
+                (2),
+                __import__('builtins').getattr(
+                  o,
+                  'b')))[-1])(
+              __import__('types').SimpleNamespace(
+                a=(1),
+                b=(2)))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_key',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_key'),
+          (lambda self:
+            # hebi.basic.._macro_.let
+            (lambda d:(
+              self.assertEqual(
+                (1),
+                __import__('operator').getitem(
+                  d,
+                  ('.a'))),
+              self.assertEqual(
+                (2),
+                __import__('operator').getitem(
+                  d,
+                  (10))))[-1])(
+              ({'.a':1, 10:2}))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_chained',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_chained'),
+          (lambda self:
+            self.assertEqual(
+              (42),
+              # hebi.basic.._macro_.of
+              __import__('operator').getitem(
+                __import__('operator').getitem(
+                  __import__('builtins').getattr(
+                    __import__('types').SimpleNamespace(
+                      attr=([0, {'key': -42}])),
+                    'attr'),
+                  (1)),
+                ('key')).__neg__())),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_identifier',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_identifier'),
+          (lambda self:
+            self.assertEqual(
+              (3.0),
+              # hebi.basic.._macro_.let
+              (lambda i:
+                __import__('builtins').getattr(
+                  __import__('operator').getitem(
+                    ([1j,2j,3j]),
+                    i),
+                  'imag'))(
+                (2)))),
+          None)))[-1])))
+
+# hebi.basic.._macro_.class_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'TestAttach',
+  __import__('hebi.runtime',fromlist='?')._class_(
+    'TestAttach',
+    __import__('hebi.runtime',fromlist='?').akword(
+      TestCase),
+    None,
+    globals(),
+    (lambda _ns_:
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_attach',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_attach'),
+          (lambda self:
+            # hebi.basic.._macro_.let
+            (lambda foo,bar,baz,spam,eggs,o:(
+              self.assertIs(
+                o,
+                __import__('hebi.runtime',fromlist='?')._attach(
+                  o,
+                  foo=foo,
+                  bar=bar,
+                  baz=baz,
+                  quux=spam,
+                  norlf=eggs)),
+              self.assertEqual(
+                __import__('types').SimpleNamespace(
+                  foo=(1),
+                  bar=(2),
+                  baz=(3),
+                  quux=(4),
+                  norlf=(5)),
+                o))[-1])(
+              *__import__('hebi.runtime',fromlist='?')._unpack(
+                __import__('hebi.runtime',fromlist='?').entuple(
+                  ':,',
+                  'foo',
+                  'bar',
+                  'baz',
+                  'spam',
+                  'eggs',
+                  'o'),
+                __import__('hebi.runtime',fromlist='?').entuple(
+                  (1),
+                  (2),
+                  (3),
+                  (4),
+                  (5),
+                  __import__('types').SimpleNamespace())))),
+          None)))))
+
+# hebi.basic.._macro_.class_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'TestImport',
+  __import__('hebi.runtime',fromlist='?')._class_(
+    'TestImport',
+    __import__('hebi.runtime',fromlist='?').akword(
+      TestCase),
+    None,
+    globals(),
+    (lambda _ns_:(
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_import_dotted',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_import_dotted'),
+          (lambda self:(
+            # hebi.basic.._macro_.import_
+            (lambda :
+              __import__('builtins').globals().__setitem__(
+                'xml',
+                __import__(
+                  'xml.dom',
+                  __import__('builtins').globals(),
+                  fromlist=':')))(),
+            self.assertIs(
+              __import__('xml').dom,
+              xml),
+            # hebi.basic.._macro_.import_
+            (lambda :
+              __import__('builtins').globals().__setitem__(
+                'p',
+                __import__(
+                  'os.path',
+                  __import__('builtins').globals(),
+                  fromlist=':')))(),
+            self.assertIs(
+              __import__('os').path,
+              p),
+            __import__('sys').modules.pop(
+              ('xml.dom.minicompat'),
+              None),
+            # hebi.basic.._macro_.import_
+            (lambda :
+              __import__('builtins').globals().__setitem__(
+                'xml',
+                __import__('hebi.runtime',fromlist='?')._lazy_import(
+                  'xml.dom.minicompat')))(),
+            self.assertIs(
+              xml,
+              __import__('sys').modules.get(
+                ('xml.dom.minicompat'))))[-1]),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_lazy_import',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_lazy_import'),
+          (lambda self:(
+            __import__('sys').modules.pop(
+              ('colorsys'),
+              None),
+            # hebi.basic.._macro_.import_
+            (lambda :
+              __import__('builtins').globals().__setitem__(
+                'colorsys',
+                __import__('hebi.runtime',fromlist='?')._lazy_import(
+                  'colorsys')))(),
+            self.assertIs(
+              __import__('importlib.util',fromlist='?')._LazyModule,
+              type(
+                colorsys)),
+            self.assertEqual(
+              ((0.0, 0.0, 1.0)),
+              colorsys.rgb_to_hsv(
+                (1),
+                (1),
+                (1))),
+            self.assertIs(
+              __import__('types').ModuleType,
+              type(
+                colorsys)))[-1]),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_lazy_from',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_lazy_from'),
+          (lambda self:(
+            __import__('sys').modules.pop(
+              ('json.tool'),
+              None),
+            # hebi.basic.._macro_.from_
+            __import__('builtins').globals().update(
+              dict(
+                json_tool=__import__('hebi.runtime',fromlist='?')._lazy_from(
+                  'json',
+                  'tool',
+                  __import__('builtins').globals()),
+                JSONDecoder=__import__('hebi.runtime',fromlist='?')._lazy_from(
+                  'json',
+                  'JSONDecoder',
+                  __import__('builtins').globals()))),
+            self.assertIs(
+              __import__('importlib.util',fromlist='?')._LazyModule,
+              type(
+                json_tool)),
+            self.assertIs(
+              __import__('json').JSONDecoder,
+              JSONDecoder),
+            self.assertTrue(
+              callable(
+                json_tool.main)))[-1]),
+          None)))[-1])))
+
+# hebi.basic.._macro_.class_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'TestDel',
+  __import__('hebi.runtime',fromlist='?')._class_(
+    'TestDel',
+    __import__('hebi.runtime',fromlist='?').akword(
+      TestCase),
+    None,
+    globals(),
+    (lambda _ns_:(
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'setUp',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.setUp'),
+          (lambda self:(
+            # hebi.basic.._macro_.let
+            (lambda _ns_:
+              __import__('builtins').setattr(
+                _ns_,
+                'delete_me',
+                ('foo delete')))(
+              self),
+            # hebi.basic.._macro_.def_
+            __import__('builtins').globals().__setitem__(
+              'DELETE_ME',
+              ('bar delete')),
+            # hebi.basic.._macro_.def_
+            __import__('builtins').setattr(
+              self,
+              'o',
+              __import__('types').SimpleNamespace()),
+            # hebi.basic.._macro_.def_
+            __import__('builtins').setattr(
+              self.o,
+              'foo',
+              (2)))[-1]),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_del_ns',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_del_ns'),
+          (lambda self:(
+            self.assertIn(
+              ('delete_me'),
+              vars(
+                self)),
+            # hebi.basic.._macro_.let
+            (lambda _ns_:
+              __import__('hebi.runtime',fromlist='?')._begin(
+                __import__('builtins').delattr(
+                  _ns_,
+                  'delete_me'),
+                ()))(
+              self),
+            self.assertNotIn(
+              ('delete_me'),
+              vars(
+                self)))[-1]),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_del_global',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_del_global'),
+          (lambda self:(
+            self.assertIn(
+              ('DELETE_ME'),
+              globals()),
+            # hebi.basic.._macro_.del_
+            __import__('hebi.runtime',fromlist='?')._begin(
+              __import__('operator').delitem(
+                globals(),
+                'DELETE_ME'),
+              ()),
+            self.assertNotIn(
+              ('DELETE_ME'),
+              globals()))[-1]),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_del_attr',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_del_attr'),
+          (lambda self:
+            # hebi.basic.._macro_.let
+            (lambda o:(
+              self.assertIn(
+                ('a'),
+                vars(
+                  o)),
+              __import__('hebi.runtime',fromlist='?')._begin(
+                __import__('builtins').delattr(
+                  o,
+                  'a'),
+                ()),
+              self.assertNotIn(
+                ('a'),
+                vars(
+                  o)))[-1])(
+              __import__('types').SimpleNamespace(
+                a=(1)))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_del_empty',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_del_empty'),
+          (lambda self:
+            # hebi.basic.._macro_.del_
+            __import__('hebi.runtime',fromlist='?')._begin(
+              ())),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_del_multiple',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_del_multiple'),
+          (lambda self:(
+            # hebi.basic.._macro_.let
+            (lambda _ns_,o:(
+              __import__('hebi.runtime',fromlist='?')._begin(
+                __import__('operator').delitem(
+                  globals(),
+                  'DELETE_ME'),
+                __import__('builtins').delattr(
+                  _ns_,
+                  'delete_me'),
+                __import__('builtins').delattr(
+                  o,
+                  'a'),
+                ()),
+              self.assertNotIn(
+                ('a'),
+                vars(
+                  o)),
+              self.assertEqual(
+                __import__('types').SimpleNamespace(
+                  b=(2),
+                  c=(3)),
+                o))[-1])(
+              *__import__('hebi.runtime',fromlist='?')._unpack(
+                __import__('hebi.runtime',fromlist='?').entuple(
+                  ':,',
+                  '_ns_',
+                  'o'),
+                # hebi.basic.._macro_.mask
+                __import__('hebi.runtime',fromlist='?').entuple(
+                  self,
+                  __import__('types').SimpleNamespace(
+                    a=(1),
+                    b=(2),
+                    c=(3))))),
+            self.assertNotIn(
+              ('delete_me'),
+              vars(
+                self)),
+            self.assertNotIn(
+              ('DELETE_ME'),
+              globals()))[-1]),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_del_nested',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_del_nested'),
+          (lambda self:(
+            self.assertEqual(
+              __import__('types').SimpleNamespace(
+                foo=(2)),
+              self.o),
+            # hebi.basic.._macro_.del_
+            __import__('hebi.runtime',fromlist='?')._begin(
+              __import__('builtins').delattr(
+                self.o,
+                'foo'),
+              ()),
+            self.assertEqual(
+              __import__('types').SimpleNamespace(),
+              self.o))[-1]),
+          None)))[-1])))
+
+# hebi.basic.._macro_.class_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'TestNative',
+  __import__('hebi.runtime',fromlist='?')._class_(
+    'TestNative',
+    __import__('hebi.runtime',fromlist='?').akword(
+      TestCase),
+    None,
+    globals(),
+    (lambda _ns_:(
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_mask',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_mask'),
+          (lambda self:
+            self.assertEqual(
+              (('lambda', (':', 'foo', 'spam'), ('builtins..print', '("Hi!")'), ('tests.native_hebi_tests.test_native..greet', '("World!")'), ('frobnicate', 'foo', 7, 24), ('reticulate', 'foo', 'spline'), 'foo'),),
+              (lambda thing,thing_sym,*calls:
+                # hebi.basic.._macro_.mask
+                __import__('hebi.runtime',fromlist='?').entuple(
+                  __import__('hebi.runtime',fromlist='?').entuple(
+                    'lambda',
+                    __import__('hebi.runtime',fromlist='?').entuple(
+                      ':',
+                      thing_sym,
+                      thing),
+                    __import__('hebi.runtime',fromlist='?').entuple(
+                      'builtins..print',
+                      '("Hi!")'),
+                    __import__('hebi.runtime',fromlist='?').entuple(
+                      'tests.native_hebi_tests.test_native..greet',
+                      '("World!")'),
+                    *map(
+                      (lambda call:
+                        # hebi.basic.._macro_.mask
+                        __import__('hebi.runtime',fromlist='?').entuple(
+                          __import__('operator').getitem(
+                            call,
+                            (0)),
+                          thing_sym,
+                          *__import__('operator').getitem(
+                            call,
+                            slice(
+                              (1),
+                              None)))),
+                      calls),
+                    thing_sym)))(
+                *('spam', 'foo', ('frobnicate', 7, 24), ('reticulate', 'spline'))))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_simple_double_unquote',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_simple_double_unquote'),
+          (lambda self:
+            self.assertEqual(
+              (1),
+              # hebi.basic.._macro_.let
+              (lambda a:a)(
+                (1)))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_double_unquote',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_double_unquote'),
+          (lambda self:
+            self.assertEqual(
+              (('hebi.runtime..entuple', ':', ':?', 1, ':?', 2), 3),
+              # hebi.basic.._macro_.let
+              (lambda a:
+                __import__('hebi.runtime',fromlist='?').entuple(
+                  __import__('hebi.runtime',fromlist='?').entuple(
+                    'hebi.runtime..entuple',
+                    ':',
+                    ':?',
+                    a,
+                    ':?',
+                    (2)),
+                  (3)))(
+                (1)))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_simple_alternate_double_unquote',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_simple_alternate_double_unquote'),
+          (lambda self:
+            self.assertEqual(
+              (2),
+              # hebi.basic.._macro_.let
+              (lambda a:a)(
+                (2)))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_alternate_double_unquote',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_alternate_double_unquote'),
+          (lambda self:
+            self.assertEqual(
+              (0, (1, 2)),
+              # hebi.basic.._macro_.let
+              (lambda a:
+                __import__('hebi.runtime',fromlist='?').entuple(
+                  (0),
+                  __import__('hebi.runtime',fromlist='?').entuple(
+                    (1),
+                    a)))(
+                (2)))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_simple_double_mask_unquote',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_simple_double_mask_unquote'),
+          (lambda self:
+            self.assertEqual(
+              'builtins..print',
+              # hebi.basic.._macro_.let
+              (lambda print:'builtins..print')(
+                (3)))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_double_mask_unquote',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_double_mask_unquote'),
+          (lambda self:
+            self.assertEqual(
+              (0, ('hebi.runtime..entuple', ':', ':?', 1, ':?', 2, ':?', 'builtins..print')),
+              # hebi.basic.._macro_.let
+              (lambda print:
+                __import__('hebi.runtime',fromlist='?').entuple(
+                  (0),
+                  __import__('hebi.runtime',fromlist='?').entuple(
+                    'hebi.runtime..entuple',
+                    ':',
+                    ':?',
+                    (1),
+                    ':?',
+                    (2),
+                    ':?',
+                    'builtins..print')))(
+                (3)))),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_elif',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_elif'),
+          (lambda self:
+            self.assertEqual(
+              ('hebi.runtime.._if_', "(('a'<'b'))", ('lambda', (), ('print', '("less")')), ('lambda', (), "(('a'>'b'))"), ('lambda', (), ('print', '("more")')), ('lambda', (), "(('a'=='b'))"), ('lambda', (), ('print', '("equal")')), ':', 'else_', ('lambda', (), ('print', '("nan")'))),
+              __import__('hebi.bootstrap',fromlist='?').if_(
+                *("(('a'<'b'))", (':then', ('print', '("less")')), (':elif', "(('a'>'b'))", ('print', '("more")')), (':elif', "(('a'=='b'))", ('print', '("equal")')), (':else', ('print', '("nan")')))))),
+          None)))[-1])))
+
+# hebi.basic.._macro_.async_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'async_double',
+  __import__('hebi.runtime',fromlist='?').async_function(
+    'async_double',
+    (lambda x:(
+      (yield from ()),
+      # hebi.basic.._macro_.await_
+      (yield from __import__('hebi.runtime',fromlist='?')._await_(
+        __import__('asyncio').sleep(
+          (0)))),
+      ((x * 2)))[-1]),
+    None))
+
+# hebi.basic.._macro_.async_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'async_evens',
+  __import__('hebi.runtime',fromlist='?').async_function(
+    'async_evens',
+    (lambda xs:(
+      (yield from ()),
+      # hebi.basic.._macro_.let
+      (yield from (lambda acc:(
+        (yield from ()),
+        (yield from __import__('hebi.runtime',fromlist='?')._for_gen(
+          xs,
+          (lambda x:(
+            (yield from ()),
+            (yield from __import__('hebi.runtime',fromlist='?')._if_gen(
+              ((x % 2)),
+              (lambda :(
+                (yield from ()),
+                acc.append(
+                  (yield from __import__('hebi.runtime',fromlist='?')._await_(
+                    async_double(
+                      x)))))[-1]),
+              else_=(lambda :(
+                (yield from ()),
+                acc.append(
+                  x))[-1]))))[-1]),
+          label=None)),
+        acc)[-1])(
+        ([]))))[-1]),
+    None))
+
+# hebi.basic.._macro_.class_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'Countdown',
+  __import__('hebi.runtime',fromlist='?')._class_(
+    'Countdown',
+    __import__('hebi.runtime',fromlist='?').akword(),
+    ("Async iterable and async context manager."),
+    globals(),
+    (lambda _ns_:(
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        '__init__',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.__init__'),
+          (lambda self,n:(
+            # hebi.basic.._macro_.def_
+            __import__('builtins').setattr(
+              self,
+              'n',
+              n),
+            # hebi.basic.._macro_.def_
+            __import__('builtins').setattr(
+              self,
+              'log',
+              ([])))[-1]),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        '__aiter__',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.__aiter__'),
+          (lambda self:self),
+          None)),
+      # hebi.basic.._macro_.async_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        '__anext__',
+        __import__('hebi.runtime',fromlist='?').async_function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.__anext__'),
+          (lambda self:(
+            (yield from ()),
+            # hebi.basic.._macro_.await_
+            (yield from __import__('hebi.runtime',fromlist='?')._await_(
+              __import__('asyncio').sleep(
+                (0)))),
+            # hebi.basic.._macro_.if_
+            __import__('hebi.runtime',fromlist='?')._if_(
+              self.n,
+              (lambda :(
+                __import__('builtins').setattr(
+                  self,
+                  'n',
+                  ((self.n - 1))),
+                ((self.n + 1)))[-1]),
+              else_=(lambda :
+                __import__('hebi.runtime',fromlist='?')._raise_ex(
+                  StopAsyncIteration()))))[-1]),
+          None)),
+      # hebi.basic.._macro_.async_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        '__aenter__',
+        __import__('hebi.runtime',fromlist='?').async_function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.__aenter__'),
+          (lambda self:(
+            (yield from ()),
+            self.log.append(
+              ('enter')),
+            self)[-1]),
+          None)),
+      # hebi.basic.._macro_.async_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        '__aexit__',
+        __import__('hebi.runtime',fromlist='?').async_function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.__aexit__'),
+          (lambda self,exc_type,exc,tb:(
+            (yield from ()),
+            self.log.append(
+              exc_type),
+            # hebi.basic.._macro_.await_
+            (yield from __import__('hebi.runtime',fromlist='?')._await_(
+              __import__('asyncio').sleep(
+                (0),
+                ((exc_type is KeyError))))))[-1]),
+          None)))[-1])))
+
+# hebi.basic.._macro_.def_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'evens',
+  __import__('hebi.runtime',fromlist='?').function(
+    'evens',
+    (lambda xs:
+      # hebi.basic.._macro_.for_
+      (yield from __import__('hebi.runtime',fromlist='?')._for_gen(
+        xs,
+        (lambda x:(
+          (yield from ()),
+          (yield from __import__('hebi.runtime',fromlist='?')._if_gen(
+            ((x % 2 == 0)),
+            (lambda :(
+              (yield from ()),
+              (yield x))[-1]))))[-1]),
+        label=None))),
+    None))
+
+# hebi.basic.._macro_.def_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'parse_ints',
+  __import__('hebi.runtime',fromlist='?').function(
+    'parse_ints',
+    (lambda lines:
+      # hebi.basic.._macro_.for_
+      (yield from __import__('hebi.runtime',fromlist='?')._for_gen(
+        lines,
+        (lambda line:(
+          (yield from ()),
+          (yield from __import__('hebi.runtime',fromlist='?')._try_gen(
+            (lambda :(
+              (yield from ()),
+              (yield int(
+                line)))[-1]),
+            ValueError,
+            (lambda xAUTO0_:(
+              (yield from ()),
+              (yield None))[-1]),
+            finally_=(lambda :(
+              (yield from ()),
+              (yield ('-')))[-1]))))[-1]),
+        label=None))),
+    None))
+
+# hebi.basic.._macro_.class_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'TestYield',
+  __import__('hebi.runtime',fromlist='?')._class_(
+    'TestYield',
+    __import__('hebi.runtime',fromlist='?').akword(
+      TestCase),
+    None,
+    globals(),
+    (lambda __class__:
+      (lambda _ns_:(
+        (None and __class__),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_yield_through_bodies',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_yield_through_bodies'),
+            (lambda self:(
+              self.assertTrue(
+                __import__('inspect').isgeneratorfunction(
+                  evens)),
+              self.assertEqual(
+                ([0, 2, 4]),
+                list(
+                  evens(
+                    range(
+                      (6))))))[-1]),
+            None)),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_yield_in_string',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_yield_in_string'),
+            (lambda self:
+              # hebi.basic.._macro_.let
+              (lambda o:(
+                __import__('builtins').setattr(
+                  o,
+                  'f',
+                  __import__('hebi.runtime',fromlist='?').function(
+                    'o.f',
+                    (lambda :
+                      __import__('hebi.runtime',fromlist='?')._if_(
+                        True,
+                        (lambda :("yield")))),
+                    None)),
+                self.assertEqual(
+                  ('yield'),
+                  o.f()))[-1])(
+                __import__('types').SimpleNamespace())),
+            None)),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_yield_in_injections',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_yield_in_injections'),
+            (lambda self:
+              # hebi.basic.._macro_.let
+              (lambda o:(
+                __import__('builtins').setattr(
+                  o,
+                  'concat',
+                  __import__('hebi.runtime',fromlist='?').function(
+                    'o.concat',
+                    (lambda x:
+                      __import__('hebi.runtime',fromlist='?')._if_(
+                        x,
+                        (lambda :(("we yield " + x))))),
+                    None)),
+                __import__('builtins').setattr(
+                  o,
+                  'fstring',
+                  __import__('hebi.runtime',fromlist='?').function(
+                    'o.fstring',
+                    (lambda x:
+                      __import__('hebi.runtime',fromlist='?')._if_(
+                        x,
+                        (lambda :((f"yield {x}"))))),
+                    None)),
+                __import__('builtins').setattr(
+                  o,
+                  'nested',
+                  __import__('hebi.runtime',fromlist='?').function(
+                    'o.nested',
+                    (lambda x:
+                      __import__('hebi.runtime',fromlist='?')._if_(
+                        x,
+                        (lambda :((lambda: (yield x)))))),
+                    None)),
+                self.assertEqual(
+                  ('we yield a'),
+                  o.concat(
+                    ('a'))),
+                self.assertEqual(
+                  ('yield a'),
+                  o.fstring(
+                    ('a'))),
+                self.assertTrue(
+                  __import__('inspect').isgeneratorfunction(
+                    o.nested(
+                      ('a')))),
+                self.assertFalse(
+                  __import__('inspect').isgeneratorfunction(
+                    o.nested)))[-1])(
+                __import__('types').SimpleNamespace())),
+            None)),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_yield_lazily',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_yield_lazily'),
+            (lambda self:
+              # hebi.basic.._macro_.let
+              (lambda gen:
+                self.assertEqual(
+                  ([0, 2, 4]),
+                  list(
+                    __import__('itertools').islice(
+                      gen,
+                      (3)))))(
+                evens(
+                  __import__('itertools').count()))),
+            None)),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_yield_try',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_yield_try'),
+            (lambda self:
+              self.assertEqual(
+                ([1, '-', None, '-', 3, '-']),
+                list(
+                  parse_ints(
+                    (['1', 'x', '3']))))),
+            None)),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_yield_from_let',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_yield_from_let'),
+            (lambda self:
+              # hebi.basic.._macro_.let
+              (lambda o:(
+                __import__('builtins').setattr(
+                  o,
+                  'chain',
+                  __import__('hebi.runtime',fromlist='?').function(
+                    'o.chain',
+                    (lambda xss:(
+                      (yield from __import__('hebi.runtime',fromlist='?')._for_gen(
+                        xss,
+                        (lambda xs:(
+                          (yield from ()),
+                          (lambda n:n)(
+                            (yield from xs)))[-1]),
+                        label=None)),
+                      ('done'))[-1]),
+                    None)),
+                self.assertEqual(
+                  ([1, 2, 3]),
+                  list(
+                    o.chain(
+                      ([[1], [2, 3]])))))[-1])(
+                __import__('types').SimpleNamespace())),
+            None)),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_send',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_send'),
+            (lambda self:
+              # hebi.basic.._macro_.let
+              (lambda o:(
+                __import__('builtins').setattr(
+                  o,
+                  'echo',
+                  __import__('hebi.runtime',fromlist='?').function(
+                    'o.echo',
+                    (lambda :
+                      (yield from __import__('hebi.runtime',fromlist='?')._loop_gen(
+                        (lambda recur,x=None:(
+                          (yield from ()),
+                          recur(
+                            (yield x)))[-1]))())),
+                    None)),
+                (lambda gen:(
+                  next(
+                    gen),
+                  self.assertEqual(
+                    ('a'),
+                    gen.send(
+                      ('a'))),
+                  self.assertEqual(
+                    ('b'),
+                    gen.send(
+                      ('b'))))[-1])(
+                  o.echo()))[-1])(
+                __import__('types').SimpleNamespace())),
+            None)),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_yield_from_macro',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_yield_from_macro'),
+            (lambda self:
+              # hebi.basic.._macro_.let
+              (lambda o:(
+                __import__('builtins').setattr(
+                  o,
+                  'f',
+                  __import__('hebi.runtime',fromlist='?').function(
+                    'o.f',
+                    (lambda xs:
+                      (yield from __import__('hebi.runtime',fromlist='?')._for_gen(
+                        xs,
+                        (lambda x:(
+                          (yield from ()),
+                          (yield from __import__('hebi.runtime',fromlist='?')._if_gen(
+                            x,
+                            (lambda :(
+                              (yield from ()),
+                              (yield x))[-1]))))[-1]),
+                        label=None))),
+                    None)),
+                self.assertEqual(
+                  ([1, 2]),
+                  list(
+                    o.f(
+                      ([0, 1, 2])))))[-1])(
+                __import__('types').SimpleNamespace())),
+            None)))[-1])),
+    cell=True))
+
+# hebi.basic.._macro_.class_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'TestComprehension',
+  __import__('hebi.runtime',fromlist='?')._class_(
+    'TestComprehension',
+    __import__('hebi.runtime',fromlist='?').akword(
+      TestCase),
+    None,
+    globals(),
+    (lambda _ns_:(
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_listcomp',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_listcomp'),
+          (lambda self:
+            self.assertEqual(
+              ([1, 9, 25]),
+              # hebi.basic.._macro_.listcomp
+              [((x * x))
+              for x in range(
+                (6))
+              if ((x % 2))])),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_setcomp_nested',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_setcomp_nested'),
+          (lambda self:
+            self.assertEqual(
+              ({0, 1, 2, 4}),
+              # hebi.basic.._macro_.setcomp
+              {((x * y))
+              for x in range(
+                (3))
+              for y in range(
+                (3))
+              if ((x <= y))})),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_dictcomp',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_dictcomp'),
+          (lambda self:
+            self.assertEqual(
+              ({'a': 2, 'b': 4}),
+              # hebi.basic.._macro_.dictcomp
+              {k:((v * 2))
+              for (k,v,) in ({'a': 1, 'b': 2}).items()})),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_genexpr',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_genexpr'),
+          (lambda self:(
+            self.assertIs(
+              __import__('types').GeneratorType,
+              type(
+                # hebi.basic.._macro_.genexpr
+                (c
+                for c in ('abc')))),
+            self.assertEqual(
+              (['A', 'B', 'C']),
+              list(
+                # hebi.basic.._macro_.genexpr
+                (((c.upper()))
+                for c in ('abc')))))[-1]),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_destructure',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_destructure'),
+          (lambda self:(
+            self.assertEqual(
+              ([(1, [2, 3]), (4, [])]),
+              # hebi.basic.._macro_.listcomp
+              [((a, rest))
+              for (a,*rest,) in ([(1, 2, 3), (4,)])]),
+            self.assertEqual(
+              ([(1, 2), (3, 4)]),
+              # hebi.basic.._macro_.listcomp
+              [((a, b))
+              for xAUTO0_ in ([{'a': 1, 'b': 2}, {'a': 3, 'b': 4}])
+              for (a,b,) in [__import__('hebi.runtime',fromlist='?')._unpack(
+                __import__('hebi.runtime',fromlist='?').entuple(
+                  ':=',
+                  'a',
+                  ('a'),
+                  'b',
+                  ('b')),
+                xAUTO0_)]]))[-1]),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_destructure_like_let',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_destructure_like_let'),
+          (lambda self:(
+            self.assertEqual(
+              ([1, 1]),
+              # hebi.basic.._macro_.listcomp
+              [(1)
+              for xAUTO0_ in ([(), 'ab'])
+              for () in [__import__('hebi.runtime',fromlist='?')._unpack(
+                __import__('hebi.runtime',fromlist='?').entuple(
+                  ':,'),
+                xAUTO0_)]]),
+            # hebi.basic.._macro_.with_
+            __import__('hebi.runtime',fromlist='?')._with_(
+              (lambda :
+                self.assertRaises(
+                  RuntimeError)),
+              (lambda xAUTO0_:
+                (lambda a,rest,b:((a, rest, b)))(
+                  *__import__('hebi.runtime',fromlist='?')._unpack(
+                    __import__('hebi.runtime',fromlist='?').entuple(
+                      ':,',
+                      'a',
+                      ':list',
+                      'rest',
+                      'b'),
+                    ([1, 2, 3]))))),
+            # hebi.basic.._macro_.with_
+            __import__('hebi.runtime',fromlist='?')._with_(
+              (lambda :
+                self.assertRaises(
+                  RuntimeError)),
+              (lambda xAUTO0_:
+                [((a, rest, b))
+                for xAUTO0_ in ([[1, 2, 3]])
+                for (a,rest,b,) in [__import__('hebi.runtime',fromlist='?')._unpack(
+                  __import__('hebi.runtime',fromlist='?').entuple(
+                    ':,',
+                    'a',
+                    ':list',
+                    'rest',
+                    'b'),
+                  xAUTO0_)]])))[-1]),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_scope',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_scope'),
+          (lambda self:(
+            # hebi.basic.._macro_.listcomp
+            [leaked
+            for leaked in ('ab')],
+            self.assertNotIn(
+              ('leaked'),
+              globals()))[-1]),
+          None)))[-1])))
+
+# hebi.basic.._macro_.record
+# hebi.basic.._macro_.class_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'Point',
+  __import__('hebi.runtime',fromlist='?')._slots_init(
+    (lambda xAUTO0_,xAUTO1_,xAUTO2_:lambda self,x,y,z=(0):(xAUTO0_(self,x),xAUTO1_(self,y),xAUTO2_(self,z),None,)[-1]))(
+    __import__('hebi.runtime',fromlist='?')._class_(
+      'Point',
+      __import__('hebi.runtime',fromlist='?').akword(),
+      ("A point in space."),
+      globals(),
+      (lambda _ns_:(
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          '__slots__',
+          ('x', 'y', 'z')),
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          '__match_args__',
+          ('x', 'y', 'z')),
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          '__repr__',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.__repr__'),
+            (lambda self:f"{type(self).__qualname__}(x={self.x!r}, y={self.y!r}, z={self.z!r})"))),
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          '__eq__',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.__eq__'),
+            (lambda self,other:(self.x,self.y,self.z,)==(other.x,other.y,other.z,) if type(other) is type(self) else NotImplemented))),
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          '__hash__',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.__hash__'),
+            (lambda self:hash((self.x,self.y,self.z,))))),
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          '__lt__',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.__lt__'),
+            (lambda self,other:(self.x,self.y,self.z,)<(other.x,other.y,other.z,) if type(other) is type(self) else NotImplemented))),
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          '__le__',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.__le__'),
+            (lambda self,other:(self.x,self.y,self.z,)<=(other.x,other.y,other.z,) if type(other) is type(self) else NotImplemented))),
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          '__gt__',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.__gt__'),
+            (lambda self,other:(self.x,self.y,self.z,)>(other.x,other.y,other.z,) if type(other) is type(self) else NotImplemented))),
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          '__ge__',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.__ge__'),
+            (lambda self,other:(self.x,self.y,self.z,)>=(other.x,other.y,other.z,) if type(other) is type(self) else NotImplemented))),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'norm',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.norm'),
+            (lambda self:
+              __import__('math').hypot(
+                self.x,
+                self.y,
+                self.z)),
+            None)))[-1]))))
+
+# hebi.basic.._macro_.record
+# hebi.basic.._macro_.class_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'Empty',
+  __import__('hebi.runtime',fromlist='?')._slots_init(
+    (lambda :lambda self:(None,)[-1]))(
+    __import__('hebi.runtime',fromlist='?')._class_(
+      'Empty',
+      __import__('hebi.runtime',fromlist='?').akword(),
+      None,
+      globals(),
+      (lambda _ns_:(
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          '__slots__',
+          ()),
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          '__match_args__',
+          ()),
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          '__repr__',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.__repr__'),
+            (lambda self:f"{type(self).__qualname__}()"))),
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          '__eq__',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.__eq__'),
+            (lambda self,other:()==() if type(other) is type(self) else NotImplemented))))[-1]))))
+
+# hebi.basic.._macro_.record
+# hebi.basic.._macro_.class_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'Clash',
+  __import__('hebi.runtime',fromlist='?')._slots_init(
+    (lambda xAUTO0__,xAUTO1__,xAUTO2_,xAUTO3_:lambda self_,self,other,xAUTO0_,xAUTO1_=(1):(xAUTO0__(self_,self),xAUTO1__(self_,other),xAUTO2_(self_,xAUTO0_),xAUTO3_(self_,xAUTO1_),None,)[-1]))(
+    __import__('hebi.runtime',fromlist='?')._class_(
+      'Clash',
+      __import__('hebi.runtime',fromlist='?').akword(),
+      None,
+      globals(),
+      (lambda _ns_:(
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          '__slots__',
+          ('self', 'other', 'xAUTO0_', 'xAUTO1_')),
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          '__match_args__',
+          ('self', 'other', 'xAUTO0_', 'xAUTO1_')),
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          '__repr__',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.__repr__'),
+            (lambda self:f"{type(self).__qualname__}(self={self.self!r}, other={self.other!r}, xAUTO0_={self.xAUTO0_!r}, xAUTO1_={self.xAUTO1_!r})"))),
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          '__eq__',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.__eq__'),
+            (lambda self,other:(self.self,self.other,self.xAUTO0_,self.xAUTO1_,)==(other.self,other.other,other.xAUTO0_,other.xAUTO1_,) if type(other) is type(self) else NotImplemented))),
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          '__hash__',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.__hash__'),
+            (lambda self:hash((self.self,self.other,self.xAUTO0_,self.xAUTO1_,))))),
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          '__lt__',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.__lt__'),
+            (lambda self,other:(self.self,self.other,self.xAUTO0_,self.xAUTO1_,)<(other.self,other.other,other.xAUTO0_,other.xAUTO1_,) if type(other) is type(self) else NotImplemented))),
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          '__le__',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.__le__'),
+            (lambda self,other:(self.self,self.other,self.xAUTO0_,self.xAUTO1_,)<=(other.self,other.other,other.xAUTO0_,other.xAUTO1_,) if type(other) is type(self) else NotImplemented))),
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          '__gt__',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.__gt__'),
+            (lambda self,other:(self.self,self.other,self.xAUTO0_,self.xAUTO1_,)>(other.self,other.other,other.xAUTO0_,other.xAUTO1_,) if type(other) is type(self) else NotImplemented))),
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          '__ge__',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.__ge__'),
+            (lambda self,other:(self.self,self.other,self.xAUTO0_,self.xAUTO1_,)>=(other.self,other.other,other.xAUTO0_,other.xAUTO1_,) if type(other) is type(self) else NotImplemented))))[-1]))))
+
+# hebi.basic.._macro_.class_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'TestRecord',
+  __import__('hebi.runtime',fromlist='?')._class_(
+    'TestRecord',
+    __import__('hebi.runtime',fromlist='?').akword(
+      TestCase),
+    None,
+    globals(),
+    (lambda _ns_:(
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_init',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_init'),
+          (lambda self:(
+            # hebi.basic.._macro_.let
+            (lambda p:
+              self.assertEqual(
+                ((1, 2, 0)),
+                ((p.x, p.y, p.z))))(
+              Point(
+                (1),
+                (2))),
+            self.assertEqual(
+              (3),
+              ((Point(1, 2, z=3).z))),
+            self.assertEqual(
+              (5.0),
+              Point(
+                (3),
+                (4)).norm()),
+            self.assertEqual(
+              ('A point in space.'),
+              Point.__doc__),
+            self.assertEqual(
+              ('Point.__init__'),
+              Point.__init__.__qualname__))[-1]),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_slots',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_slots'),
+          (lambda self:(
+            self.assertEqual(
+              (('x', 'y', 'z')),
+              Point.__slots__),
+            self.assertFalse(
+              hasattr(
+                ((Point(1, 2))),
+                ('__dict__'))))[-1]),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_repr',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_repr'),
+          (lambda self:(
+            self.assertEqual(
+              ("Point(x=1, y='a', z=0)"),
+              ((repr(Point(1, 'a'))))),
+            self.assertEqual(
+              ("Empty()"),
+              ((repr(Empty())))))[-1]),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_eq_hash',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_eq_hash'),
+          (lambda self:(
+            self.assertEqual(
+              ((Point(1, 2))),
+              ((Point(1, 2, 0)))),
+            self.assertNotEqual(
+              ((Point(1, 2))),
+              ((Point(1, 2, 3)))),
+            self.assertNotEqual(
+              ((Point(1, 2))),
+              ((1, 2, 0))),
+            self.assertEqual(
+              (1),
+              len(
+                ({Point(1, 2), Point(1, 2)}))),
+            self.assertEqual(
+              ((Empty())),
+              ((Empty()))),
+            self.assertIsNone(
+              Empty.__hash__))[-1]),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_order',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_order'),
+          (lambda self:(
+            self.assertLess(
+              ((Point(1, 2))),
+              ((Point(1, 3)))),
+            self.assertGreaterEqual(
+              ((Point(2, 0))),
+              ((Point(1, 9)))),
+            self.assertRaises(
+              TypeError,
+              __import__('operator').lt,
+              ((Point(1, 2))),
+              ((1, 2))))[-1]),
+          None)),
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_field_names',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_field_names'),
+          (lambda self:
+            # hebi.basic.._macro_.let
+            (lambda c:(
+              self.assertEqual(
+                (('s', 'o', 0, 1)),
+                ((c.self, c.other, c.xAUTO0_, c.xAUTO1_))),
+              self.assertEqual(
+                ("Clash(self='s', other='o', xAUTO0_=0, xAUTO1_=1)"),
+                repr(
+                  c)),
+              self.assertEqual(
+                c,
+                ((Clash(other='o', self='s', xAUTO0_=0)))),
+              self.assertLess(
+                c,
+                ((Clash('s', 'o', 0, 2)))))[-1])(
+              Clash(
+                ('s'),
+                ('o'),
+                (0)))),
+          None)))[-1])))
+
+# hebi.basic.._macro_.class_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'TestWith',
+  __import__('hebi.runtime',fromlist='?')._class_(
+    'TestWith',
+    __import__('hebi.runtime',fromlist='?').akword(
+      TestCase),
+    None,
+    globals(),
+    (lambda _ns_:
+      # hebi.basic.._macro_.def_
+      # hebi.basic.._macro_.def_
+      __import__('builtins').setattr(
+        _ns_,
+        'test_with_as',
+        __import__('hebi.runtime',fromlist='?').function(
+          __import__('hebi.runtime',fromlist='?')._qualname(
+            _ns_,
+            '_ns_.test_with_as'),
+          (lambda self:
+            # hebi.basic.._macro_.let
+            (lambda f:(
+              self.assertEqual(
+                ('abc'),
+                __import__('hebi.runtime',fromlist='?')._with_(
+                  (lambda :f),
+                  (lambda g:g.read()))),
+              self.assertTrue(
+                f.closed))[-1])(
+              __import__('io').StringIO(
+                ('abc')))),
+          None)))))
+
+# hebi.basic.._macro_.class_
+# hebi.basic.._macro_.def_
+__import__('builtins').globals().__setitem__(
+  'TestAsync',
+  __import__('hebi.runtime',fromlist='?')._class_(
+    'TestAsync',
+    __import__('hebi.runtime',fromlist='?').akword(
+      TestCase),
+    None,
+    globals(),
+    (lambda __class__:
+      (lambda _ns_:(
+        (None and __class__),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_async_def',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_async_def'),
+            (lambda self:(
+              self.assertTrue(
+                __import__('inspect').iscoroutinefunction(
+                  async_double)),
+              self.assertEqual(
+                ('async_double'),
+                async_double.__name__),
+              self.assertEqual(
+                (42),
+                __import__('asyncio').run(
+                  async_double(
+                    (21)))))[-1]),
+            None)),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_await_in_bodies',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_await_in_bodies'),
+            (lambda self:
+              self.assertEqual(
+                ([0, 2, 2, 6]),
+                __import__('asyncio').run(
+                  async_evens(
+                    range(
+                      (4)))))),
+            None)),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_await_from_macro',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_await_from_macro'),
+            (lambda self:
+              # hebi.basic.._macro_.let
+              (lambda o:(
+                __import__('builtins').setattr(
+                  o,
+                  'f',
+                  __import__('hebi.runtime',fromlist='?').async_function(
+                    'o.f',
+                    (lambda x:(
+                      (yield from ()),
+                      (yield from __import__('hebi.runtime',fromlist='?')._if_gen(
+                        x,
+                        (lambda :(
+                          (yield from ()),
+                          (yield from __import__('hebi.runtime',fromlist='?')._await_(
+                            __import__('asyncio').sleep(
+                              (0),
+                              x))))[-1]),
+                        else_=(lambda :(
+                          (yield from ()),
+                          ('no'))[-1]))))[-1]),
+                    None)),
+                self.assertEqual(
+                  ('yes'),
+                  __import__('asyncio').run(
+                    o.f(
+                      ('yes')))))[-1])(
+                __import__('types').SimpleNamespace())),
+            None)),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_async_for',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_async_for'),
+            (lambda self:
+              # hebi.basic.._macro_.let
+              (lambda o:(
+                __import__('builtins').setattr(
+                  o,
+                  'count',
+                  __import__('hebi.runtime',fromlist='?').async_function(
+                    'o.count',
+                    (lambda countdown:(
+                      (yield from ()),
+                      (yield from (lambda acc:(
+                        (yield from ()),
+                        (yield from __import__('hebi.runtime',fromlist='?')._async_for_(
+                          countdown,
+                          (lambda n:(
+                            (yield from ()),
+                            # hebi.basic.._macro_.if_
+                            __import__('hebi.runtime',fromlist='?')._if_(
+                              ((n == 1)),
+                              (lambda :
+                                __import__('hebi.runtime',fromlist='?').Continue(
+                                  None))),
+                            acc.append(
+                              n))[-1]),
+                          else_=(lambda :(
+                            (yield from ()),
+                            acc.append(
+                              ('liftoff')))[-1]),
+                          label=None)),
+                        acc)[-1])(
+                        ([]))))[-1]),
+                    None)),
+                self.assertEqual(
+                  ([3, 2, 'liftoff']),
+                  __import__('asyncio').run(
+                    o.count(
+                      Countdown(
+                        (3))))))[-1])(
+                __import__('types').SimpleNamespace())),
+            None)),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_async_with',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_async_with'),
+            (lambda self:
+              # hebi.basic.._macro_.let
+              (lambda o:(
+                __import__('builtins').setattr(
+                  o,
+                  'enter',
+                  __import__('hebi.runtime',fromlist='?').async_function(
+                    'o.enter',
+                    (lambda countdown:(
+                      (yield from ()),
+                      (yield from __import__('hebi.runtime',fromlist='?')._async_with_(
+                        (lambda :(
+                          (yield from ()),
+                          countdown)[-1]),
+                        (lambda c:(
+                          (yield from ()),
+                          # hebi.basic.._macro_.await_
+                          (yield from __import__('hebi.runtime',fromlist='?')._await_(
+                            c.__anext__())))[-1]))))[-1]),
+                    None)),
+                (lambda countdown:(
+                  self.assertEqual(
+                    (1),
+                    __import__('asyncio').run(
+                      o.enter(
+                        countdown))),
+                  self.assertEqual(
+                    (['enter', None]),
+                    countdown.log))[-1])(
+                  Countdown(
+                    (1))))[-1])(
+                __import__('types').SimpleNamespace())),
+            None)),
+        # hebi.basic.._macro_.def_
+        # hebi.basic.._macro_.def_
+        __import__('builtins').setattr(
+          _ns_,
+          'test_async_with_suppress',
+          __import__('hebi.runtime',fromlist='?').function(
+            __import__('hebi.runtime',fromlist='?')._qualname(
+              _ns_,
+              '_ns_.test_async_with_suppress'),
+            (lambda self:
+              # hebi.basic.._macro_.let
+              (lambda o:(
+                __import__('builtins').setattr(
+                  o,
+                  'fail',
+                  __import__('hebi.runtime',fromlist='?').async_function(
+                    'o.fail',
+                    (lambda countdown:(
+                      (yield from ()),
+                      (yield from __import__('hebi.runtime',fromlist='?')._async_with_(
+                        (lambda :(
+                          (yield from ()),
+                          countdown)[-1]),
+                        (lambda xAUTO0_:(
+                          (yield from ()),
+                          # hebi.basic.._macro_.raise_
+                          __import__('hebi.runtime',fromlist='?')._raise_ex(
+                            KeyError()))[-1]))),
+                      ('suppressed'))[-1]),
+                    None)),
+                (lambda countdown:(
+                  self.assertEqual(
+                    ('suppressed'),
+                    __import__('asyncio').run(
+                      o.fail(
+                        countdown))),
+                  self.assertEqual(
+                    (['enter', KeyError]),
+                    countdown.log))[-1])(
+                  Countdown(
+                    (1))))[-1])(
+                __import__('types').SimpleNamespace())),
+            None)))[-1])),
+    cell=True))
+
+# hebi.basic.._macro_.import_
+(lambda :
+  __import__('builtins').globals().__setitem__(
+    'unittest',
+    __import__(
+      'unittest',
+      __import__('builtins').globals(),
+      fromlist=':')))()
+
+# hebi.basic.._macro_.if_
+__import__('hebi.runtime',fromlist='?')._if_(
+  ((__name__ == "__main__")),
+  (lambda :unittest.main()))
\ No newline at end of file
@@ -0,0 +1,79 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import TestCase
+
+from hebi.build import imports, needed
+from hebi.codegen import AstCompiler, module_code
+from hebi.parser import Compiler, qualify_context, reads
+from hebi.peephole import Peephole
+from tests.test_levels import NATIVE, native_results
+
+CODE = """\
+import: types functools
+import: sqlite3 :as db
+from: operator :import add mul :as times
+def: _macro_ types..SimpleNamespace:
+def: _twice: x
+  add: x x
+def: _macro_.double: x
+  functools..reduce: add (x, x)
+def: _macro_.quad: x
+  (f"({_twice(x)} * 2)")
+print: "side effect"
+def: connection db.connect: ":memory:"
+def: result double: 21
+def: other quad: 3
+"""
+
+
+class TestBuild(TestCase):
+    def test_needed(self):
+        self.assertEqual({0, 2, 3, 4, 5, 6}, needed([*reads(CODE)]))
+
+    def test_needed_transitive(self):
+        code = "def: _b 1\ndef: _a (_b + 1)\ndef: _macro_.f: (_a)\nprint: _b"
+        self.assertEqual({0, 1, 2}, needed([*reads(code)]))
+
+    def test_imports(self):
+        code = (
+            "import: a.b c :as d :lazy\n"
+            "from: .m :import x :as y\n"
+            "foo: pkg.macros.._macro_.twice: builtins..print\n"
+        )
+        self.assertEqual(
+            {"a.b", "c", ".m", ".m.x", "pkg.macros", "builtins", "hebi.basic"},
+            imports([*reads(code)]),
+        )
+
+    def test_not_run(self):
+        for compiler in Compiler, AstCompiler:
+            with self.subTest(compiler=compiler.__name__), qualify_context("mod"):
+                printed = []
+                build = compiler("mod", {"print": printed.append}, build=True)
+                code = build.compile(reads(CODE))
+                self.assertEqual([], printed)
+                self.assertNotIn("db", build.ns)
+                self.assertNotIn("result", build.ns)
+                self.assertIn("_twice", build.ns)
+                ns = {"print": printed.append}
+                exec(compile(code, "mod", "exec"), ns)
+                self.assertEqual(["side effect"], printed)
+                self.assertEqual((42, 12), (ns["result"], ns["other"]))
+
+    def test_runtime_resolved(self):
+        compiler = Compiler("mod", build=True, peephole=Peephole())
+        python = compiler.compile(reads("!runtime: print: 1"))
+        self.assertNotIn("<compiler>", python)
+
+    def test_native_tests(self):
+        name = "tests.native_hebi_tests.test_native"
+        with redirect_stdout(StringIO()) as out:
+            code = module_code(NATIVE.read_text(), name, str(NATIVE), build=True)
+        self.assertEqual("", out.getvalue())
+        tests_run, failed = native_results(code)
+        self.assertGreater(tests_run, 90)
+        self.assertEqual(set(), failed)
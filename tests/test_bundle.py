@@ -0,0 +1,76 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import subprocess
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from unittest import TestCase
+
+from hebi.__main__ import main
+from hebi.bundle import bundle
+
+MACROS = """\
+import: types
+def: _macro_ types..SimpleNamespace:
+def: _macro_.twice: x
+  ("(%s) * 2" % x)
+"""
+
+MAIN = """\
+from: .util :import greet
+import: sys
+def: hello: name
+  greet: name
+print: hello: "bundle"
+print: macros.._macro_.twice: 21
+print: (__name__) (sys.argv[1:])
+"""
+
+
+class TestBundle(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name, "src")
+        for path, text in {
+            "app/__init__.py": "",
+            "app/util.py": "def greet(name):\n    return f'hello {name}'\n",
+            "app/main.hebi": MAIN,
+            "macros/__init__.hebi": MACROS,
+        }.items():
+            (self.root / path).parent.mkdir(parents=True, exist_ok=True)
+            (self.root / path).write_text(text)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_bundle(self, path):
+        return subprocess.run(
+            [sys.executable, "-I", str(path), "x"],
+            cwd=self.tmp.name,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+    def test_bundle(self):
+        out = Path(self.tmp.name, "app.pyz")
+        with redirect_stdout(StringIO()):
+            names = bundle("app.main", out, [self.root])
+        # The macros are only needed to compile.
+        self.assertEqual(["app", "app.main", "app.util", "hebi", "hebi.runtime"], names)
+        self.assertEqual("hello bundle\n42\n__main__ ['x']\n", self.run_bundle(out))
+
+    def test_main(self):
+        out = Path(self.tmp.name, "app.pyz")
+        with redirect_stdout(StringIO()) as printed:
+            main(["bundle", "app.main", "-o", str(out), "-p", str(self.root)])
+        self.assertIn("bundled app.util", printed.getvalue())
+        self.assertIn("42", self.run_bundle(out))
+
+    def test_missing(self):
+        with self.assertRaises(ModuleNotFoundError):
+            bundle("app.nope", Path(self.tmp.name, "app.pyz"), [self.root])
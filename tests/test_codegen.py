@@ -0,0 +1,121 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import ast
+import sys
+import traceback
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from types import ModuleType
+from unittest import TestCase, mock
+
+from hissp.compiler import CompileError
+
+from hebi import codegen
+from hebi.codegen import AstCompiler, module_code
+from hebi.parser import Compiler, lex, parse
+from hebi.sourcemap import SourceMap
+
+FORMS = [
+    ("print", 1, -2, 3.5, -0j, ":", "sep", ("quote", ":"),
+     ":*", [1], ":**", {"end": ""}),
+    (".upper", ("quote", "abc")),
+    (".real.conjugate", 1j),
+    (
+        (
+            "lambda",
+            ("a", "b", ":", "c", 1, ":*", "args", "d", ":?", "e", 2, ":**", "kw"),
+            ("quote", "ignored"),
+            ("builtins..sorted", ("builtins..locals",)),
+        ),
+        1, 2, ":", "d", 3, "f", 4,
+    ),
+    (("lambda", ("x", "/", "y"), "x", "y"), 1, 2),
+    (("lambda", (":", ":*", ":?", "k", ":?")), ":", "k", 1),
+    (("lambda", ()),),
+    ("quote", (1, ("a", [2, {3}], b"4"), float("inf"), ...)),
+    "collections.abc..Mapping",
+    "builtins..str.join",
+    "None",
+    "(1 + 2)",
+    ("print", ":", ":?", 1),  # Positional in the pairs.
+]
+
+
+def run(code):
+    out = StringIO()
+    with redirect_stdout(out):
+        namespace = {}
+        exec(code, namespace)
+    return out.getvalue(), namespace.get("result")
+
+
+class TestAstCompiler(TestCase):
+    def test_same_as_text(self):
+        for form in FORMS:
+            with self.subTest(form=form):
+                text = Compiler(evaluate=False).compile([("print", form)])
+                tree = AstCompiler(evaluate=False).code([("print", form)])
+                self.assertEqual(run(text)[0], run(tree)[0])
+
+    def test_failing_form(self):
+        form = ("operator..truediv", 1, 0)
+        for unparse, python in [(codegen._unparse, "truediv(1, 0)"), (ast.dump, "Call(")]:
+            with self.subTest(unparse=unparse.__name__):
+                with mock.patch.object(codegen, "_unparse", unparse):
+                    with redirect_stdout(StringIO()) as out:
+                        with self.assertRaises(CompileError) as caught:
+                            AstCompiler().compile([form])
+                self.assertIn(python, str(caught.exception))
+                self.assertIn(python, out.getvalue())
+                self.assertIsInstance(caught.exception.__cause__, ZeroDivisionError)
+
+    def test_subscripts(self):
+        forms = [
+            ("operator..setitem", ("builtins..globals",), ("quote", "answer"), 42),
+            ("print", (("lambda", (), 1, "_repl..answer"),)),
+        ]
+        self.assertEqual("42\n", run(AstCompiler(evaluate=False).code(forms))[0])
+        # Python 3.8 wants each index wrapped, or "expected some sort of slice".
+        wrapper = ast.Index if sys.version_info < (3, 9) else ast.Constant
+        for node in ast.walk(AstCompiler(evaluate=False).form(forms[1])):
+            if isinstance(node, ast.Subscript):
+                self.assertIsInstance(node.slice, wrapper)
+
+    def test_native_tests(self):
+        name = "tests.native_hebi_tests.test_native"
+        path = Path(__file__).parent / "native_hebi_tests/test_native.hebi"
+        with redirect_stdout(StringIO()):
+            code = module_code(path.read_text(), name, str(path))
+        module = ModuleType(name)
+        exec(code, vars(module))
+        tests = unittest.defaultTestLoader.loadTestsFromModule(module)
+        result = unittest.TestResult()
+        tests.run(result)
+        self.assertGreater(result.testsRun, 90)
+        self.assertEqual([], result.errors + result.failures)
+
+    def test_single(self):
+        shown = []
+        hook, sys.displayhook = sys.displayhook, shown.append
+        try:
+            with redirect_stdout(StringIO()):
+                forms = parse(lex("1\n'two'\nprint: 3"))
+                exec(AstCompiler(evaluate=False).code(forms, mode="single"))
+        finally:
+            sys.displayhook = hook
+        self.assertEqual([1, "two", None], shown)  # The real hook skips None.
+
+    def test_lines(self):
+        smap = SourceMap("example.hebi")
+        code = "def: f: x\n  print: x\n  (1 / x)\nf: 0\n"
+        hissp = parse(lex(code, smap.positions), source_map=smap)
+        code = AstCompiler(evaluate=False, source_map=smap).code(hissp, "example.hebi")
+        try:
+            exec(code, {"print": lambda x: x})
+        except ZeroDivisionError:
+            frames = traceback.extract_tb(sys.exc_info()[2])[1:]
+        self.assertEqual([4, 3], [frame.lineno for frame in frames])
@@ -0,0 +1,85 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import importlib
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from unittest import TestCase
+
+from hebi.__main__ import main
+from hebi.compileall import compile_dir
+
+MACROS = """\
+import: types
+def: _macro_ types..SimpleNamespace:
+def: _macro_.twice: x
+  ("(%s) * 2" % x)
+"""
+
+APP = """\
+import: os
+def: answer {package}.macros.._macro_.twice: 21
+def: home .get: os.environ "HOME"
+print: "imported"
+"""
+
+
+class TestCompileAll(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.package = f"aot_{id(self)}"
+        self.root = Path(self.tmp.name, self.package)
+        (self.root / "sub").mkdir(parents=True)
+        (self.root / "__init__.py").write_text("")
+        (self.root / "sub/__init__.hebi").write_text("def: x 1\n")
+        (self.root / "macros.hebi").write_text(MACROS)
+        (self.root / "app.hebi").write_text(APP.format(package=self.package))
+
+    def tearDown(self):
+        for name in [*sys.modules]:
+            if name.startswith(self.package):
+                del sys.modules[name]
+        self.tmp.cleanup()
+
+    def load(self, name):
+        sys.path.insert(0, self.tmp.name)
+        try:
+            with redirect_stdout(StringIO()) as out:
+                module = importlib.import_module(f"{self.package}.{name}")
+        finally:
+            sys.path.remove(self.tmp.name)
+        return module, out.getvalue()
+
+    def test_pycache(self):
+        with redirect_stdout(StringIO()) as out:
+            written = [*compile_dir(self.root, levels=(0, 2))]
+        self.assertNotIn("imported", out.getvalue())  # Build mode.
+        self.assertEqual(9, len(written))  # (.py + 2 .pyc) * 3
+        app, out = self.load("app")
+        self.assertEqual("imported\n", out)
+        self.assertEqual(42, app.answer)
+        self.assertIn(app.__cached__, map(str, written))
+        self.assertEqual(1, self.load("sub")[0].x)
+
+    def test_sourceless(self):
+        with redirect_stdout(StringIO()):
+            written = [*compile_dir(self.root, sourceless=True)]
+        self.assertEqual(
+            {"app.pyc", "macros.pyc", "__init__.pyc"}, {path.name for path in written}
+        )
+        self.assertFalse([*self.root.rglob("*.py")][1:])  # Just the __init__.py.
+        app, _ = self.load("app")
+        self.assertEqual(42, app.answer)
+        self.assertTrue(app.__file__.endswith(".pyc"))
+        code = app.__spec__.loader.get_code(app.__name__)
+        self.assertEqual(str(self.root / "app.hebi"), code.co_filename)
+
+    def test_main(self):
+        with redirect_stdout(StringIO()) as out:
+            main(["compileall", str(self.root), "-O", "2", "-o", "1", "--checked"])
+        self.assertIn("opt-1.pyc", out.getvalue())
+        self.assertEqual(42, self.load("app")[0].answer)
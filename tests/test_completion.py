@@ -0,0 +1,67 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import os
+from types import SimpleNamespace
+from unittest import TestCase
+
+from hebi.completion import Index, Names
+
+
+def _twice(x):
+    """Doubles x, at compile time."""
+    return f"({x}) * 2"
+
+
+class TestIndex(TestCase):
+    def setUp(self):
+        self.ns = {"os": os, "alpha": 1, "alphabet": 2, "_macro_": SimpleNamespace()}
+        self.index = Index(self.ns)
+
+    def complete(self, code):
+        matches, start = self.index.complete(code, len(code))
+        self.assertEqual(start, len(code) - len(code.split(" ")[-1]))
+        return matches
+
+    def test_names(self):
+        self.assertEqual(["all", "alpha", "alphabet"], self.complete("al"))
+        self.assertEqual(["def", "del", "delattr"], self.complete("print: de"))
+        self.assertEqual(["!let", "!listcomp", "!loop"], self.complete("!l"))
+        self.assertEqual([], self.complete("zz"))
+
+    def test_attributes(self):
+        self.assertEqual(["os.path.join"], self.complete("os.path.jo"))
+        self.assertEqual(["os.path..join"], self.complete("os.path..jo"))
+        self.assertEqual([], self.complete("not.imported..x"))
+        self.assertEqual([], self.complete("nope.x"))
+        self.assertIn("alpha.real", self.complete("alpha.re"))
+
+    def test_update(self):
+        del self.ns["alpha"]
+        self.ns["alpine"] = 3
+        self.ns["_macro_"].twice = _twice
+        self.assertEqual(["all", "alpha", "alphabet"], self.complete("al"))
+        self.index.update()
+        self.assertEqual(["all", "alphabet", "alpine"], self.complete("al"))
+        self.assertEqual(["twice"], self.complete("tw"))
+
+    def test_names_update(self):
+        names = Names(["b", "d"])
+        names.update({"a", "c", "e"}, {"d"})  # Rebuilt.
+        self.assertEqual(["a", "b", "c", "e"], names.names)
+        names = Names(map(str, range(100)))
+        names.update({"5a"}, {"50"})  # In place.
+        self.assertEqual(["5", "51", "52"], names.starting("5")[:3])
+        self.assertEqual(["58", "59", "5a"], names.starting("5")[-3:])
+
+    def test_inspect(self):
+        self.ns["_macro_"].twice = _twice
+        text = self.index.inspect("print: twice: 21", 9)
+        self.assertIn("Signature: twice(x)", text)
+        self.assertIn("Doubles x", text)
+        self.assertIn("Signature: os.path.join(a, *p)", self.index.inspect("os.path.join", 3))
+        self.assertIn("def let(", self.index.inspect("!let: x :be 1", 2, detail=1))
+        self.assertIn("def def_(", self.index.inspect("def: x", 1, detail=1))
+        self.assertIn("1", self.index.inspect("alpha", 5))
+        self.assertIsNone(self.index.inspect("nope", 2))
@@ -0,0 +1,78 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import time
+from concurrent.futures import CancelledError
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import TestCase, mock
+
+from hebi.codegen import AstCompiler
+from hebi.executor import Executor
+
+
+class TestExecutor(TestCase):
+    def setUp(self):
+        self.executor = Executor(AstCompiler(evaluate=False))
+
+    def tearDown(self):
+        self.executor.shutdown(timeout=5)
+        self.assertFalse(self.executor.thread.is_alive())
+
+    def run_cell(self, code):
+        with redirect_stdout(StringIO()) as out:
+            self.executor.run(code)
+        return out.getvalue()
+
+    def interrupted(self, code):
+        future = self.executor.submit(code)
+        time.sleep(0.2)
+        self.assertFalse(future.done())
+        self.executor.interrupt()
+        return future
+
+    def test_run(self):
+        self.assertEqual("", self.run_cell("def: x 20"))
+        self.assertEqual("42\n", self.run_cell("(x + 22)"))
+        with self.assertRaises(ZeroDivisionError):
+            self.executor.run("(1/0)")
+        self.assertEqual("1\n", self.run_cell("(1)"))
+
+    def test_await(self):
+        self.assertEqual("'done'\n", self.run_cell('await: asyncio..sleep: 0 "done"'))
+        self.assertEqual("", self.run_cell("await: asyncio..sleep: 0"))
+
+    def test_persistent_loop(self):
+        started = time.monotonic()
+        self.run_cell("def: task asyncio..create_task: asyncio..sleep: 0.3 1")
+        self.run_cell("def: other asyncio..create_task: asyncio..sleep: 0.3 2")
+        self.assertEqual("3\n", self.run_cell("def: a await: task\ndef: b await: other\n(a + b)"))
+        self.assertLess(time.monotonic() - started, 0.55)  # They overlapped.
+
+    def test_interrupt_running(self):
+        future = self.interrupted("for: i :in itertools..count:\n  (i)")
+        with self.assertRaises(KeyboardInterrupt):
+            future.result(timeout=5)
+        self.assertEqual("1\n", self.run_cell("(1)"))
+
+    def test_interrupt_withdrawn(self):
+        # As if the interrupt hadn't landed before the cell's code was done.
+        self.executor.compiler.ns["executor"] = self.executor
+        with mock.patch.object(self.executor, "_set_async_exc") as set_async_exc:
+            self.assertEqual("'done'\n", self.run_cell("executor.interrupt:\n'done'"))
+        set_async_exc.assert_called_once_with(KeyboardInterrupt)
+        self.assertFalse(self.executor._interrupting)
+        self.assertEqual("1\n", self.run_cell("(1)"))
+
+    def test_interrupt_awaiting(self):
+        self.run_cell("def: background asyncio..create_task: asyncio..sleep: 0.5 'kept'")
+        future = self.interrupted("await: asyncio..sleep: 100")
+        with self.assertRaises(CancelledError):
+            future.result(timeout=5)
+        self.assertEqual("'kept'\n", self.run_cell("await: background"))
+
+    def test_exit(self):
+        with self.assertRaises(SystemExit):
+            self.executor.run("exit: 3")
+        self.assertEqual("1\n", self.run_cell("(1)"))
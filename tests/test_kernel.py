@@ -0,0 +1,88 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import asyncio
+import os
+import signal
+import threading
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import TestCase, mock
+
+from hebi.kernel import HebigoKernel
+
+
+class TestKernel(TestCase):
+    def setUp(self):
+        self.kernel = HebigoKernel()
+        self.kernel.io_loop = mock.Mock()
+        self.kernel.send_response = mock.Mock()
+        self.addCleanup(self.kernel.executor.shutdown, 5)
+
+    def execute(self, code):
+        with redirect_stdout(StringIO()) as out:
+            reply = asyncio.run(self.kernel.do_execute(code, False))
+        self.assertEqual("ok", reply["status"])
+        return reply, out.getvalue()
+
+    def stderr(self):
+        return [
+            call.args[2]["text"]
+            for call in self.kernel.send_response.call_args_list
+            if call.args[1] == "stream" and call.args[2]["name"] == "stderr"
+        ]
+
+    def interrupted(self, code):
+        self.kernel.pre_handler_hook()
+        try:
+            threading.Timer(0.2, os.kill, (os.getpid(), signal.SIGINT)).start()
+            self.execute(code)
+        finally:
+            self.kernel.post_handler_hook()
+        [text] = self.stderr()
+        self.assertIn("KeyboardInterrupt", text)
+        self.assertEqual("1\n", self.execute("(1)")[1])
+
+    def test_interrupt_running(self):
+        self.interrupted("for: i :in itertools..count:\n  (i)")
+
+    def test_interrupt_awaiting(self):
+        self.interrupted("await: asyncio..sleep: 100")
+
+    def test_exit(self):
+        reply, _ = self.execute("exit: 3")
+        self.assertEqual([{"source": "ask_exit", "keepkernel": False}], reply["payload"])
+        self.kernel.io_loop.stop.assert_not_called()  # Not before the reply is sent.
+        (delay, callback), _ = self.kernel.io_loop.call_later.call_args
+        callback()
+        self.kernel.io_loop.stop.assert_called_once_with()
+        self.assertFalse(self.kernel.executor.thread.is_alive())
+
+    def test_complete_and_inspect(self):
+        self.execute("def: alphabet 'abc'\ndef: _macro_ types..SimpleNamespace:\ndef: _macro_.alpine: x")
+        reply = self.kernel.do_complete("print: alp", 10)
+        self.assertEqual(["alphabet", "alpine"], reply["matches"])
+        self.assertEqual((7, 10), (reply["cursor_start"], reply["cursor_end"]))
+        reply = self.kernel.do_inspect("print: alphabet", 9)
+        self.assertTrue(reply["found"])
+        self.assertIn("'abc'", reply["data"]["text/plain"])
+        self.assertFalse(self.kernel.do_inspect("nope", 2)["found"])
+
+    def test_update_while_tasks_run(self):
+        async def churn(ns):
+            while True:
+                for i in range(1000):
+                    ns[f"churn_{i}"] = i
+                for i in range(1000):
+                    del ns[f"churn_{i}"]
+                await asyncio.sleep(0)
+
+        self.kernel.compiler.ns["churn"] = churn
+        self.execute("def: task asyncio..create_task: churn: (globals())")
+        for _ in range(200):
+            self.kernel.index.update()
+        self.execute(".cancel: task")
+        self.kernel.index.update()
+        self.assertEqual([], self.kernel.do_complete("churn_", 6)["matches"])
+
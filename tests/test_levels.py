@@ -0,0 +1,148 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Differential tests: every optimization level must behave the same.
+"""
+
+import ast
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from types import ModuleType
+from unittest import TestCase
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from hebi.codegen import AstCompiler, module_code
+from hebi.parser import Compiler, lex, optimize_context, parse, qualify_context
+from hebi.peephole import Peephole
+
+LEVELS = 0, 1, 2
+MACRO = "hebi.basic.._macro_."
+NATIVE = Path(__file__).parent / "native_hebi_tests/test_native.hebi"
+
+
+def text_code(hebigo, qualname, filename, optimize=0):
+    with qualify_context(qualname), optimize_context(optimize):
+        peephole = Peephole() if optimize else None
+        python = Compiler(qualname, peephole=peephole).compile(parse(lex(hebigo)))
+    return compile(python, filename, "exec")
+
+
+def native_results(code):
+    module = ModuleType("tests.native_hebi_tests.test_native")
+    exec(code, vars(module))
+    tests = unittest.defaultTestLoader.loadTestsFromModule(module)
+    result = unittest.TestResult()
+    tests.run(result)
+    failed = {test.id() for test, _ in result.errors + result.failures}
+    return result.testsRun, failed
+
+
+def evaluate(form, level, compiler):
+    log = []
+
+    def record(x):
+        log.append(x)
+        return x
+
+    with optimize_context(level):
+        peephole = Peephole() if level else None
+        code = compiler(evaluate=False, peephole=peephole).form(form)
+    if compiler is AstCompiler:
+        code = compile(ast.Expression(code), "<test>", "eval")
+    try:
+        result = eval(code, {"log": record, "x": [0]})
+    except Exception as e:
+        result = type(e)
+    return result, log
+
+
+atoms = st.sampled_from(["0", "1", "()", "''", "'a'", "x", "None", ":k"])
+
+
+def extend(children):
+    bodies = st.lists(children, max_size=3)
+    return st.one_of(
+        st.tuples(st.just("log"), children),
+        st.lists(children, max_size=4).map(lambda a: (MACRO + "and_", *a)),
+        st.lists(children, max_size=4).map(lambda a: (MACRO + "or_", *a)),
+        st.lists(children, max_size=3).map(lambda a: (MACRO + "begin", *a)),
+        st.tuples(children).map(lambda a: (MACRO + "not_", *a)),
+        st.tuples(
+            children,
+            bodies,
+            st.lists(st.tuples(children, bodies), max_size=2),
+            st.none() | bodies,
+        ).map(_if),
+        children.map(_loop),
+        st.tuples(st.lists(children | st.just(".real"), max_size=3), children).map(
+            lambda a: (MACRO + "of", *a[0], a[1])
+        ),
+    )
+
+
+def _if(args):
+    condition, then, elifs, else_ = args
+    return (
+        MACRO + "if_",
+        condition,
+        (":then", *then),
+        *((":elif", c, *body) for c, body in elifs),
+        *(() if else_ is None else [(":else", *else_)]),
+    )
+
+
+def _loop(body):
+    return (
+        MACRO + "loop",
+        ("recur", "n", "2"),
+        (
+            MACRO + "if_",
+            "n",
+            (":then", body, ("recur", "(n - 1)")),
+            (":else", body),
+        ),
+    )
+
+
+forms = st.recursive(atoms, extend, max_leaves=12)
+
+
+class TestLevels(TestCase):
+    def test_native_tests(self):
+        source = NATIVE.read_text()
+        name = "tests.native_hebi_tests.test_native"
+        for compile_ in text_code, module_code:
+            results = []
+            for level in LEVELS:
+                with self.subTest(compile=compile_.__name__, level=level):
+                    with redirect_stdout(StringIO()):
+                        code = compile_(source, name, str(NATIVE), optimize=level)
+                    results.append(native_results(code))
+                    self.assertGreater(results[-1][0], 90)
+                    self.assertEqual(results[0], results[-1])
+            self.assertEqual(set(), results[0][1])
+
+    def test_native_expansions(self):
+        with optimize_context(2):
+            python = Compiler(evaluate=False).compile(
+                parse(lex("if: a :then: b :else: and: c d\n!loop: recur: n 1\n  n\n"
+                          "!of: 'key' 1 .attr .a.b obj"))
+            )
+        self.assertNotIn("_if_", python)
+        self.assertNotIn("_and_", python)
+        self.assertIn("_run_loop", python)
+        self.assertIn("getattr((obj),'a.b').attr[(1)][('key')]", python)
+
+    @settings(deadline=None, max_examples=300)
+    @given(forms)
+    def test_same_results(self, form):
+        for compiler in Compiler, AstCompiler:
+            reference = evaluate(form, 0, compiler)
+            for level in LEVELS[1:]:
+                self.assertEqual(reference, evaluate(form, level, compiler), level)
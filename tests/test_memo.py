@@ -0,0 +1,113 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from unittest import TestCase
+
+from hebi import bootstrap
+from hebi.memo import impure, pure
+from hebi.parser import MEMO, Compiler, lex, optimize_context, parse, qualify_context, reads
+from hebi.sourcemap import SourceMap
+
+CODE = """\
+import: types
+def: _macro_ types..SimpleNamespace:
+def: _macro_.twice: x
+  :@ hebi.memo..pure
+  ("(%s) * 2" % x)
+def: a twice: 21
+def: b twice: 21
+def: c twice: 21.0
+"""
+
+
+class TestPure(TestCase):
+    def setUp(self):
+        self.addCleanup(MEMO.reset, MEMO.set({}))  # As if compiling.
+        self.calls = []
+
+        @pure(maxsize=2)
+        def macro(*args):
+            self.calls.append(args)
+            return "expansion", *args
+
+        self.macro = macro
+
+    def test_hits(self):
+        self.assertEqual(self.macro("x", ("y", 1)), self.macro("x", ("y", 1)))
+        self.assertEqual([("x", ("y", 1))], self.calls)
+        self.assertEqual((1, 1, 2, 1), tuple(self.macro.cache_info()))
+
+    def test_identical_only(self):
+        for form in [1, True, 1.0, 0.0, -0.0, ("x", 1), ("x", True)]:
+            self.assertIs(type(form), type(self.macro(form)[1]))
+        self.assertEqual(7, self.macro.cache_info().misses)
+
+    def test_bounded(self):
+        for form in "abca":
+            self.macro(form)
+        self.assertEqual(["a", "b", "c", "a"], [args[0] for args in self.calls])
+        self.assertEqual(2, self.macro.cache_info().currsize)
+        self.macro.cache_clear()
+        self.assertEqual((0, 0, 2, 0), tuple(self.macro.cache_info()))
+
+    def test_uncached(self):
+        self.macro(["unhashable"])
+        self.macro(["unhashable"])
+        with qualify_context("one"):
+            self.macro("x")
+        with qualify_context("other"), optimize_context(1):
+            self.macro("x")
+        self.assertEqual(4, len(self.calls))
+        MEMO.set(None)  # Not compiling.
+        self.macro("x")
+        self.macro("x")
+        self.assertEqual(6, len(self.calls))
+
+    def test_impure(self):
+        @pure
+        def macro(x):
+            impure()
+            self.calls.append(x)
+            return x
+
+        macro("x")
+        macro("x")
+        self.assertEqual(["x", "x"], self.calls)
+
+
+class TestMemoizedExpansion(TestCase):
+    def test_declared(self):
+        with qualify_context("mod"):
+            compiler = Compiler("mod")
+            python = compiler.compile(reads(CODE))
+        ns = compiler.ns
+        self.assertEqual((42, 42, 42.0), (ns["a"], ns["b"], ns["c"]))
+        self.assertEqual(python.count("(21) * 2"), 2)
+        self.assertEqual((1, 2), tuple(ns["_macro_"].twice.cache_info())[:2])
+
+    def test_per_compilation(self):
+        with qualify_context("mod"):
+            compiler = Compiler("mod")
+            compiler.compile(reads(CODE))
+            compiler.compile(reads("def: d twice: 21\ndef: _macro_.other: x\n  x\ndef: e twice: 21\n"))
+        # A new compilation, and new names, start empty caches.
+        self.assertEqual((1, 4), tuple(compiler.ns["_macro_"].twice.cache_info())[:2])
+
+    def test_basic(self):
+        before = bootstrap.let.cache_info().hits
+        code = "def: f: x\n  !let: y :be (x+1)\n    y\n" * 2
+        with qualify_context("mod"):
+            Compiler("mod").compile(reads(code))
+        self.assertEqual(before + 1, bootstrap.let.cache_info().hits)
+
+    def test_source_map(self):
+        before = bootstrap.let.cache_info()
+        code = "!let: y :be 1\n  print: y\n" * 2
+        smap = SourceMap("m.hebi")
+        with qualify_context("mod"):
+            python = Compiler("mod", source_map=smap).compile(
+                parse(lex(code, smap.positions), source_map=smap)
+            )
+        self.assertEqual(before, bootstrap.let.cache_info())
+        self.assertIn("# m.hebi:4", python)  # Not the first occurrence's form.
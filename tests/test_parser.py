@@ -335,6 +335,27 @@ class TestParser(TestCase):
                 self.assertEqual(parsed, v)
                 print('OK')
 
+    def test_deep_nesting(self):
+        depth = 20_000
+        for code in ["f:" * depth + "x", "f: " * depth + "x"]:
+            with self.subTest(code=code[:8]):
+                [form] = parse(lex(code))
+                for _ in range(depth):
+                    head, form = form
+                    self.assertEqual("f", head)
+                self.assertEqual("x", form)
+
+    def test_compact(self):
+        for k, v in EXPECTED.items():
+            with self.subTest(code=k):
+                self.assertEqual(v, [*parse(lex(k), compact=True)])
+        code = "print: x 'y'\nif: a\n  print: x 'y'\n!loop: print: x 'y'"
+        one, two, three = parse(lex(code), compact=True)
+        self.assertIs(one, two[2])
+        self.assertIs(one, three[1])
+        self.assertIs(two[0], [*parse(lex("if: b"))][0][0])
+        self.assertIs(three[0], [*parse(lex("!loop: c"))][0][0])
+
     def test_bad_indent(self):
         for e in BAD_INDENTS:
             with self.subTest(example=e):
@@ -0,0 +1,79 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from types import SimpleNamespace
+from unittest import TestCase
+
+from hebi.parser import Compiler, reads
+from hebi.peephole import BEGIN, NOT, Peephole
+
+
+def compile_hebi(code, peephole=None):
+    return Compiler(evaluate=False, peephole=peephole).compile(reads(code))
+
+
+class TestPeephole(TestCase):
+    def setUp(self):
+        self.peephole = Peephole()
+
+    def test_begin_drops_constants(self):
+        self.assertEqual(self.peephole((BEGIN, "1", ":x", "foo")), "foo")
+        self.assertEqual(
+            self.peephole((BEGIN, ("print",), "2", "foo")), (BEGIN, ("print",), "foo")
+        )
+        self.assertEqual(self.peephole.stats["_begin"], 2)
+
+    def test_not_of_constant(self):
+        self.assertIs(self.peephole((NOT, "0")), True)
+        self.assertEqual(self.peephole((NOT, "'x'")), ())
+        self.assertEqual(self.peephole((NOT, "x")), (NOT, "x"))
+
+    def test_thunk_inlined(self):
+        self.assertEqual(self.peephole(((("lambda", (), "x"),),)[0]), "x")
+        self.assertEqual(
+            self.peephole((("lambda", (), ("f",), "x"),)), (BEGIN, ("f",), "x")
+        )
+
+    def test_scoped_thunk_kept(self):
+        form = (("lambda", (), ("super",)),)
+        self.assertIs(self.peephole(form), form)
+        self.assertFalse(self.peephole.stats)
+
+    def test_if_constant(self):
+        python = compile_hebi("if: True :then: print: 1\n  :else: print: 2", self.peephole)
+        self.assertEqual(eval(python.replace("print", "str")), "1")
+        self.assertNotIn("_if_", python)
+
+    def test_runtime_guard(self):
+        code = "!runtime: print: 1"
+        self.assertIn("<compiler>", compile_hebi(code, self.peephole))
+        self.assertTrue(self.peephole.guarded)
+        self.peephole.resolve_runtime = True
+        self.assertNotIn("<compiler>", compile_hebi(code, self.peephole))
+        self.assertEqual(self.peephole.stats["runtime"], 1)
+
+    def test_runtime_guard_evaluated_unresolved(self):
+        compiler = Compiler(evaluate=True, peephole=self.peephole)
+        python = compiler.compile(reads("!runtime: def: x 1\ndef: y 2"))
+        self.assertNotIn("x", compiler.ns)
+        self.assertNotIn("<compiler>", python)
+
+    def test_runtime_guard_expands_once(self):
+        compiler = Compiler(evaluate=True, peephole=self.peephole)
+        expanded = []
+        compiler.ns["_macro_"] = SimpleNamespace(note=lambda x: expanded.append(x) or x)
+        python = compiler.compile(reads("!begin: note: 1\n  !runtime: note: 2"))
+        self.assertEqual([1, 2], expanded)
+        self.assertNotIn("<compiler>", python)
+
+    def test_optimized_matches_reference(self):
+        code = """
+!begin: 1 2 not: 0
+  if: not: 1
+    :then: 3
+    :else: !begin0: 4 5
+"""
+        self.assertEqual(
+            eval(compile_hebi(code)), eval(compile_hebi(code, self.peephole))
+        )
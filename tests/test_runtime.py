@@ -0,0 +1,174 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import asyncio
+import inspect
+import subprocess
+import sys
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice, zip_longest
+from unittest import TestCase, mock
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from hebi import runtime
+from hebi.runtime import _await_, _loop, _sentinel, async_function, attrs, partition
+
+
+def imported_after(code):
+    """Names of the modules loaded by running code in a fresh interpreter."""
+    script = f"import sys; before = set(sys.modules)\n{code}\nprint(*set(sys.modules) - before)"
+    out = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+    return set(out.split())
+
+
+class TestRuntime(TestCase):
+    def test_runtime_has_no_compile_time_dependencies(self):
+        loaded = imported_after("import hebi.runtime")
+        self.assertNotIn("hissp", loaded)
+        self.assertNotIn("hebi.parser", loaded)
+        self.assertNotIn("hebi.bootstrap", loaded)
+
+    def test_macros_resolve_lazily(self):
+        loaded = imported_after("import hebi.basic")
+        self.assertNotIn("hebi.bootstrap", loaded)
+        loaded = imported_after("import hebi.basic; hebi.basic._macro_.if_")
+        self.assertIn("hebi.bootstrap", loaded)
+
+    def test_macro_namespace_is_complete(self):
+        from hebi import bootstrap
+        from hebi.basic import _macro_
+
+        self.assertIs(bootstrap.let, _macro_.let)
+        self.assertIs(bootstrap.of, vars(_macro_)["of"])
+        self.assertLessEqual({*_macro_.__all__}, {*dir(_macro_)})
+
+
+class TestLoop(TestCase):
+    def test_reentrant(self):
+        def body(recur, n, log):
+            if not n:
+                return log
+            step = recur(n - 1, log)
+            log.append(count(0, []))  # Re-enters after recur, before returning it.
+            return step
+
+        count = _loop(body)
+        self.assertEqual([[], [], []], count(3, []))
+
+    def test_outer_recur(self):
+        outer = _loop(
+            lambda recur, n, acc: acc
+            if not n
+            else _loop(lambda again, m: recur(n - 1, acc + m) if m else again(m - 1))(n)
+        )
+        self.assertEqual(6, outer(3, 0))
+
+    def test_threads(self):
+        total = _loop(lambda recur, n, acc=0: recur(n - 1, acc + n) if n else acc)
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(total, [2000 + i for i in range(64)]))
+        self.assertEqual([(2000 + i) * (2001 + i) // 2 for i in range(64)], results)
+
+
+class TestAttrs(TestCase):
+    DUNDERS = ["__class__", "__dict__", "__init__", "__doc__", "__module__", "__slots__", "__repr__"]
+
+    def test_dunders(self):
+        for mapping in {}, ChainMap():
+            ns = attrs(mapping)
+            for name in self.DUNDERS:
+                with self.subTest(name=name, mapping=type(mapping)):
+                    with self.assertRaises(AttributeError):
+                        getattr(ns, name)
+                    setattr(ns, name, name.upper())
+                    self.assertEqual(name.upper(), getattr(ns, name))
+                    delattr(ns, name)
+            self.assertEqual({}, mapping)
+            self.assertIsInstance(ns, attrs)
+            self.assertEqual(f"attrs({mapping!r})", repr(ns))
+
+    def test_missing(self):
+        ns = attrs({"present": 1})
+        self.assertEqual(1, ns.present)
+        with self.assertRaises(AttributeError):
+            ns.absent
+        with self.assertRaises(AttributeError):
+            del ns.absent
+        self.assertEqual({"present": 1}, ns())
+
+
+class TestAsyncFunction(TestCase):
+    def check(self):
+        def fn(x):
+            slept = yield from _await_(asyncio.sleep(0, x))
+            return slept * 2
+
+        fn = async_function("f", fn)
+        self.assertTrue(inspect.iscoroutinefunction(fn))
+        coroutine = fn(21)
+        self.assertTrue(inspect.iscoroutine(coroutine))
+        self.assertEqual(42, asyncio.run(coroutine))
+        self.assertEqual("f", fn.__name__)
+
+    def test_flagged(self):
+        self.check()
+
+    def test_wrapped(self):
+        with mock.patch.object(runtime, "_FLAGGABLE", False):
+            self.check()
+
+
+def reference_partition(items, n=2, step=None, fillvalue=_sentinel):
+    """The original multi-pass partition, which is right for sequences."""
+    step = step or n
+    slices = (islice(items, start, None, step) for start in range(n))
+    if fillvalue is _sentinel:
+        return zip(*slices)
+    return zip_longest(*slices, fillvalue=fillvalue)
+
+
+class TestPartition(TestCase):
+    @given(
+        st.lists(st.integers(), max_size=60),
+        st.integers(1, 12),
+        st.integers(1, 12),
+        st.sampled_from([_sentinel, None]),
+    )
+    def test_matches_reference(self, items, n, step, fillvalue):
+        expected = [*reference_partition(items, n, step, fillvalue)]
+        self.assertEqual(expected, [*partition(items, n, step, fillvalue)])
+        self.assertEqual(expected, [*partition(iter(items), n, step, fillvalue)])
+
+    def test_memoryview(self):
+        view = memoryview(b"abcdef")
+        self.assertEqual([(97, 98, 99), (100, 101, 102)], [*partition(view, 3)])
+        self.assertEqual([(97, 98), (99, 100), (101, 102)], [*partition(view, 2, 2)])
+        self.assertEqual([(97, 98), (98, 99)], [*partition(view[:3], 2, 1)])
+
+    def test_single_pass(self):
+        pulled = []
+
+        def lines():
+            for i in range(7):
+                pulled.append(i)
+                yield f"line {i}"
+
+        self.assertEqual(
+            [("line 0", "line 1", "line 2"), ("line 3", "line 4", "line 5")],
+            [*partition(lines(), 3)],
+        )
+        self.assertEqual([*range(7)], pulled)
+        pulled.clear()
+        self.assertEqual(3, len([*partition(lines(), 2, 1, fillvalue=None)][4:]))
+        self.assertEqual([*range(7)], pulled)
+
+    def test_infinite_window(self):
+        from itertools import count
+
+        self.assertEqual([(0, 1, 2), (2, 3, 4)], [*islice(partition(count(), 3, 2), 2)])
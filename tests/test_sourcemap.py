@@ -0,0 +1,130 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import ast
+import io
+import sys
+import tempfile
+import traceback
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import TestCase
+
+from hebi.parser import Compiler, lex, parse
+from hebi.profile import attribute, load, profile
+from hebi.sourcemap import SourceMap
+
+CODE = """\
+def: f: x
+  print: x
+  if: (x > 1)
+    :then: g:y
+    :else: foo: 1
+f: 3
+"""
+
+
+def compile_mapped(code, source="example.hebi"):
+    smap = SourceMap(source)
+    hissp = parse(lex(code, smap.positions), source_map=smap)
+    return Compiler("example", evaluate=False, source_map=smap).compile(hissp), smap
+
+
+class TestSourceMap(TestCase):
+    def test_positions(self):
+        positions = []
+        tokens = [*lex(CODE, positions)]
+        self.assertEqual(len(tokens), len(positions))
+        located = dict(zip(tokens, positions))
+        self.assertEqual((1, 0), located["multiary", "def"])
+        self.assertEqual((3, 6), located["python", "(x > 1)"])
+        self.assertEqual((4, 11), located["unary", "g"])
+        self.assertEqual([*lex(CODE)], tokens)
+
+    def test_located_forms(self):
+        smap = SourceMap("example.hebi")
+        [def_, call] = parse(lex(CODE, smap.positions), source_map=smap)
+        self.assertEqual((1, 0), smap.position(def_))
+        self.assertEqual((6, 0), smap.position(call))
+        if_ = def_[3]
+        self.assertEqual((3, 2), smap.position(if_))
+        self.assertEqual((3, 6), smap.position(if_[1]))  # Python injection.
+        self.assertEqual((4, 13), smap.position(if_[2][1]))  # g:y, by its argument.
+        self.assertIsNone(smap.position((*call,)))
+
+    def test_read(self):
+        python, smap = compile_mapped(CODE)
+        smap.read(python)
+        for number, text in enumerate(python.split("\n"), 1):
+            line, _ = smap.lines[number]
+            if text.strip().startswith("print("):
+                self.assertEqual(2, line)
+            elif text.strip().startswith("foo("):
+                self.assertEqual(5, line)
+            elif text.startswith("f("):
+                self.assertEqual(6, line)
+        self.assertEqual("hebi.basic.._macro_.def_", smap.macro(1))
+        self.assertEqual("hebi.basic.._macro_.if_", smap.macro(3))
+        self.assertIsNone(smap.macro(2))
+
+    def test_dump_load(self):
+        python, smap = compile_mapped(CODE)
+        file = io.StringIO()
+        smap.read(python).dump(file)
+        file.seek(0)
+        loaded = SourceMap.load(file)
+        self.assertEqual("example.hebi", loaded.source)
+        self.assertEqual(smap.lines, loaded.lines)
+
+    def test_traceback_lines(self):
+        code = "def: f: x\n  print: x\n  (1 / x)\nf: 0\n"
+        python, smap = compile_mapped(code)
+        tree = smap.read(python).remap(ast.parse(python))
+        try:
+            exec(compile(tree, "example.hebi", "exec"), {"print": lambda x: x})
+        except ZeroDivisionError:
+            frames = traceback.extract_tb(sys.exc_info()[2])[1:]
+        self.assertEqual([("example.hebi", 4), ("example.hebi", 3)],
+                         [(frame.filename, frame.lineno) for frame in frames])
+
+    def test_injected_lines(self):
+        code = "def: f: xs\n  !listcomp:\n    (1 / x)\n    :for x :in xs\n  'done'\nf: [0]\n"
+        python, smap = compile_mapped(code)
+        tree = smap.read(python).remap(ast.parse(python))
+        try:
+            exec(compile(tree, "example.hebi", "exec"))
+        except ZeroDivisionError:
+            frames = traceback.extract_tb(sys.exc_info()[2])[1:]
+        # Python 3.12 inlines the comprehension (PEP 709), so its frame may be gone.
+        self.assertEqual((6, 3), (frames[0].lineno, frames[-1].lineno))
+        self.assertEqual({"example.hebi"}, {frame.filename for frame in frames})
+
+
+class TestProfile(TestCase):
+    def test_profile(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp, "work.hebi")
+            path.write_text(
+                "def: work: n\n"
+                "  sum: range: n\n"
+                "if: (__name__ == '__main__')\n"
+                "  :then: work: 1_000_000\n"
+            )
+            code, smap = load(path)
+            self.assertEqual(str(path), code.co_filename)
+            stats, smap = profile(path)
+            own, calls, macros = attribute(stats, path, smap)
+        self.assertIn(1, own)  # The function body.
+        self.assertGreater(calls[1], 0)  # sum: and range:
+        self.assertIn("hebi.basic.._macro_.def_", macros)
+
+    def test_runs_once_as_main(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp, "main.hebi")
+            path.write_text("print: __name__ (locals() is globals())\n")
+            with redirect_stdout(io.StringIO()) as out:
+                load(path)
+                self.assertEqual("", out.getvalue())
+                profile(path)
+        self.assertEqual("__main__ True\n", out.getvalue())
@@ -0,0 +1,82 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from unittest import TestCase
+
+from hebi.watch import Watcher
+
+MACROS = """\
+import: types
+def: _macro_ types..SimpleNamespace:
+def: _macro_.scale: x
+  ("(%s) * {factor}" % x)
+"""
+
+
+class TestWatch(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.package = f"watched_{id(self)}"
+        self.root = Path(self.tmp.name, self.package)
+        self.root.mkdir()
+        (self.root / "__init__.py").write_text("")
+        self.write("macros", MACROS.format(factor=2))
+        self.write("app", f"def: answer {self.package}.macros.._macro_.scale: 21\n")
+        self.write("plain", "def: x 1\n")
+        sys.path.insert(0, self.tmp.name)
+        self.watcher = Watcher(self.root)
+        self.assertEqual(["app", "macros", "plain"], self.rebuild())
+
+    def tearDown(self):
+        sys.path.remove(self.tmp.name)
+        for name in [*sys.modules]:
+            if name.startswith(self.package):
+                del sys.modules[name]
+        self.tmp.cleanup()
+
+    def write(self, name, text):
+        path = self.root / f"{name}.hebi"
+        mtime = path.stat().st_mtime_ns + 10**9 if path.exists() else None
+        path.write_text(text)
+        if mtime:  # Don't depend on the clock's resolution.
+            os.utime(path, ns=(mtime, mtime))
+
+    def rebuild(self):
+        with redirect_stdout(StringIO()):
+            compiled = self.watcher.rebuild(self.watcher.scan())
+        return sorted(name.rpartition(".")[2] for name in compiled)
+
+    def test_depends(self):
+        self.assertEqual(
+            {self.package, f"{self.package}.macros"},
+            self.watcher.depends[f"{self.package}.app"],
+        )
+        self.assertEqual(set(), self.watcher.depends[f"{self.package}.plain"])
+        self.assertEqual([], self.rebuild())
+
+    def test_plain(self):
+        self.write("plain", "def: x 2\n")
+        self.assertEqual(["plain"], self.rebuild())
+
+    def test_macro(self):
+        self.write("macros", MACROS.format(factor=3))
+        self.assertEqual(["app", "macros"], self.rebuild())
+        self.assertIn("(21) * 3", (self.root / "app.py").read_text())
+
+    def test_failed(self):
+        self.write("macros", "def: _macro_.scale: x\n")  # No _macro_ namespace.
+        self.assertEqual([], self.rebuild())
+        self.assertEqual(
+            {f"{self.package}.app", f"{self.package}.macros"}, {*self.watcher.failed}
+        )
+        self.write("macros", MACROS.format(factor=4))
+        self.assertEqual(["app", "macros"], self.rebuild())
+        self.assertFalse(self.watcher.failed)
+        self.assertIn("(21) * 4", (self.root / "app.py").read_text())